@@ -1,18 +1,109 @@
+import math
+
 import numpy as np
+from scipy.special import gamma
 from scipy.stats import genextreme
 
 
-def fit_gev(series, design_limit, return_period=50):
+GEV_METHODS = ("mle", "lmom")
+EULER_GAMMA = 0.5772156649015329
+
+
+def gev_lmom(data):
+    """
+    L-모멘트 / PWM GEV 추정 (Hosking, 1985) — 닫힌 형태, 행 단위 벡터화
+    data: (n,) 또는 (m, n) — 각 행이 하나의 표본(블록 최대값 등)
+    반환: (shape, loc, scale) — scipy genextreme와 같은 부호 규약(shape = Hosking k)
+          1차원 입력이면 스칼라, 2차원이면 길이 m 배열. 표본 3개 미만/분산 0은 NaN
+    """
+    x = np.asarray(data, dtype=float)
+    one = x.ndim == 1
+    x = np.sort(np.atleast_2d(x), axis=1)
+    n = x.shape[1]
+
+    if n < 3:
+        nan = np.full(x.shape[0], np.nan)
+        return (float(nan[0]),) * 3 if one else (nan, nan.copy(), nan.copy())
+
+    j = np.arange(n, dtype=float)
+    w1 = j / (n - 1)
+    w2 = j * (j - 1) / ((n - 1) * (n - 2))
+
+    b0 = x.mean(axis=1)
+    b1 = x @ w1 / n
+    b2 = x @ w2 / n
+
+    l1 = b0
+    l2 = 2.0 * b1 - b0
+    l3 = 6.0 * b2 - 6.0 * b1 + b0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t3 = l3 / l2
+        c = 2.0 / (3.0 + t3) - math.log(2.0) / math.log(3.0)
+        k = 7.8590 * c + 2.9554 * c * c
+
+        small = np.abs(k) < 1e-6
+        ks = np.where(small, 1.0, k)
+        g = gamma(1.0 + ks)
+        scale = np.where(small, l2 / math.log(2.0), l2 * ks / ((1.0 - 2.0 ** (-ks)) * g))
+        loc = np.where(small, l1 - EULER_GAMMA * scale, l1 - scale * (1.0 - g) / ks)
+
+    bad = ~(l2 > 0) | ~np.isfinite(k) | ~(scale > 0)
+    k = np.where(bad, np.nan, k)
+    loc = np.where(bad, np.nan, loc)
+    scale = np.where(bad, np.nan, scale)
+
+    if one:
+        return float(k[0]), float(loc[0]), float(scale[0])
+    return k, loc, scale
+
+
+def _nll(series, shape, loc, scale):
+    if not (np.isfinite(shape) and np.isfinite(loc) and scale > 0):
+        return np.inf
+    with np.errstate(all="ignore"):
+        v = -np.sum(genextreme.logpdf(series, shape, loc, scale))
+    return v if np.isfinite(v) else np.inf
+
+
+def _fit_params(series, method="mle", warm_start=True):
+    """(shape, loc, scale, method_used)"""
+    method = str(method).lower()
+    if method not in GEV_METHODS:
+        raise ValueError(f"지원하지 않는 GEV 추정 방법: {method}")
+
+    lm = gev_lmom(series)
+    if method == "lmom":
+        return lm[0], lm[1], lm[2], "lmom"
+
+    start = np.isfinite(lm).all() if warm_start else False
+    try:
+        if start:
+            mle = genextreme.fit(series, lm[0], loc=lm[1], scale=lm[2])
+        else:
+            mle = genextreme.fit(series)
+    except Exception:
+        mle = (np.nan, np.nan, np.nan)
+
+    # 수치 MLE가 발산/악화되면 L-모멘트 해(초기값)를 사용
+    if warm_start and _nll(series, *lm) < _nll(series, *mle):
+        return lm[0], lm[1], lm[2], "lmom"
+    return float(mle[0]), float(mle[1]), float(mle[2]), "mle"
+
+
+def fit_gev(series, design_limit, return_period=50, method="mle", warm_start=True):
     """
     EVT (GEV) 분석
     - exceed_prob : 설계전류 초과 확률
     - return_level : N년 재현수준 (IEC 개념)
+    - method: "mle"(scipy 수치 최우추정) / "lmom"(L-모멘트 닫힌 형태)
+    - warm_start: MLE 초기값으로 L-모멘트 해 사용, MLE 우도가 더 나쁘면 L-모멘트 해 채택
     """
 
     series = np.asarray(series)
 
     # GEV fitting
-    shape, loc, scale = genextreme.fit(series)
+    shape, loc, scale, method_used = _fit_params(series, method, warm_start)
 
     # 설계 한계 초과 확률
     exceed_prob = 1.0 - genextreme.cdf(
@@ -33,5 +124,26 @@ def fit_gev(series, design_limit, return_period=50):
         "scale": scale,
         "exceed_prob": float(exceed_prob),
         "return_level": float(return_level),
-        "return_period": return_period
+        "return_period": return_period,
+        "method": method_used,
+    }
+
+
+def fit_gev_batch(data, design_limit, return_period=50):
+    """
+    여러 표본(2차원 배열의 각 행)을 L-모멘트로 한 번에 적합
+    design_limit: 스칼라 또는 행별 배열
+    반환 dict(길이 m 배열): shape / loc / scale / exceed_prob / return_level
+    """
+    shape, loc, scale = gev_lmom(np.atleast_2d(np.asarray(data, dtype=float)))
+    with np.errstate(invalid="ignore"):
+        exceed_prob = genextreme.sf(np.asarray(design_limit, dtype=float), shape, loc, scale)
+        return_level = genextreme.ppf(1.0 - 1.0 / return_period, shape, loc, scale)
+    return {
+        "shape": shape,
+        "loc": loc,
+        "scale": scale,
+        "exceed_prob": exceed_prob,
+        "return_level": return_level,
+        "return_period": return_period,
     }
@@ -0,0 +1,171 @@
+# analysis/evt_bootstrap.py
+"""
+GEV 초과확률 부트스트랩 신뢰구간
+
+- 재표본은 배치마다 (batch, n) 인덱스 행렬 한 번으로 추출
+- method="lmom": 배치 전체를 gev_lmom(행 단위 벡터화)으로 한 번에 적합
+- method="mle": 배치 단위로 프로세스 풀에 분배(fit_gev, L-모멘트 warm start), 풀 생성 실패 시 순차
+- 배치 b의 난수는 SeedSequence(seed).spawn()의 b번째 자식 → 방법/작업자 수와 무관하게 같은 재표본
+- 적응 정지: 신뢰구간 상·하한 변화가 연속 두 배치 동안 tol·max(상한, BOOT_EPS) 이하이면 n_boot 전에 종료
+  (상대 허용오차 — 작은 초과확률에서도 절대 1e-3 같은 기준에 바로 걸려 조기 종료되지 않음)
+- 재표본 모수는 기준선과 무관 → bootstrap_gev_params()로 한 번 뽑아 두고
+  bootstrap_ci_from_params()로 기준선마다 sf만 다시 계산(같은 seed면 bootstrap_gev_ci와 같은 재표본,
+  적합은 이미 끝났으므로 적응 정지 없이 n_boot개 전부로 CI)
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from scipy.stats import genextreme
+
+from analysis.evt_analysis import fit_gev, fit_gev_batch, gev_lmom
+
+
+BOOT_BATCH = 250
+BOOT_MIN = 500
+BOOT_TOL = 0.005
+BOOT_EPS = 1e-6
+BOOT_MIN_VALID = 20
+
+
+def _resample(x, seed_seq, size):
+    rng = np.random.default_rng(seed_seq)
+    return x[rng.integers(0, x.size, size=(size, x.size))]
+
+
+def _probs_lmom(x, design_limit, seed_seq, size):
+    return fit_gev_batch(_resample(x, seed_seq, size), design_limit)["exceed_prob"]
+
+
+def _probs_mle(args):
+    x, design_limit, seed_seq, size = args
+    out = np.full(size, np.nan)
+    for i, sample in enumerate(_resample(x, seed_seq, size)):
+        try:
+            out[i] = fit_gev(sample, design_limit, method="mle", warm_start=True)["exceed_prob"]
+        except Exception:
+            pass
+    return out
+
+
+def _batch_plan(n_boot, batch, seed):
+    batch = max(1, int(batch))
+    n_batches = max(1, -(-int(n_boot) // batch))
+    sizes = [min(batch, int(n_boot) - b * batch) for b in range(n_batches)]
+    return sizes, np.random.SeedSequence(int(seed)).spawn(n_batches)
+
+
+def _bounds(probs, alpha):
+    p = probs[np.isfinite(probs)]
+    if p.size < BOOT_MIN_VALID:
+        return None
+    p = np.clip(p, 0.0, 1.0)
+    lo, hi = np.quantile(p, [alpha / 2.0, 1.0 - alpha / 2.0])
+    return float(lo), float(hi), float(p.mean()), int(p.size)
+
+
+def _adaptive(prob_batches, out, alpha, tol, min_boot):
+    """배치별 초과확률을 누적하며 CI 갱신, 연속 두 배치 안정 시 정지 → out 채워 반환"""
+    chunks = []
+    prev = None
+    stable = 0
+    for probs in prob_batches:
+        chunks.append(probs)
+        out["n_drawn"] += probs.size
+        cur = _bounds(np.concatenate(chunks), alpha)
+        if cur is None or prev is None:
+            stable = 0
+        elif max(abs(cur[0] - prev[0]), abs(cur[1] - prev[1])) <= tol * max(cur[1], BOOT_EPS):
+            stable += 1
+        else:
+            stable = 0
+        prev = cur
+        if stable >= 2 and out["n_drawn"] >= min_boot:
+            out["converged"] = True
+            break
+
+    if prev is not None:
+        out["low"], out["high"], out["mean"], out["n_used"] = prev
+    return out
+
+
+def bootstrap_gev_ci(
+    series,
+    design_limit,
+    n_boot=2000,
+    method="lmom",
+    seed=2025,
+    alpha=0.05,
+    batch=BOOT_BATCH,
+    tol=BOOT_TOL,
+    min_boot=BOOT_MIN,
+    workers=None,
+):
+    """
+    반환 dict: low / high / mean / n_used(유효 재표본 수) / n_drawn / converged / method
+    표본이 8개 미만이거나 유효 재표본이 BOOT_MIN_VALID 미만이면 low/high/mean = None
+    """
+    x = np.asarray(series, dtype=float)
+    x = x[np.isfinite(x)]
+    out = {"low": None, "high": None, "mean": None, "n_used": 0, "n_drawn": 0, "converged": False, "method": method}
+    if x.size < 8:
+        return out
+
+    sizes, seeds = _batch_plan(n_boot, batch, seed)
+    n_batches = len(sizes)
+
+    if method == "lmom":
+        results = (_probs_lmom(x, design_limit, s, m) for s, m in zip(seeds, sizes))
+        pool = None
+    elif method == "mle":
+        try:
+            pool = ProcessPoolExecutor(max_workers=workers or min(n_batches, os.cpu_count() or 1))
+            results = pool.map(_probs_mle, [(x, design_limit, s, m) for s, m in zip(seeds, sizes)])
+        except (OSError, NotImplementedError, RuntimeError):
+            pool = None
+            results = (_probs_mle((x, design_limit, s, m)) for s, m in zip(seeds, sizes))
+    else:
+        raise ValueError(f"지원하지 않는 부트스트랩 적합 방법: {method}")
+
+    try:
+        return _adaptive(results, out, alpha, tol, min_boot)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def bootstrap_gev_params(series, n_boot=2000, seed=2025, batch=BOOT_BATCH):
+    """
+    L-모멘트 재표본 모수(기준선 무관 단계) — bootstrap_gev_ci(method="lmom")와 같은 재표본
+    반환 dict: shape / loc / scale (길이 n_boot 배열, 적합 실패 NaN) / batch / seed
+    표본이 8개 미만이면 None
+    """
+    x = np.asarray(series, dtype=float)
+    x = x[np.isfinite(x)]
+    if x.size < 8:
+        return None
+
+    sizes, seeds = _batch_plan(n_boot, batch, seed)
+    shape, loc, scale = gev_lmom(np.concatenate([_resample(x, s, m) for s, m in zip(seeds, sizes)]))
+    return {"shape": shape, "loc": loc, "scale": scale, "batch": max(1, int(batch)), "seed": int(seed)}
+
+
+def bootstrap_ci_from_params(params, design_limit, alpha=0.05):
+    """
+    캐시된 재표본 모수로 기준선별 CI (sf 한 번 + 분위수)
+    재표본은 이미 모두 적합돼 있으므로 적응 정지 없이 전부 사용(n_drawn = n_boot, converged=True)
+    반환 dict는 bootstrap_gev_ci와 같음
+    """
+    out = {"low": None, "high": None, "mean": None, "n_used": 0, "n_drawn": 0, "converged": False, "method": "lmom"}
+    if params is None:
+        return out
+
+    with np.errstate(invalid="ignore"):
+        probs = genextreme.sf(float(design_limit), params["shape"], params["loc"], params["scale"])
+    out["n_drawn"] = int(probs.size)
+    out["converged"] = True
+    cur = _bounds(probs, alpha)
+    if cur is not None:
+        out["low"], out["high"], out["mean"], out["n_used"] = cur
+    return out
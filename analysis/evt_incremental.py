@@ -0,0 +1,292 @@
+# analysis/evt_incremental.py
+"""
+설비별 연속 갱신 EVT(GEV) 모델 — 시계열이 늘어날 때 처음부터 다시 분석하지 않음
+
+- 원시 청크(update / update_from_store) → stream_pipeline.BlockMaxima로 완성된 블록 최대값만 누적
+- 새 블록이 생기면 직전 (shape, loc, scale)에서 뉴턴 반복으로 재적합
+    기울기는 해석식, 헤시안은 기울기 전진 차분 — 시작점이 최적점 근처라 보통 2~4회 반복
+    (scipy fit의 Nelder–Mead는 warm start여도 100회 이상 평가)
+    지지 밖/발산이면 evt_analysis._fit_params(L-모멘트 warm start)로 전체 재적합
+- 부트스트랩 CI는 method와 무관하게 L-모멘트 재표본(bootstrap_gev_params, 행 단위 벡터화)
+    mle 점추정 주변의 근사 구간 — 재표본마다 MLE 재적합은 블록 수만큼 비용이 커서 쓰지 않음
+    결과의 ci_method로 구분("lmom")
+- 파생값(exceed_prob, return_level, 부트스트랩 CI)은 마지막으로 계산한 시점의 모수 대비
+  max(|Δshape|, |Δloc|/scale, |Δscale|/scale) > tol 일 때만 다시 계산
+- max_blocks: 최근 블록만 유지(이동 창), None이면 전체
+"""
+import numpy as np
+from scipy.stats import genextreme
+
+from analysis.evt_analysis import GEV_METHODS, _fit_params, gev_lmom
+from analysis.evt_bootstrap import bootstrap_ci_from_params, bootstrap_gev_params
+from analysis.stream_pipeline import BlockMaxima
+from series_store import TS_PER_S
+
+
+EVT_PARAM_TOL = 1e-3
+NEWTON_MAX_ITER = 20
+NEWTON_TOL = 1e-9
+MIN_FIT_BLOCKS = 8
+
+
+def gev_nll_grad(x, shape, loc, scale):
+    """
+    GEV 음의 로그우도와 기울기 (scipy genextreme 부호 규약, shape = c)
+    t = 1 − c·z, z = (x − loc)/scale,  L = Σ [log σ + (1 − 1/c)·log t + t^(1/c)]
+    지지 밖(t ≤ 0)이거나 |c|가 0에 너무 가까우면 (inf, None)
+    """
+    c, mu, sigma = float(shape), float(loc), float(scale)
+    if not (sigma > 0 and abs(c) > 1e-8):
+        return np.inf, None
+    z = (x - mu) / sigma
+    t = 1.0 - c * z
+    if not np.all(t > 0):
+        return np.inf, None
+    a = 1.0 / c
+    u = np.log(t)
+    ta = np.exp(a * u)
+    nll = x.size * np.log(sigma) + np.sum((1.0 - a) * u + ta)
+
+    dt = ((1.0 - a) + a * ta) / t                 # ∂L/∂t
+    g_mu = np.sum(dt) * c / sigma
+    g_sigma = x.size / sigma + np.sum(dt * z) * c / sigma
+    g_c = -np.sum(dt * z) - np.sum(u * (ta - 1.0)) / (c * c)
+    return float(nll), np.array([g_c, g_mu, g_sigma])
+
+
+def refit_gev_newton(x, start, max_iter=NEWTON_MAX_ITER, tol=NEWTON_TOL):
+    """
+    start 근처 GEV 최우추정(뉴턴 + 백트래킹) → (shape, loc, scale, 반복 수), 실패 시 None
+    """
+    p = np.asarray(start, dtype=float)
+    f, g = gev_nll_grad(x, *p)
+    if g is None:
+        return None
+
+    for it in range(1, max_iter + 1):
+        h = np.array([1e-6, 1e-6 * p[2], 1e-6 * p[2]])
+        H = np.empty((3, 3))
+        for j in range(3):
+            q = p.copy()
+            q[j] += h[j]
+            _, gj = gev_nll_grad(x, *q)
+            if gj is None:
+                return None
+            H[:, j] = (gj - g) / h[j]
+        H = 0.5 * (H + H.T)
+        try:
+            step = np.linalg.solve(H, g)
+        except np.linalg.LinAlgError:
+            return None
+        if not (np.all(np.isfinite(step)) and g @ step > 0):
+            return None                            # 헤시안이 양정치가 아님 → 최적점 근처가 아님
+
+        lam = 1.0
+        while lam > 1e-4:
+            q = p - lam * step
+            fq, gq = gev_nll_grad(x, *q)
+            if gq is not None and fq <= f:
+                break
+            lam *= 0.5
+        else:
+            return None
+
+        done = (f - fq) <= tol * (1.0 + abs(f))
+        p, f, g = q, fq, gq
+        if done:
+            return float(p[0]), float(p[1]), float(p[2]), it
+    return None
+
+
+def param_shift(a, b):
+    """두 GEV 모수 (shape, loc, scale)의 차이 — max(|Δshape|, |Δloc|/scale, |Δscale|/scale)"""
+    scale = float(b[2])
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]) / scale, abs(a[2] - b[2]) / scale)
+
+
+class IncrementalGEV:
+    """
+    연속 갱신 GEV 모델
+    design_limit: 초과확률/CI 기준값(없으면 return_level만)
+    block_size / period: 표본 블록 또는 달력 블록(BlockMaxima 규약), 둘 다 없으면 ≈10 s 블록
+    n_boot: 부트스트랩 재표본 수(0이면 CI 생략)
+    """
+
+    def __init__(
+        self,
+        design_limit=None,
+        dt=1.0,
+        block_size=None,
+        period=None,
+        offset_s=0.0,
+        return_period=50,
+        method="mle",
+        tol=EVT_PARAM_TOL,
+        max_blocks=None,
+        n_boot=2000,
+        seed=2025,
+    ):
+        method = str(method).lower()
+        if method not in GEV_METHODS:
+            raise ValueError(f"지원하지 않는 GEV 추정 방법: {method}")
+        self.dt = float(dt) if dt and dt > 0 else 1.0
+        if block_size is None and period is None:
+            block_size = max(int(round(10.0 / self.dt)), 5)
+        self.design_limit = None if design_limit is None else float(design_limit)
+        self.return_period = return_period
+        self.method = method
+        self.tol = float(tol)
+        self.max_blocks = None if max_blocks is None else int(max_blocks)
+        self.n_boot = int(n_boot)
+        self.seed = int(seed)
+
+        self._blocks = BlockMaxima(block_size, period, offset_s)
+        self._buf = np.empty(1024)
+        self._n = 0
+        self.n_samples = 0
+        self.t_last_ms = None
+
+        self.params = None
+        self.method_used = None
+        self.n_warm = 0
+        self.n_full = 0
+        self.n_derived = 0
+        self._derived_at = None
+        self._boot = None
+        self.derived = None
+
+    @classmethod
+    def for_store(cls, store, design_limit=None, **kw):
+        """series_store 저장소 dt로 생성"""
+        return cls(design_limit, dt=store.dt or 1.0, **kw)
+
+    @property
+    def maxima(self):
+        return self._buf[:self._n]
+
+    # ---------- 입력 ----------
+    def update(self, x, t=None):
+        """원시 청크(값, 달력 블록이면 타임스탬프[epoch s]) → 파생값을 다시 계산했으면 True"""
+        x = np.asarray(x, dtype=float).reshape(-1)
+        if x.size == 0:
+            return False
+        self._blocks.update(x, t, self.n_samples)
+        self.n_samples += x.size
+        _, mx = self._blocks.drain()
+        return self.append_blocks(mx)
+
+    def update_from_store(self, store):
+        """저장소에서 마지막으로 읽은 시각 이후 표본만 읽어 갱신"""
+        t_start = None if self.t_last_ms is None else self.t_last_ms + 1
+        changed = False
+        for ts, val in store.refresh().window(t_start, None):
+            changed |= self.update(val, ts / TS_PER_S)
+            self.t_last_ms = int(ts[-1])
+        return changed
+
+    def append_blocks(self, maxima):
+        """완성된 블록 최대값 추가 → 재적합 → 파생값을 다시 계산했으면 True"""
+        mx = np.asarray(maxima, dtype=float).reshape(-1)
+        mx = mx[np.isfinite(mx)]
+        if mx.size == 0:
+            return False
+        need = self._n + mx.size
+        if need > self._buf.size:
+            buf = np.empty(max(need, 2 * self._buf.size))
+            buf[:self._n] = self._buf[:self._n]
+            self._buf = buf
+        self._buf[self._n:need] = mx
+        self._n = need
+        if self.max_blocks is not None and self._n > self.max_blocks:
+            drop = self._n - self.max_blocks
+            self._buf[:self.max_blocks] = self._buf[drop:self._n]
+            self._n = self.max_blocks
+
+        self._refit()
+        return self._derive()
+
+    def set_design_limit(self, design_limit):
+        """기준값만 변경: 캐시된 재표본 모수로 초과확률/CI만 다시 계산"""
+        self.design_limit = None if design_limit is None else float(design_limit)
+        if self.params is not None:
+            self._derive(force=True, resample=False)
+        return self.result()
+
+    # ---------- 적합 ----------
+    def _refit(self):
+        x = self.maxima
+        if x.size < MIN_FIT_BLOCKS:
+            self.params = None
+            return
+        if self.method == "lmom":
+            p = gev_lmom(x)
+            self.params, self.method_used = (p if np.isfinite(p).all() else None), "lmom"
+            return
+        if self.params is not None:
+            r = refit_gev_newton(x, self.params)
+            if r is not None:
+                self.params, self.method_used = r[:3], "mle"
+                self.n_warm += 1
+                return
+        shape, loc, scale, used = _fit_params(x, "mle", warm_start=True)
+        self.params = (shape, loc, scale) if np.isfinite([shape, loc, scale]).all() else None
+        self.method_used = used
+        self.n_full += 1
+
+    def _derive(self, force=False, resample=True):
+        if self.params is None:
+            return False
+        if not force and self._derived_at is not None and param_shift(self.params, self._derived_at) <= self.tol:
+            return False
+
+        c, loc, scale = self.params
+        out = {
+            "exceed_prob": None,
+            "return_level": float(genextreme.ppf(1.0 - 1.0 / self.return_period, c, loc, scale)),
+            "ci_low": None,
+            "ci_high": None,
+            "ci_n": 0,
+            "ci_method": None,
+        }
+        if resample:
+            self._boot = bootstrap_gev_params(self.maxima, self.n_boot, self.seed) if self.n_boot > 0 else None
+        if self.design_limit is not None:
+            p = float(genextreme.sf(self.design_limit, c, loc, scale))
+            out["exceed_prob"] = min(max(p, 0.0), 1.0)
+            if self._boot is not None:
+                ci = bootstrap_ci_from_params(self._boot, self.design_limit)
+                out["ci_low"], out["ci_high"], out["ci_n"] = ci["low"], ci["high"], ci["n_used"]
+                out["ci_method"] = ci["method"]
+
+        if resample:
+            self._derived_at = self.params
+        self.derived = out
+        self.n_derived += 1
+        return True
+
+    # ---------- 결과 ----------
+    def result(self):
+        """
+        반환 dict: shape / loc / scale / method / n_blocks / n_samples
+                  exceed_prob / return_level / return_period / ci_low / ci_high / ci_n
+                  ci_method(CI 추정량 "lmom" — method가 mle여도 CI는 L-모멘트 부트스트랩, CI 없으면 None)
+                  drift(파생값 계산 후 모수 이동량) / n_warm / n_full / n_derived
+        """
+        p = self.params if self.params is not None else (np.nan, np.nan, np.nan)
+        d = self.derived or {"exceed_prob": None, "return_level": np.nan, "ci_low": None, "ci_high": None, "ci_n": 0,
+                             "ci_method": None}
+        drift = param_shift(self.params, self._derived_at) if (self.params and self._derived_at) else None
+        return {
+            "shape": float(p[0]),
+            "loc": float(p[1]),
+            "scale": float(p[2]),
+            "method": self.method_used,
+            "n_blocks": int(self._n),
+            "n_samples": int(self.n_samples),
+            **d,
+            "return_period": self.return_period,
+            "drift": drift,
+            "n_warm": self.n_warm,
+            "n_full": self.n_full,
+            "n_derived": self.n_derived,
+        }
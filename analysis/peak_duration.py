@@ -1,22 +1,103 @@
+# analysis/peak_duration.py
+"""
+기준값 이상 지속(run) 분석
+
+- 단일 기준: 불리언 마스크 경계(np.diff) → 구간 시작/길이/피크
+- 다중 기준(duration-exceedance 곡선): 표본마다 "자신이 최솟값인 최대 구간 폭"을 구한 뒤
+  값 내림차순 정렬 한 번 + 누적 최댓값 → 모든 기준 X의 최대 지속시간, 합계 지속시간, 사건 수
+  (기준 X 이상 최대 연속 구간 = max{ 폭_i : x_i ≥ X })
+- NaN 표본은 기준 미만으로 취급(구간을 끊음)
+"""
 import numpy as np
 
 
+DURATION_CURVE_POINTS = 100
+
+
+def exceedance_runs(series, limit):
+    """
+    series ≥ limit 연속 구간
+    반환 dict: start(시작 표본 번호) / length(표본 수) / peak(구간 최댓값)
+    """
+    x = np.asarray(series, dtype=float).reshape(-1)
+    mask = np.zeros(x.size + 2, dtype=np.int8)
+    mask[1:-1] = x >= limit
+    edges = np.diff(mask)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)           # 구간 끝 다음 표본
+
+    if starts.size == 0:
+        return {"start": starts, "length": starts.copy(), "peak": np.empty(0)}
+
+    # 끝(ends)이 배열 끝일 수 있으므로 한 칸 덧붙여 [start, end) 구간 최댓값을 reduceat으로
+    xp = np.append(x, -np.inf)
+    peak = np.maximum.reduceat(xp, np.column_stack((starts, ends)).ravel())[::2]
+    return {"start": starts, "length": ends - starts, "peak": peak}
+
+
 def peak_duration_analysis(series, limit, dt=1.0):
-    durations = []
-    current = 0
+    """기준값 이상 연속 구간별 지속시간 [s] 배열"""
+    return exceedance_runs(series, limit)["length"] * float(dt)
+
+
+def _nearest_smaller(x, reverse=False):
+    """
+    각 표본의 직전(reverse=True면 직후) 더 작은 값 위치(없으면 −1 / n)
+    포인터 점프: p_i ← p_{p_i} (x_{p_i} ≥ x_i 동안) — 사이 값은 모두 x_i 이상 유지
+    """
+    if reverse:
+        return x.size - 1 - _nearest_smaller(x[::-1])[::-1]
+    n = x.size
+    p = np.arange(-1, n - 1)
+    active = np.arange(1, n)
+    while active.size:
+        pa = p[active]
+        move = x[pa] >= x[active]
+        active = active[move]
+        p[active] = p[pa[move]]
+        active = active[p[active] >= 0]
+    return p
+
+
+def duration_exceedance_curve(series, limits=None, dt=1.0, n=DURATION_CURVE_POINTS):
+    """
+    기준별 지속시간 곡선 (O(n log n), 정렬 한 번)
+    limits: 기준값 배열, 없으면 유효 표본 최솟값~최댓값 n점
+    반환 dict(기준별 배열): limits / max_duration_s / total_duration_s / n_runs
+    """
+    x = np.asarray(series, dtype=float).reshape(-1)
+    x = np.where(np.isnan(x), -np.inf, x)
+    dt = float(dt)
+
+    finite = x[np.isfinite(x)]
+    if limits is None:
+        limits = np.linspace(finite.min(), finite.max(), int(n)) if finite.size else np.empty(0)
+    X = np.asarray(limits, dtype=float)
+
+    if finite.size == 0:
+        z = np.zeros(X.shape)
+        return {"limits": X, "max_duration_s": z, "total_duration_s": z.copy(), "n_runs": z.astype(np.int64)}
+
+    width = _nearest_smaller(x, reverse=True) - _nearest_smaller(x) - 1
+
+    order = np.argsort(x)
+    xs = x[order]
+    best = np.maximum.accumulate(width[order][::-1])[::-1]       # 값 ≥ xs[j] 인 표본의 최대 폭
 
-    for v in series:
-        if v >= limit:
-            current += dt
-        else:
-            if current > 0:
-                durations.append(current)
-                current = 0
+    k = np.searchsorted(xs, X, side="left")                     # 기준 미만 표본 수
+    above = x.size - k
+    max_len = np.where(above > 0, best[np.minimum(k, x.size - 1)], 0)
 
-    if current > 0:
-        durations.append(current)
+    # 구간 수 = #{x_i ≥ X} − #{min(x_i, x_{i−1}) ≥ X}
+    pair = np.sort(np.minimum(x[1:], x[:-1]))
+    n_runs = above - (pair.size - np.searchsorted(pair, X, side="left"))
 
-    return np.array(durations)
+    return {
+        "limits": X,
+        "max_duration_s": max_len * dt,
+        "total_duration_s": above * dt,
+        "n_runs": n_runs,
+    }
 
 
 def duration_to_sentence(durations, limit_time):
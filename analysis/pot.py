@@ -0,0 +1,340 @@
+# analysis/pot.py
+"""
+POT(Peaks-over-threshold) / GPD 극값 분석 — 고해상도 장기 시계열용
+
+- 입력은 ndarray(np.memmap 포함) 또는 청크 iterable → 청크마다 임계값 초과 표본만 남김(한 번 순회)
+  10^8점 SCADA 이력도 초과분(수 %)만 메모리에 유지(기본 임계값 분위수도 청크 히스토그램으로 계산)
+- 디클러스터링(runs method): 초과 표본 사이 비초과가 run_length개 이상이면 다른 사건, 사건별 최댓값만 사용
+- GPD 적합: 초과량 y = peak − u,  scipy genpareto 부호 규약(shape ξ > 0 → 두꺼운 꼬리)
+    L-모멘트: ξ = 2 − λ1/λ2,  σ = λ1 (1 − ξ)
+    MLE: L-모멘트 해를 초기값으로, 우도가 더 나쁘면 L-모멘트 해 채택(evt_analysis.fit_gev와 동일 정책)
+- 임계값 안정성 스캔: 내림차순 정렬 + 누적합으로 임계값 n개의
+  평균초과함수(MRL)와 ξ, σ* = σ − ξu 를 한 번에 계산
+- 초과율: 사건 수 / 관측시간 → 기준값 초과 사건율 λ_L = λ_u · P(Y > L − u)
+    시간당 확률 1 − exp(−λ_L), 연간 확률 1 − exp(−λ_L · 8760)
+"""
+import numpy as np
+from scipy.stats import genpareto
+
+
+POT_CHUNK = 1 << 22
+POT_QUANTILE = 0.98
+RUN_GAP_S = 60.0
+POT_MIN_EXCEED = 30
+SCAN_POINTS = 100
+QUANTILE_BINS = 4096
+QUANTILE_KEEP = 1 << 20
+HOURS_PER_YEAR = 8760.0
+POT_METHODS = ("mle", "lmom")
+
+
+def _chunks(series, chunk):
+    if isinstance(series, np.ndarray):
+        flat = series.reshape(-1)
+        for i in range(0, flat.size, chunk):
+            yield flat[i:i + chunk]
+    else:
+        for c in series:
+            yield np.asarray(c).reshape(-1)
+
+
+def chunked_quantile(series, q, chunk=POT_CHUNK, bins=QUANTILE_BINS, keep=QUANTILE_KEEP):
+    """
+    ndarray(memmap 포함) 분위수를 청크 순회로 계산 — np.nanquantile(linear)과 같은 값, 전체 복사 없음
+    1회: 유효 표본 수·최솟값·최댓값 → 히스토그램으로 목표 순위(k, k+1)가 든 구간만 남기며 좁힘
+    → 구간 표본이 keep개 이하가 되면 그것만 모아 정렬(보통 3회 순회, 동일값 구간이면 바로 종료)
+    비유한값(NaN/inf)은 제외, 유효 표본이 없으면 NaN
+    """
+    def _finite():
+        for c in _chunks(series, int(chunk)):
+            c = np.asarray(c)
+            if c.dtype.kind != "f":
+                c = c.astype(float)
+            ok = np.isfinite(c)
+            yield c if ok.all() else c[ok]
+
+    n, lo, hi = 0, np.inf, -np.inf
+    for c in _finite():
+        if c.size:
+            n += c.size
+            lo, hi = min(lo, c.min()), max(hi, c.max())
+    if n == 0:
+        return np.nan
+
+    h = (n - 1) * float(q)
+    k = int(np.floor(h))
+    k2 = min(k + 1, n - 1)
+    frac = h - k
+
+    # 창 [a, b): 창 아래 표본 base개, 창 안 count개
+    a, b, base, count = lo, np.nextafter(hi, np.inf), 0, n
+    while count > keep:
+        try:
+            edges = np.histogram_bin_edges(np.empty(0), int(bins), range=(a, b))
+        except ValueError:
+            break                                   # 창이 ulp 수준으로 좁음 → 그대로 모음
+        counts = np.zeros(int(bins), dtype=np.int64)
+        w_lo, w_hi = np.inf, -np.inf
+        for c in _finite():
+            c = c[(c >= a) & (c < b)]
+            if c.size:
+                counts += np.histogram(c, int(bins), range=(a, b))[0]
+                w_lo, w_hi = min(w_lo, c.min()), max(w_hi, c.max())
+        if w_lo == w_hi:
+            return float(w_lo)
+        cum = base + np.cumsum(counts)
+        i0 = int(np.searchsorted(cum, k, side="right"))
+        i1 = int(np.searchsorted(cum, k2, side="right"))
+        base = int(cum[i0 - 1]) if i0 > 0 else base
+        count = int(cum[i1]) - base
+        a, b = max(edges[i0], w_lo), min(edges[i1 + 1], np.nextafter(w_hi, np.inf))
+
+    v = np.sort(np.concatenate([c[(c >= a) & (c < b)] for c in _finite()]).astype(float))
+    x0, x1 = v[k - base], v[k2 - base]
+    return float(x0 + frac * (x1 - x0))
+
+
+def stream_exceedances(series, threshold, chunk=POT_CHUNK):
+    """
+    청크 단위로 threshold 초과 표본만 추출
+    반환 dict: index(전역 표본 번호) / values / n_samples(전체) / n_valid(NaN 제외)
+    """
+    u = float(threshold)
+    idx, val = [], []
+    n = 0
+    n_valid = 0
+    for c in _chunks(series, int(chunk)):
+        c = np.asarray(c, dtype=float)
+        k = np.flatnonzero(c > u)
+        idx.append(k + n)
+        val.append(c[k])
+        n += c.size
+        n_valid += int(np.count_nonzero(~np.isnan(c)))
+    return {
+        "index": np.concatenate(idx) if idx else np.empty(0, dtype=np.int64),
+        "values": np.concatenate(val) if val else np.empty(0),
+        "n_samples": n,
+        "n_valid": n_valid,
+    }
+
+
+def decluster_runs(index, values, run_length):
+    """
+    runs 디클러스터링: 초과 표본 간 비초과 간격 ≥ run_length → 새 사건
+    반환 dict: peaks / peak_index / start / end (사건별 배열, 시작·끝은 표본 번호)
+    """
+    index = np.asarray(index, dtype=np.int64)
+    values = np.asarray(values, dtype=float)
+    if index.size == 0:
+        e = np.empty(0, dtype=np.int64)
+        return {"peaks": np.empty(0), "peak_index": e, "start": e, "end": e.copy()}
+
+    # 인접 초과 표본 i, j 사이 비초과 개수 = j − i − 1
+    new = np.diff(index) > int(run_length)
+    starts = np.concatenate(([0], np.flatnonzero(new) + 1))
+    ends = np.concatenate((starts[1:], [index.size])) - 1
+
+    cid = np.cumsum(np.concatenate(([False], new)))
+    order = np.lexsort((-values, cid))          # 사건별 최댓값이 각 사건의 첫 자리
+    first = order[starts]
+    return {
+        "peaks": values[first],
+        "peak_index": index[first],
+        "start": index[starts],
+        "end": index[ends],
+    }
+
+
+def gpd_lmom(excess):
+    """GPD L-모멘트 추정 (shape ξ, scale σ) — 표본 3개 미만/ξ ≥ 1/λ2 ≤ 0이면 NaN"""
+    y = np.sort(np.asarray(excess, dtype=float))
+    n = y.size
+    if n < 3:
+        return np.nan, np.nan
+    b0 = y.mean()
+    b1 = y @ (np.arange(n) / (n - 1)) / n
+    l1, l2 = b0, 2.0 * b1 - b0
+    if not l2 > 0:
+        return np.nan, np.nan
+    xi = 2.0 - l1 / l2
+    scale = l1 * (1.0 - xi)
+    if not (xi < 1.0 and scale > 0):
+        return np.nan, np.nan
+    return float(xi), float(scale)
+
+
+def _nll(excess, shape, scale):
+    if not (np.isfinite(shape) and scale > 0):
+        return np.inf
+    with np.errstate(all="ignore"):
+        v = -np.sum(genpareto.logpdf(excess, shape, 0.0, scale))
+    return v if np.isfinite(v) else np.inf
+
+
+def fit_gpd(excess, method="mle", warm_start=True):
+    """초과량 GPD 적합 → (shape, scale, method_used)"""
+    method = str(method).lower()
+    if method not in POT_METHODS:
+        raise ValueError(f"지원하지 않는 GPD 추정 방법: {method}")
+
+    y = np.asarray(excess, dtype=float)
+    lm = gpd_lmom(y)
+    if method == "lmom" or y.size < 3:
+        return lm[0], lm[1], "lmom"
+
+    start = np.isfinite(lm).all() if warm_start else False
+    try:
+        if start:
+            c, _, sc = genpareto.fit(y, lm[0], floc=0.0, scale=lm[1])
+        else:
+            c, _, sc = genpareto.fit(y, floc=0.0)
+    except Exception:
+        c, sc = np.nan, np.nan
+
+    if warm_start and _nll(y, *lm) < _nll(y, c, sc):
+        return lm[0], lm[1], "lmom"
+    return float(c), float(sc), "mle"
+
+
+def threshold_scan(values, thresholds=None, n=SCAN_POINTS, min_exceed=POT_MIN_EXCEED, z=1.96):
+    """
+    임계값 안정성 스캔(모든 초과 표본 기준, 한 번 정렬 + 누적합)
+    values: 가장 낮은 임계값 이상 표본(stream_exceedances()["values"] 등)
+    thresholds: 없으면 최솟값 ~ 초과(>) 표본이 min_exceed개 남는 가장 높은 값 사이 n점
+    반환 dict(임계값별 배열): thresholds / n_exceed / mean_excess / mean_excess_low / mean_excess_high
+                           / shape / scale / scale_star(σ − ξu) — 초과 표본 min_exceed 미만은 NaN
+    """
+    d = np.asarray(values, dtype=float)
+    d = np.sort(d[np.isfinite(d)])[::-1]
+    if thresholds is None:
+        if d.size == 0:
+            thresholds = np.empty(0)
+        else:
+            # 상위 m번째 값보다 작은 값 중 최댓값 → 그보다 큰 표본이 m개 이상(동률 포함)
+            top = d[min(max(int(min_exceed), 1), d.size) - 1]
+            below = d[d < top]
+            hi = below[0] if below.size else d[-1]
+            thresholds = np.linspace(d[-1], hi, int(n))
+    u = np.asarray(thresholds, dtype=float)
+
+    # 큰 값 누적합의 자릿수 손실 방지: 최솟값 기준으로 이동
+    shift = d[-1] if d.size else 0.0
+    ds = d - shift
+    us = u - shift
+    S1 = np.concatenate(([0.0], np.cumsum(ds)))
+    S2 = np.concatenate(([0.0], np.cumsum(ds * ds)))
+    R1 = np.concatenate(([0.0], np.cumsum(np.arange(d.size) * ds)))
+
+    # 내림차순 d에서 u 초과 개수
+    k = d.size - np.searchsorted(d[::-1], u, side="right")
+    ok = k >= max(int(min_exceed), 3)
+    m = np.where(ok, k, 3).astype(float)
+    ki = np.where(ok, k, 0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sum_y = S1[ki] - m * us
+        mean_y = sum_y / m
+        var_y = (S2[ki] - 2.0 * us * S1[ki] + m * us * us - m * mean_y * mean_y) / (m - 1.0)
+        half = z * np.sqrt(np.maximum(var_y, 0.0) / m)
+
+        # 오름차순 순위 j = m−1−r:  Σ j·y_j = (m−1)Σy − Σ r·y_r
+        sum_ry = R1[ki] - us * m * (m - 1.0) / 2.0
+        b1 = ((m - 1.0) * sum_y - sum_ry) / (m * (m - 1.0))
+        l2 = 2.0 * b1 - mean_y
+        xi = 2.0 - mean_y / l2
+        scale = mean_y * (1.0 - xi)
+        scale_star = scale - xi * u
+
+    nan = ~ok
+    bad = nan | ~(l2 > 0) | ~(scale > 0)
+    return {
+        "thresholds": u,
+        "n_exceed": k,
+        "mean_excess": np.where(nan, np.nan, mean_y),
+        "mean_excess_low": np.where(nan, np.nan, mean_y - half),
+        "mean_excess_high": np.where(nan, np.nan, mean_y + half),
+        "shape": np.where(bad, np.nan, xi),
+        "scale": np.where(bad, np.nan, scale),
+        "scale_star": np.where(bad, np.nan, scale_star),
+    }
+
+
+def pot_fit(
+    series,
+    threshold=None,
+    dt=1.0,
+    design_limit=None,
+    run_length=None,
+    return_period=50,
+    method="mle",
+    warm_start=True,
+    chunk=POT_CHUNK,
+):
+    """
+    POT/GPD 분석
+    series: 시계열 ndarray(memmap 가능) 또는 청크 iterable, 표본 간격 dt [s]
+    threshold: 없으면 POT_QUANTILE 분위수(ndarray 입력만 — chunked_quantile 청크 순회, iterable은 필수)
+    run_length: 디클러스터링 간격 [표본], 없으면 RUN_GAP_S / dt
+    design_limit: 주면 기준값 초과 사건율/확률 계산(임계값 이하면 below_threshold=True, 하한 추정)
+    반환 dict: threshold / shape / scale / method / n_samples / n_exceed / n_clusters
+              / rate_per_hour(임계값 초과 사건) / exceed_rate_per_hour / p_hour / p_year / below_threshold
+              / return_level(return_period년 재현수준) / return_period / peaks / peak_index
+    """
+    dt = float(dt) if dt and dt > 0 else 1.0
+    if threshold is None:
+        if not isinstance(series, np.ndarray):
+            raise ValueError("청크 입력은 threshold가 필요합니다")
+        threshold = chunked_quantile(series, POT_QUANTILE, chunk)
+    u = float(threshold)
+    if run_length is None:
+        run_length = max(1, int(round(RUN_GAP_S / dt)))
+
+    ex = stream_exceedances(series, u, chunk)
+    cl = decluster_runs(ex["index"], ex["values"], run_length)
+
+    peaks = cl["peaks"]
+    shape, scale, method_used = fit_gpd(peaks - u, method, warm_start)
+
+    hours = ex["n_valid"] * dt / 3600.0
+    rate = peaks.size / hours if hours > 0 else np.nan
+
+    out = {
+        "threshold": u,
+        "shape": shape,
+        "scale": scale,
+        "method": method_used,
+        "n_samples": ex["n_samples"],
+        "n_exceed": int(ex["values"].size),
+        "n_clusters": int(peaks.size),
+        "run_length": int(run_length),
+        "rate_per_hour": float(rate),
+        "exceed_rate_per_hour": None,
+        "p_hour": None,
+        "p_year": None,
+        "below_threshold": False,
+        "return_level": np.nan,
+        "return_period": return_period,
+        "peaks": peaks,
+        "peak_index": cl["peak_index"],
+    }
+
+    if np.isfinite(rate) and rate > 0 and np.isfinite(shape):
+        # 연 1/T 사건율이 되는 수준: P(Y > y) = 1 / (T · 8760 · λ_u)
+        q = 1.0 / (float(return_period) * HOURS_PER_YEAR * rate)
+        if q < 1.0:
+            out["return_level"] = float(u + genpareto.isf(q, shape, 0.0, scale))
+
+    if design_limit is not None and np.isfinite(rate):
+        L = float(design_limit)
+        if L > u:
+            cond = genpareto.sf(L - u, shape, 0.0, scale) if np.isfinite(shape) else np.nan
+        else:
+            # 임계값 아래 기준은 모델 밖 → 임계값 초과 사건율(하한)로 대체
+            cond = 1.0
+            out["below_threshold"] = True
+        lam = float(rate * cond)
+        out["exceed_rate_per_hour"] = lam
+        out["p_hour"] = float(-np.expm1(-lam))
+        out["p_year"] = float(-np.expm1(-lam * HOURS_PER_YEAR))
+
+    return out
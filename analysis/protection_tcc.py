@@ -1,21 +1,25 @@
 import numpy as np
 
+from calculations.tcc import DEFAULT_CURVE, trip_time
 
-def tcc_curve(I, pickup, TMS):
+
+def tcc_curve(I, pickup, TMS, curve=DEFAULT_CURVE):
     """
-    IEC Standard Inverse (SI) 곡선
-    I: 전류 배열
+    TCC 동작시간 (calculations.tcc.trip_time, 기본 IEC Standard Inverse)
+    I: 전류(스칼라/리스트/배열)
     pickup: 픽업전류
     TMS: Time Multiplier Setting
+    pickup 이하 전류는 inf
     """
-    return TMS * 0.14 / ((I / pickup) ** 0.02 - 1)
+    return trip_time(np.asarray(I, dtype=float), pickup, TMS, curve)
 
 
 def tcc_protection_margin(
     peak_current,
     peak_duration,
     pickup,
-    TMS
+    TMS,
+    curve=DEFAULT_CURVE
 ):
     """
     보호계전 여유도 계산
@@ -27,7 +31,8 @@ def tcc_protection_margin(
     t_trip = tcc_curve(
         np.array([peak_current]),
         pickup,
-        TMS
+        TMS,
+        curve
     )[0]
 
     if peak_duration >= t_trip:
@@ -1,4 +1,7 @@
 # analysis/risk_score.py
+import numpy as np
+
+
 def calculate_operation_risk(
     evt_prob: float,
     max_duration: float,
@@ -105,3 +108,139 @@ def operation_risk_level(total_score):
     if s >= 40:
         return "보통"
     return "낮음"
+
+
+# ---------- 배열 API (설비군/대시보드) ----------
+HARD_STATUS_CODES = ("PASS", "FAIL", "NEED_MORE")
+_HARD_TEXT = {"PASS": 0, "적합": 0, "규정 충족": 0, "FAIL": 1, "부적합": 1, "NEED_MORE": 2, "조건 미충족": 2}
+
+RISK_LEVELS = ("낮음", "보통", "높음", "매우 높음")        # 코드 0~3, −1 = 참고(비활성)
+RISK_LEVEL_EDGES = np.array([40.0, 60.0, 80.0])
+
+PROTECTION_NOTES = (
+    "TCC 여유 기반 점수 반영",
+    "설비 PASS가 아니므로 보호(TCC) 점수는 반영하지 않음",
+    "차단기 적합이 아니므로 보호(TCC) 점수는 반영하지 않음",
+    "TCC 계산 불가로 보호(TCC) 점수 N/A",
+)
+
+
+def encode_hard_status(values):
+    """hard_status(코드/텍스트) 배열 → HARD_STATUS_CODES 번호(int8, 알 수 없음 −1)"""
+    arr = np.asarray(values)
+    if arr.dtype.kind in "iu":
+        return arr.astype(np.int8)
+    uniq, inv = np.unique(arr.astype(str), return_inverse=True)
+    lut = np.array([_HARD_TEXT.get(u.strip().upper(), -1) for u in uniq], dtype=np.int8)
+    return lut[inv.reshape(arr.shape)]
+
+
+def _column(values, n, default):
+    """
+    스칼라/배열 → float 배열(길이 n)과 결측 마스크
+    calculate_operation_risk의 float() 변환과 동일: None/변환 불가 → 결측(default), NaN은 값으로 유지
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind in "biuf":
+        out = np.broadcast_to(arr.astype(float), (n,))
+        return out, np.zeros(n, dtype=bool)
+    arr = np.broadcast_to(arr.astype(object), (n,))
+    missing = np.equal(arr, None)
+    try:
+        out = np.where(missing, np.nan, arr).astype(float)
+    except (TypeError, ValueError):
+        out = np.empty(n)
+        for i, v in enumerate(arr):
+            try:
+                out[i] = float(v)
+            except Exception:
+                out[i] = np.nan
+                missing[i] = True
+    return np.where(missing, default, out), missing
+
+
+def _clamp_arr(x, lo, hi):
+    """_clamp와 동일(NaN → hi: min(hi, nan) = hi)"""
+    return np.where(np.isnan(x), hi, np.clip(x, lo, hi))
+
+
+def calculate_operation_risk_array(
+    evt_prob,
+    max_duration,
+    duration_limit,
+    tcc_margin,
+    breaker_ok,
+    hard_status,
+    is_demo=False,
+):
+    """
+    calculate_operation_risk의 열(column) 버전 — 인자는 스칼라 또는 같은 길이 배열
+    hard_status: 코드 번호(encode_hard_status) 또는 코드/텍스트 배열
+    반환 dict(배열):
+      evt_score / time_score / protection_score(N/A는 NaN) / total(DEMO는 NaN)
+      protection_code(PROTECTION_NOTES 번호) / level(RISK_LEVELS 번호, DEMO −1)
+    """
+    cols = [evt_prob, max_duration, duration_limit, tcc_margin, breaker_ok, hard_status, is_demo]
+    n = max(np.size(c) if c is not None else 1 for c in cols)
+
+    evt_p, _ = _column(evt_prob, n, 0.0)
+    evt_score = _clamp_arr(_clamp_arr(evt_p, 0.0, 1.0) * 40.0, 0.0, 40.0)
+
+    dur, _ = _column(max_duration, n, 0.0)
+    lim, _ = _column(duration_limit, n, 1.0)
+    lim = np.where(lim <= 0, 1.0, lim)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        time_score = _clamp_arr(dur / lim, 0.0, 1.0) * 40.0
+
+    codes = encode_hard_status(hard_status)
+    hard_pass = np.broadcast_to(codes == 0, (n,))
+    brk = np.asarray(breaker_ok)
+    brk = np.broadcast_to(brk.astype(object).astype(bool) if brk.dtype.kind in "OUS" else brk.astype(bool), (n,))
+    margin, no_margin = _column(tcc_margin, n, np.nan)
+
+    protection_code = np.where(~hard_pass, 1, np.where(~brk, 2, np.where(no_margin, 3, 0))).astype(np.int8)
+    protection_score = np.where(protection_code == 0, _clamp_arr(margin * 20.0, 0.0, 20.0), np.nan)
+
+    demo = np.broadcast_to(np.asarray(is_demo, dtype=bool), (n,))
+    total = np.clip(evt_score + time_score + np.nan_to_num(protection_score, nan=0.0), 0.0, 100.0)
+    total = np.where(demo, np.nan, total)
+
+    return {
+        "evt_score": evt_score,
+        "time_score": time_score,
+        "protection_score": protection_score,
+        "total": total,
+        "protection_code": protection_code,
+        "level": operation_risk_level_codes(total),
+    }
+
+
+def operation_risk_level_codes(total):
+    """총점 배열 → RISK_LEVELS 번호(int8), NaN(비활성) −1"""
+    s = np.asarray(total, dtype=float)
+    level = np.searchsorted(RISK_LEVEL_EDGES, s, side="right").astype(np.int8)
+    return np.where(np.isnan(s), np.int8(-1), level)
+
+
+def top_k_risk(total, k):
+    """
+    총점 상위 k개 위치(내림차순) — argpartition으로 O(n) 선택 후 k개만 정렬, NaN(비활성) 제외
+    """
+    s = np.asarray(total, dtype=float).reshape(-1)
+    idx = np.flatnonzero(~np.isnan(s))
+    k = min(int(k), idx.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    v = s[idx]
+    if k < idx.size:
+        part = np.argpartition(-v, k - 1)[:k]
+    else:
+        part = np.arange(idx.size)
+    return idx[part[np.argsort(-v[part], kind="stable")]]
+
+
+def top_percent_risk(total, percent):
+    """총점 상위 percent% 위치(내림차순), 비활성 제외 표본 수 기준"""
+    n_valid = int(np.count_nonzero(~np.isnan(np.asarray(total, dtype=float))))
+    k = int(np.ceil(n_valid * float(percent) / 100.0))
+    return top_k_risk(total, k)
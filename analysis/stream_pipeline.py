@@ -0,0 +1,257 @@
+# analysis/stream_pipeline.py
+"""
+메모리보다 큰 부하 시계열용 청크 스트리밍 분석
+
+청크 규약: 1차원 값 배열(등간격 dt) 또는 (타임스탬프[epoch s], 값) 튜플
+청크마다 누적기만 갱신하므로 메모리는 청크 크기 + 결과(블록 최대값, 임계값 초과 표본)만큼
+- BlockMaxima: 표본 수 블록(block_size) 또는 달력 블록(hour/day, 실제 타임스탬프)
+  블록 번호가 바뀌는 위치에서 np.fmax.reduceat, 청크 경계에 걸친 블록은 다음 청크와 병합
+- RunTracker: 기준값별 ≥ 연속 구간(peak_duration.exceedance_runs) + 청크 경계 이월
+- 기준값별 초과 표본 수(관측 초과율), POT 임계값 초과 표본(pot.decluster_runs 입력)
+"""
+import numpy as np
+
+from analysis.peak_duration import exceedance_runs
+from analysis.pot import decluster_runs
+
+
+STREAM_CHUNK = 1 << 20
+CALENDAR_BLOCKS = {"hour": 3600, "day": 86400}
+
+
+def iter_array_chunks(source, chunk=STREAM_CHUNK, t0=None, dt=1.0):
+    """
+    ndarray / np.memmap / .npy 경로 → 청크 generator
+    t0(epoch s)를 주면 (타임스탬프, 값) 튜플로 반환
+    """
+    arr = np.load(source, mmap_mode="r") if isinstance(source, str) else source
+    arr = arr.reshape(-1)
+    for i in range(0, arr.size, int(chunk)):
+        x = np.asarray(arr[i:i + int(chunk)], dtype=float)
+        if t0 is None:
+            yield x
+        else:
+            yield float(t0) + (i + np.arange(x.size)) * float(dt), x
+
+
+def iter_cursor_chunks(cursor, size=STREAM_CHUNK):
+    """DB 커서(SELECT ts_epoch, value ... ORDER BY ts) → (타임스탬프, 값) 청크 generator"""
+    while True:
+        rows = cursor.fetchmany(int(size))
+        if not rows:
+            return
+        a = np.asarray(rows, dtype=float)
+        yield a[:, 0], a[:, 1]
+
+
+class BlockMaxima:
+    """
+    블록 최대값 누적기
+    block_size: 표본 수 블록(끝의 미완성 블록은 버림 — 메모리 내 reshape 방식과 동일)
+    period: 달력 블록 길이 [s] 또는 "hour"/"day" (타임스탬프 필요, offset_s로 현지 자정 보정)
+    """
+
+    def __init__(self, block_size=None, period=None, offset_s=0.0):
+        if (block_size is None) == (period is None):
+            raise ValueError("block_size와 period 중 하나만 지정")
+        self.block_size = int(block_size) if block_size is not None else None
+        self.period = float(CALENDAR_BLOCKS.get(period, period)) if period is not None else None
+        self.offset_s = float(offset_s)
+        self._ids = []
+        self._max = []
+        self._pending = None        # (블록 번호, 최대값) — 다음 청크에서 이어질 수 있음
+
+    def update(self, x, t=None, start=0):
+        """x: 청크 값, t: 타임스탬프(달력 블록), start: 청크 첫 표본의 전역 번호(표본 블록)"""
+        if x.size == 0:
+            return
+        if self.period is not None:
+            if t is None:
+                raise ValueError("달력 블록은 타임스탬프 청크가 필요합니다")
+            bid = np.floor((np.asarray(t, dtype=float) + self.offset_s) / self.period).astype(np.int64)
+        else:
+            bid = (start + np.arange(x.size)) // self.block_size
+
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(bid)) + 1))
+        ids = bid[starts]
+        mx = np.fmax.reduceat(x, starts)
+
+        if self._pending is not None:
+            if ids[0] == self._pending[0]:
+                mx[0] = np.fmax(mx[0], self._pending[1])
+            else:
+                self._ids.append(np.array([self._pending[0]]))
+                self._max.append(np.array([self._pending[1]]))
+        self._ids.append(ids[:-1])
+        self._max.append(mx[:-1])
+        self._pending = (ids[-1], mx[-1])
+
+    def drain(self):
+        """지금까지 완성된 블록 (번호, 최대값)을 꺼내고 비움 — 이어지는 블록(pending)은 유지, NaN 블록 제외"""
+        ids = np.concatenate(self._ids) if self._ids else np.empty(0, dtype=np.int64)
+        mx = np.concatenate(self._max) if self._max else np.empty(0)
+        self._ids, self._max = [], []
+        ok = ~np.isnan(mx)
+        return ids[ok], mx[ok]
+
+    def result(self, n_samples=None):
+        """(블록 번호, 최대값) — 전부 NaN인 블록 제외"""
+        ids = list(self._ids)
+        mx = list(self._max)
+        if self._pending is not None:
+            complete = True
+            if self.block_size is not None and n_samples is not None:
+                complete = n_samples % self.block_size == 0
+            if complete:
+                ids.append(np.array([self._pending[0]]))
+                mx.append(np.array([self._pending[1]]))
+        ids = np.concatenate(ids) if ids else np.empty(0, dtype=np.int64)
+        mx = np.concatenate(mx) if mx else np.empty(0)
+        ok = ~np.isnan(mx)
+        return ids[ok], mx[ok]
+
+
+class RunTracker:
+    """기준값별 ≥ 연속 구간: 최대/합계 지속 표본 수, 구간 수 (청크 경계 이월)"""
+
+    def __init__(self, limits):
+        self.limits = np.atleast_1d(np.asarray(limits, dtype=float))
+        k = self.limits.size
+        self.carry = np.zeros(k, dtype=np.int64)
+        self.max_len = np.zeros(k, dtype=np.int64)
+        self.total = np.zeros(k, dtype=np.int64)
+        self.n_runs = np.zeros(k, dtype=np.int64)
+
+    def _close(self, j, lengths):
+        if lengths.size:
+            self.max_len[j] = max(self.max_len[j], int(lengths.max()))
+            self.total[j] += int(lengths.sum())
+            self.n_runs[j] += lengths.size
+
+    def update(self, x):
+        n = x.size
+        if n == 0:
+            return
+        for j, lim in enumerate(self.limits):
+            r = exceedance_runs(x, lim)
+            s, ln = r["start"], r["length"].copy()
+            if self.carry[j]:
+                if s.size and s[0] == 0:
+                    ln[0] += self.carry[j]
+                else:
+                    self._close(j, np.array([self.carry[j]]))
+            self.carry[j] = 0
+            if s.size and s[-1] + r["length"][-1] == n:
+                self.carry[j] = ln[-1]
+                ln = ln[:-1]
+            self._close(j, ln)
+
+    def finish(self):
+        for j in range(self.limits.size):
+            if self.carry[j]:
+                self._close(j, np.array([self.carry[j]]))
+                self.carry[j] = 0
+
+
+class StreamAnalysis:
+    """
+    청크 누적 분석기 — update()를 청크마다 호출, result()로 요약
+    baselines: 관측 초과율/지속시간 기준값들
+    block_size / block: 표본 블록 또는 달력 블록("hour"/"day"/초)
+    threshold: POT 임계값(주면 초과 표본 위치·값 보관)
+    """
+
+    def __init__(self, baselines=(), dt=1.0, block_size=None, block=None, threshold=None, offset_s=0.0):
+        self.dt = float(dt) if dt and dt > 0 else 1.0
+        self.limits = np.atleast_1d(np.asarray(baselines, dtype=float))
+        self.blocks = None
+        if block_size is not None or block is not None:
+            self.blocks = BlockMaxima(block_size, block, offset_s)
+        self.runs = RunTracker(self.limits)
+        self.exceed = np.zeros(self.limits.size, dtype=np.int64)
+        self.threshold = None if threshold is None else float(threshold)
+        self._pot_idx = []
+        self._pot_val = []
+        self.n_samples = 0
+        self.n_valid = 0
+        self.t_first = None
+        self.t_last = None
+
+    def update(self, chunk):
+        t = None
+        if isinstance(chunk, tuple):
+            t, x = chunk
+            t = np.asarray(t, dtype=float)
+        else:
+            x = chunk
+        x = np.asarray(x, dtype=float).reshape(-1)
+        if x.size == 0:
+            return self
+        if t is not None:
+            if self.t_first is None:
+                self.t_first = float(t[0])
+            self.t_last = float(t[-1])
+
+        start = self.n_samples
+        self.n_samples += x.size
+        self.n_valid += int(np.count_nonzero(~np.isnan(x)))
+
+        if self.blocks is not None:
+            self.blocks.update(x, t, start)
+        self.runs.update(x)
+        if self.limits.size:
+            self.exceed += np.count_nonzero(x[:, None] > self.limits, axis=0)
+        if self.threshold is not None:
+            k = np.flatnonzero(x > self.threshold)
+            self._pot_idx.append(k + start)
+            self._pot_val.append(x[k])
+        return self
+
+    def result(self, run_length=None):
+        """
+        반환 dict:
+          n_samples / n_valid / t_first / t_last
+          block_id / block_maxima (블록 지정 시)
+          limits / exceed_count / exceed_frac / max_duration_s / total_duration_s / n_runs
+          pot_index / pot_values / pot_peaks / pot_peak_index (threshold 지정 시, run_length 주면 디클러스터)
+        """
+        self.runs.finish()
+        out = {
+            "n_samples": self.n_samples,
+            "n_valid": self.n_valid,
+            "t_first": self.t_first,
+            "t_last": self.t_last,
+            "limits": self.limits,
+            "exceed_count": self.exceed.copy(),
+            "exceed_frac": self.exceed / self.n_samples if self.n_samples else np.zeros(self.limits.size),
+            "max_duration_s": self.runs.max_len * self.dt,
+            "total_duration_s": self.runs.total * self.dt,
+            "n_runs": self.runs.n_runs.copy(),
+        }
+        if self.blocks is not None:
+            out["block_id"], out["block_maxima"] = self.blocks.result(self.n_samples)
+        if self.threshold is not None:
+            idx = np.concatenate(self._pot_idx) if self._pot_idx else np.empty(0, dtype=np.int64)
+            val = np.concatenate(self._pot_val) if self._pot_val else np.empty(0)
+            out["pot_index"], out["pot_values"] = idx, val
+            if run_length is not None:
+                cl = decluster_runs(idx, val, run_length)
+                out["pot_peaks"], out["pot_peak_index"] = cl["peaks"], cl["peak_index"]
+        return out
+
+
+def analyze_stream(
+    chunks,
+    baselines=(),
+    dt=1.0,
+    block_size=None,
+    block=None,
+    threshold=None,
+    run_length=None,
+    offset_s=0.0,
+):
+    """청크 generator 한 번 순회 → StreamAnalysis.result()"""
+    acc = StreamAnalysis(baselines, dt, block_size, block, threshold, offset_s)
+    for chunk in chunks:
+        acc.update(chunk)
+    return acc.result(run_length)
@@ -0,0 +1,280 @@
+# batch_assess.py
+"""
+Hard Engineering 일괄 판정 (GUI 없이)
+
+사용 예:
+  python batch_assess.py --csv feeders.csv --out results.csv
+  python batch_assess.py --db --i-load 800 --workers 8
+  python batch_assess.py --db --save-relay   (피더 체인 전체 pickup/TMS 협조 선정 → assets.relay_*에 저장 → fleet_assess가 사용)
+
+입력 행은 InputWidget/CableWidget 키(V, S, Z, I_load, breaker, standard, cable_*)
+또는 assets 테이블 컬럼명(voltage_kv, transformer_kva, transformer_z_pct, ...)을 모두 허용한다.
+"""
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from calculations.assessment import run_assessment, safe_float
+from calculations.protection import optimize_tcc_settings, pickup_floor
+
+
+# assets 테이블 컬럼 → 엔진 입력 키
+ASSET_COLUMN_MAP = {
+    "voltage_kv": "V",
+    "transformer_kva": "S",
+    "transformer_z_pct": "Z",
+    "z_pct": "Z",
+    "breaker_icu_ka": "breaker",
+    "i_load": "I_load",
+    "load_current_a": "I_load",
+    "cable_install_method": "cable_install",
+    "ambient_temp_c": "cable_ambient",
+    "parallel_count": "cable_parallel",
+    "cable_s_mm2": "cable_section_mm2_input",
+    "cable_length": "cable_length_m",
+    "isc_local_a": "Isc_local_A",
+}
+
+CABLE_KEYS = (
+    "cable_mode",
+    "cable_table_profile",
+    "cable_material",
+    "cable_insulation",
+    "cable_install",
+    "cable_ambient",
+    "cable_parallel",
+    "cable_section_mm2_input",
+    "cable_length_m",
+)
+
+OUTPUT_COLUMNS = (
+    "row_id",
+    "equipment_status",
+    "breaker_result",
+    "cable_hard_status",
+    "thermal_status",
+    "In_A",
+    "Isc_A",
+    "protection_ratio",
+    "I_design",
+    "I_allow_hard",
+    "section_mm2_used",
+    "t_trip_est",
+    "t_clear_used",
+    "equipment_final_sub",
+)
+
+
+def _blank(v):
+    return v is None or (isinstance(v, str) and v.strip() == "")
+
+
+def _float_or_nan(x):
+    x = safe_float(x)
+    return float("nan") if x is None else x
+
+
+def normalize_row(row: dict, defaults: dict = None):
+    """
+    CSV/DB 한 행 → (data, cable_data)
+    - 빈 문자열은 None 처리
+    - cable_mode 미지정 시: 단면적이 있으면 MANUAL, 없으면 AUTO
+    """
+    merged = {}
+    for k, v in (defaults or {}).items():
+        if not _blank(v):
+            merged[k] = v
+    for k, v in dict(row).items():
+        if _blank(v):
+            continue
+        merged[ASSET_COLUMN_MAP.get(k, k)] = v
+
+    cable_data = {k: merged.pop(k) for k in CABLE_KEYS if k in merged}
+    if cable_data:
+        if "cable_mode" not in cable_data:
+            cable_data["cable_mode"] = "MANUAL" if "cable_section_mm2_input" in cable_data else "AUTO"
+        if "cable_parallel" in cable_data:
+            try:
+                cable_data["cable_parallel"] = int(float(cable_data["cable_parallel"]))
+            except Exception:
+                pass
+
+    return merged, cable_data
+
+
+def assess_row(item):
+    row_id, data, cable_data = item
+    try:
+        res = run_assessment(data, cable_data)
+    except Exception as e:
+        return {"row_id": row_id, "equipment_status": "ERROR", "equipment_final_sub": str(e)}
+
+    cable_hard = res.get("cable_hard") or {}
+    thermal = res.get("thermal") or {}
+    return {
+        "row_id": row_id,
+        "equipment_status": res["equipment_status"],
+        "breaker_result": res["breaker_result"],
+        "cable_hard_status": cable_hard.get("status"),
+        "thermal_status": thermal.get("status"),
+        "In_A": res["In_A"],
+        "Isc_A": res["Isc_A"],
+        "protection_ratio": res["protection_ratio"],
+        "I_design": res["I_design"],
+        "I_allow_hard": res["I_allow_hard"],
+        "section_mm2_used": cable_hard.get("section_mm2_used"),
+        "t_trip_est": res["t_trip_est"],
+        "t_clear_used": res["t_clear_used"],
+        "equipment_final_sub": res["equipment_final_sub"],
+        "breaker_pickup": res.get("breaker_pickup"),
+        "breaker_tms": res.get("breaker_tms"),
+        "breaker_curve": res.get("breaker_curve"),
+        "t_limit_s": res.get("t_limit_s"),
+        "pickup_min": _float_or_nan(pickup_floor(
+            res["In_A"] if res["In_A"] is not None else np.nan,
+            safe_float(data.get("I_load")) if data.get("I_load") is not None else np.nan,
+        )),
+        "upstream_asset_id": data.get("upstream_asset_id"),
+    }
+
+
+def read_csv_rows(path: str):
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            yield row.get("asset_id") or row.get("row_id") or i, row
+
+
+def read_asset_rows():
+    from db import get_conn
+
+    conn = get_conn()
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT * FROM assets ORDER BY asset_id")
+        for r in cur.fetchall():
+            row = dict(r)
+            yield row.get("asset_id"), row
+    finally:
+        conn.close()
+
+
+def run_batch(rows, defaults: dict = None, workers: int = None, chunksize: int = None):
+    """
+    rows: (row_id, row dict) iterable
+    반환: assess_row 결과 list (입력 순서 유지)
+    """
+    items = []
+    for row_id, row in rows:
+        data, cable_data = normalize_row(row, defaults)
+        items.append((row_id, data, cable_data))
+
+    if not items:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(items) < 64:
+        return [assess_row(it) for it in items]
+
+    if chunksize is None:
+        chunksize = max(1, len(items) // (workers * 8))
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(assess_row, items, chunksize=chunksize))
+
+
+def _feeder_upstream(row_ids, upstream_ids):
+    """upstream_asset_id → 상위 인덱스 배열(최상위·대상 밖 상위는 -1), 순환이면 ValueError"""
+    index = {str(r): i for i, r in enumerate(row_ids)}
+    upstream = np.array(
+        [-1 if u is None else index.get(str(int(float(u))), -1) for u in upstream_ids],
+        dtype=np.int64,
+    )
+    p = upstream.copy()
+    for _ in range(upstream.size):
+        live = p >= 0
+        if not live.any():
+            return upstream
+        p[live] = upstream[p[live]]
+    loop = [row_ids[i] for i in np.flatnonzero(p >= 0)]
+    raise ValueError(f"upstream_asset_id 순환: {loop[:10]}")
+
+
+def save_relay_settings(results):
+    """
+    --db 결과 → 피더 체인/트리 전체 pickup/TMS 선정(optimize_tcc_settings 한 번) → assets.relay_* 저장, 갱신 행 수
+    - 체인: assets.upstream_asset_id (없거나 대상 밖이면 최상위)
+    - 계전기별 pickup 하한(pickup_floor), 설치 위치 Isc, 케이블 단열 한계 t_limit_s (k·S/Isc)²
+    - 저장값은 최적화 결과 그대로(하위 협조 grading_ok, 단열 한계 thermal_ok)
+    """
+    from db_repo import update_asset_relay_settings
+
+    rows = [
+        r for r in results
+        if r.get("equipment_status") != "ERROR"
+        and r.get("Isc_A") is not None
+        and r.get("pickup_min") is not None and r["pickup_min"] > 0
+    ]
+    if not rows:
+        return 0
+    ids = [r["row_id"] for r in rows]
+    curves = [r["breaker_curve"] for r in rows]
+    out = optimize_tcc_settings(
+        _feeder_upstream(ids, [r.get("upstream_asset_id") for r in rows]),
+        [r["pickup_min"] for r in rows],
+        [r["Isc_A"] for r in rows],
+        t_limit_s=[_float_or_nan(r.get("t_limit_s")) for r in rows],
+        curve=curves,
+    )
+    return update_asset_relay_settings(ids, out, curves)
+
+
+def write_results(results, out):
+    w = csv.DictWriter(out, fieldnames=list(OUTPUT_COLUMNS), extrasaction="ignore")
+    w.writeheader()
+    for r in results:
+        w.writerow(r)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Hard Engineering 일괄 판정")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--csv", help="입력 CSV 경로")
+    src.add_argument("--db", action="store_true", help="assets 테이블 전체 평가")
+    ap.add_argument("--out", help="결과 CSV 경로(미지정 시 stdout)")
+    ap.add_argument("--workers", type=int, default=None, help="프로세스 수(기본: CPU 코어 수)")
+    ap.add_argument("--standard", default=None, help="행에 standard가 없을 때 기본값(KESC/IEC)")
+    ap.add_argument("--i-load", type=float, default=None, help="행에 I_load가 없을 때 기본 부하전류(A)")
+    ap.add_argument("--t-clear", type=float, default=None, help="행에 t_clear가 없을 때 기본 차단시간(s)")
+    ap.add_argument("--save-relay", action="store_true", help="(--db) 피더 체인 협조 pickup/TMS를 assets.relay_*에 저장")
+    args = ap.parse_args(argv)
+    if args.save_relay and not args.db:
+        ap.error("--save-relay는 --db와 함께 사용")
+
+    defaults = {"standard": args.standard, "I_load": args.i_load, "t_clear": args.t_clear}
+    rows = read_csv_rows(args.csv) if args.csv else read_asset_rows()
+
+    results = run_batch(rows, defaults=defaults, workers=args.workers)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8-sig", newline="") as f:
+            write_results(results, f)
+    else:
+        write_results(results, sys.stdout)
+
+    if args.save_relay:
+        print(f"계전기 정정값 저장: {save_relay_settings(results)}건", file=sys.stderr)
+
+    counts = {}
+    for r in results:
+        counts[r["equipment_status"]] = counts.get(r["equipment_status"], 0) + 1
+    summary = " / ".join(f"{k} {v}" for k, v in sorted(counts.items()))
+    print(f"완료: {len(results)}건 ({summary})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,399 @@
+# calculations/assessment.py
+"""
+Hard Engineering 판정 엔진 (Qt 비의존)
+
+ResultWidget.run_calculation의 계산 흐름을 그대로 옮긴 것:
+  rated_current → short_circuit_current → breaker_judgement
+  → auto_tcc_params → trip_time(calculations.tcc, t_clear 확정)
+  → cable_allowable_hard_op(케이블 길이 입력 시 말단 Isc·단락열 동시 선정)
+  → 선정 단면적의 단열 한계 (k·S/Isc)²를 t_limit_s로 pickup/TMS 재선정(바뀌면 케이블 재검토)
+  → thermal_adiabatic_check(송전단·말단 고장 중 큰 I·√t, 말단 미동작은 FAIL) → PASS/FAIL/NEED_MORE
+
+run_assessment()는 ResultWidget._last_results와 동일한 dict를 반환하므로
+GUI / 배치(batch_assess.py) / DetailResultWidget 모두 같은 결과를 공유한다.
+"""
+import math
+from collections.abc import Mapping
+
+import numpy as np
+
+from calculations.engineering import (
+    rated_current,
+    short_circuit_current,
+    breaker_judgement,
+    adiabatic_limit_s,
+    cable_allowable_hard_op,
+    thermal_adiabatic_check,
+)
+
+from calculations.protection import TMS_MIN, optimize_tcc_settings, pickup_floor
+from calculations.tcc import DEFAULT_CURVE, curve_code, trip_time
+
+
+DESIGN_MARGIN = 1.25
+DEMO_SEED = 2025
+
+
+def safe_float(x):
+    try:
+        return float(x)
+    except Exception:
+        return None
+
+
+def auto_tcc_params(In_A, I_load, Isc_A, t_limit_s=None, curve=DEFAULT_CURVE):
+    """
+    단일 계전기 pickup/TMS (calculations.protection.optimize_tcc_settings, 하위 계전기 없음)
+    - pickup 하한: calculations.protection.pickup_floor (1.25×In 또는 I_load, 과부하 시 1.10×I_load)
+    - 하한이 Isc 이상이면(검출 불가) 0.3×Isc, TMS 최소값
+    - t_limit_s(선택): 케이블 단열 한계 차단시간
+    """
+    pickup = float(pickup_floor(
+        In_A if In_A is not None else np.nan,
+        I_load if I_load is not None else np.nan,
+    ))
+    if not pickup > 0:
+        return None, None
+
+    try:
+        if Isc_A is not None and Isc_A > 0 and pickup >= Isc_A:
+            return float(Isc_A * 0.3), float(TMS_MIN)
+    except Exception:
+        pass
+
+    if Isc_A is None or not Isc_A > 0:
+        return float(pickup), float(TMS_MIN)
+
+    r = optimize_tcc_settings(
+        [-1], pickup, float(Isc_A),
+        t_limit_s=None if t_limit_s is None else float(t_limit_s),
+        curve=curve,
+    )
+    return float(r["pickup"][0]), float(r["tms"][0])
+
+
+def breaker_margin_grade(protection_ratio):
+    if protection_ratio is None:
+        return None, None
+    try:
+        r = float(protection_ratio)
+    except Exception:
+        return None, None
+
+    spare = r - 1.0
+    spare_pct = spare * 100.0
+    if spare < 0:
+        return "FAIL", spare_pct
+    if spare < 0.05:
+        return "위험(<5%)", spare_pct
+    if spare < 0.10:
+        return "경고(<10%)", spare_pct
+    if spare < 0.20:
+        return "주의(<20%)", spare_pct
+    return "충분", spare_pct
+
+
+def _tcc_timing(Isc_A, breaker_pickup, breaker_tms, breaker_curve, t_clear_input):
+    """
+    pickup/TMS → (t_trip_est, trip, t_clear_used, t_clear_policy)
+    trip: 말단 고장 TCC 재계산 입력 (pickup, tms, curve, t_floor), TCC 불가면 None
+    """
+    t_trip_est = None
+    tcc_available = True
+    try:
+        if breaker_pickup is None or breaker_tms is None or Isc_A is None:
+            tcc_available = False
+        else:
+            p = float(breaker_pickup)
+            tms = float(breaker_tms)
+            isc = float(Isc_A)
+            if p <= 0 or tms <= 0 or isc <= 0:
+                tcc_available = False
+            curve_code(breaker_curve)
+    except Exception:
+        tcc_available = False
+
+    if tcc_available:
+        try:
+            t_trip_est = float(trip_time(float(Isc_A), float(breaker_pickup), float(breaker_tms), breaker_curve))
+        except Exception:
+            t_trip_est = None
+        # pickup 이하(미동작)는 추정치 없음
+        if t_trip_est is not None and not math.isfinite(t_trip_est):
+            t_trip_est = None
+
+    # 말단 고장 차단시간은 말단 Isc에서 TCC로 다시 계산(입력 t_clear는 하한)
+    trip = (breaker_pickup, breaker_tms, breaker_curve, t_clear_input) if tcc_available else None
+
+    t_clear_used = None
+    t_clear_policy = "NONE"
+    if t_trip_est is not None and t_clear_input is not None:
+        t_clear_used = max(float(t_clear_input), float(t_trip_est))
+        t_clear_policy = "MAX(TCC,INPUT)"
+    elif t_trip_est is not None:
+        t_clear_used = float(t_trip_est)
+        t_clear_policy = "TCC_DEFAULT"
+    elif t_clear_input is not None:
+        t_clear_used = float(t_clear_input)
+        t_clear_policy = "INPUT_ONLY"
+
+    return t_trip_est, trip, t_clear_used, t_clear_policy
+
+
+def run_assessment(data: dict, cable_data: dict = None) -> dict:
+    """
+    data: InputWidget.calculate()가 만드는 dict (V/S/Z/I_load/breaker/standard/dt/t_clear)
+          Isc_local_A(선택): 모선 국부 단락전류 — 있으면 변압기 단독 Isc 대신 사용
+          breaker_curve(선택): TCC 곡선 이름(calculations.tcc.CURVES, 기본 IEC_SI — 미지원 이름은 기본값 + breaker_reason 안내)
+          asset_id(선택): 계측 시계열 설비 번호 — 결과에 그대로 실어 DetailResultWidget이 저장소 시계열 사용
+    cable_data: CableWidget.save()가 만드는 dict (cable_ 접두사), 없으면 케이블/열상승은 계산 불가
+    반환: ResultWidget._last_results와 동일한 구조 (+ breaker_reason)
+    """
+    merged = dict(data or {})
+    if isinstance(cable_data, dict) and cable_data:
+        merged.update(cable_data)
+
+    V = safe_float(merged.get("V"))
+    S_kVA = safe_float(merged.get("S"))
+    Zpct = safe_float(merged.get("Z"))
+    I_load = safe_float(merged.get("I_load"))
+    breaker_kA = safe_float(merged.get("breaker"))
+    standard = str(merged.get("standard") or "KESC").upper()
+
+    t_clear_input = merged.get("t_clear", None)
+    t_clear_input = safe_float(t_clear_input) if t_clear_input is not None else None
+
+    dt = safe_float(merged.get("dt", 1.0))
+    if dt is None or dt <= 0:
+        dt = 1.0
+
+    In_A = rated_current(V, S_kVA) if (V is not None and S_kVA is not None and V > 0) else None
+    Isc_A = (
+        short_circuit_current(V, S_kVA, Zpct)
+        if (V is not None and S_kVA is not None and Zpct is not None and V > 0 and Zpct > 0)
+        else None
+    )
+
+    # 네트워크 해석(calculations.network)으로 구한 모선 국부 단락전류가 있으면 우선 사용
+    Isc_local = safe_float(merged.get("Isc_local_A")) if merged.get("Isc_local_A") is not None else None
+    if Isc_local is not None and Isc_local > 0:
+        Isc_A = Isc_local
+
+    # ---- 차단기
+    breaker_result = "판정 불가"
+    breaker_reason = "입력 누락으로 계산 불가"
+    protection_ratio = None
+    breaker_margin = None
+    breaker_margin_pct = None
+
+    if Isc_A is not None and breaker_kA is not None:
+        breaker_result = breaker_judgement(Isc_A, breaker_kA, standard)
+        Icu_A = breaker_kA * 1000.0
+        protection_ratio = (Icu_A / Isc_A) if Isc_A > 0 else None
+
+        margin = 1.1 if standard == "IEC" else 1.0
+        required_A = Isc_A * margin
+
+        if Icu_A >= required_A:
+            spare = (Icu_A / required_A) - 1.0
+            breaker_reason = (
+                f"Icu {breaker_kA:,.1f} kA ≥ Isc {Isc_A/1000.0:,.1f} kA "
+                f"(계수 {margin:.2f}, 여유 {spare*100.0:,.1f}%)"
+            )
+        else:
+            lack = 1.0 - (Icu_A / required_A)
+            breaker_reason = (
+                f"Icu {breaker_kA:,.1f} kA < Isc {Isc_A/1000.0:,.1f} kA "
+                f"(계수 {margin:.2f}, 부족 {lack*100.0:,.1f}%)"
+            )
+
+        breaker_margin, breaker_margin_pct = breaker_margin_grade(protection_ratio)
+
+    # ---- TCC 추정 차단시간
+    # 지원하지 않는 곡선 이름은 기본 곡선으로 대체하고 그 곡선으로 선정·차단시간·결과 표시를 모두 통일
+    breaker_curve = str(merged.get("breaker_curve") or DEFAULT_CURVE).upper()
+    try:
+        curve_code(breaker_curve)
+    except ValueError:
+        breaker_reason += f" / TCC 곡선 '{breaker_curve}' 미지원 → {DEFAULT_CURVE} 적용"
+        breaker_curve = DEFAULT_CURVE
+    breaker_pickup, breaker_tms = auto_tcc_params(In_A, I_load, Isc_A, curve=breaker_curve)
+
+    t_trip_est, trip, t_clear_used, t_clear_policy = _tcc_timing(
+        Isc_A, breaker_pickup, breaker_tms, breaker_curve, t_clear_input
+    )
+
+    # ---- 케이블(Hard 30℃ / 운영온도)
+    design_margin = DESIGN_MARGIN
+    I_design_calc = None
+    if I_load is not None and I_load > 0:
+        I_design_calc = float(I_load) * float(design_margin)
+
+    cable_mode = merged.get("cable_mode") or merged.get("mode")
+    table_profile = merged.get("cable_table_profile") or merged.get("table_profile")
+
+    if str(standard).upper() == "KESC":
+        table_profile = "KESC_DEFAULT"
+
+    cable_material = merged.get("cable_material") or merged.get("material")
+    cable_insulation = merged.get("cable_insulation") or merged.get("insulation")
+    cable_install = merged.get("cable_install") or merged.get("install")
+    cable_parallel = merged.get("cable_parallel") or merged.get("parallel")
+    cable_section_in = merged.get("cable_section_mm2_input") or merged.get("section_mm2_input")
+    cable_ambient = merged.get("cable_ambient") or merged.get("ambient")
+    cable_length_m = safe_float(merged.get("cable_length_m")) if merged.get("cable_length_m") is not None else None
+
+    ambient_op = safe_float(merged.get("ambient_op")) if merged.get("ambient_op") is not None else None
+    if ambient_op is None and cable_ambient is not None:
+        ambient_op = safe_float(cable_ambient)
+
+    has_cable_input = isinstance(cable_data, dict) and bool(cable_data)
+
+    def _cable(t_clear_s, trip):
+        return cable_allowable_hard_op(
+            I_load=I_load if I_load is not None else 0.0,
+            material=cable_material,
+            insulation=cable_insulation,
+            install=cable_install,
+            parallel=cable_parallel,
+            mode=cable_mode or "AUTO",
+            section_mm2_input=cable_section_in,
+            ambient_op=ambient_op,
+            standard=standard,
+            table_profile=table_profile,
+            design_margin=design_margin,
+            length_m=cable_length_m,
+            Isc_A=Isc_A,
+            t_clear_s=t_clear_s,
+            V_kV=V,
+            trip=trip,
+        )
+
+    t_limit_s = None
+    if not has_cable_input:
+        cable_hard = {"status": "계산 불가", "reason": "입력 누락으로 계산 불가: 케이블 조건 미입력"}
+        cable_op = {"status": "평가 불가", "reason": "운영 조건 평가 불가: 케이블 조건 미입력"}
+    else:
+        cable_hard, cable_op = _cable(t_clear_used, trip)
+
+        # 케이블 단면적이 정해지면 단열 한계 (k·S/Isc)²를 조건으로 pickup/TMS 재선정,
+        # 설정이 바뀌면 그 차단시간으로 케이블을 한 번 더 검토
+        S_sel = cable_hard.get("section_mm2_used", None) if isinstance(cable_hard, Mapping) else None
+        if S_sel is not None and Isc_A is not None and Isc_A > 0:
+            t_lim = float(adiabatic_limit_s(Isc_A, S_sel, cable_material, cable_insulation))
+            if math.isfinite(t_lim):
+                t_limit_s = t_lim
+                p2, tms2 = auto_tcc_params(In_A, I_load, Isc_A, t_limit_s=t_limit_s, curve=breaker_curve)
+                if (p2, tms2) != (breaker_pickup, breaker_tms):
+                    breaker_pickup, breaker_tms = p2, tms2
+                    t_trip_est, trip, t_clear_used, t_clear_policy = _tcc_timing(
+                        Isc_A, breaker_pickup, breaker_tms, breaker_curve, t_clear_input
+                    )
+                    cable_hard, cable_op = _cable(t_clear_used, trip)
+
+    hard_status = cable_hard.get("status", "계산 불가")
+    hard_I_allow = cable_hard.get("I_allow_total", None)
+
+    I_design = cable_hard.get("I_design", None)
+    if I_design is None:
+        I_design = I_design_calc
+
+    # ---- 단락열(단열식)
+    section_used = cable_hard.get("section_mm2_used", None) if isinstance(cable_hard, Mapping) else None
+    # 케이블 길이가 있으면 송전단(t_used)·말단(말단 Isc의 TCC 시간) 중 큰 I·√t로 검토(자동선정과 같은 조건)
+    Isc_end_A = cable_hard.get("Isc_end_A", None) if isinstance(cable_hard, Mapping) else None
+    t_clear_end = None
+    if Isc_end_A is not None and t_clear_used is not None:
+        t_clear_end = t_clear_used
+        if trip is not None:
+            t_clear_end = float(trip_time(float(Isc_end_A), float(breaker_pickup), float(breaker_tms), breaker_curve))
+            if t_clear_input is not None:
+                t_clear_end = max(float(t_clear_input), t_clear_end)
+    thermal = thermal_adiabatic_check(
+        I_sc_A=Isc_A,
+        t_clear_s=t_clear_used,
+        section_mm2_used=section_used,
+        material=cable_material,
+        insulation=cable_insulation,
+        standard=standard,
+        t_clear_input=t_clear_input,
+        t_trip_est=t_trip_est,
+        t_clear_policy=t_clear_policy,
+        I_end_A=Isc_end_A,
+        t_end_s=t_clear_end,
+    )
+    thermal_status = thermal.get("status", "계산 불가")
+
+    # ---- 최종 판정
+    breaker_ok = (breaker_result == "적합")
+    breaker_na = (breaker_result == "판정 불가")
+    cable_fail = (hard_status == "부적합")
+    thermal_fail = (thermal_status == "부적합")
+    cable_na = (hard_status == "계산 불가")
+    thermal_na = (thermal_status == "계산 불가")
+
+    if (not breaker_ok) and (not breaker_na):
+        equipment_status = "FAIL"
+        equipment_final_line = "규정 판정(Hard Engineering): FAIL"
+        equipment_final_sub = "차단기 차단용량(Icu) 기준 미달"
+    elif cable_fail or thermal_fail:
+        equipment_status = "FAIL"
+        equipment_final_line = "규정 판정(Hard Engineering): FAIL"
+        reasons = []
+        if cable_fail:
+            reasons.append("케이블 허용전류 기준 미달")
+        if thermal_fail:
+            reasons.append("단락열(단열식) 기준 미달")
+        equipment_final_sub = " / ".join(reasons) if reasons else "규정 기준 미달 항목 존재"
+    else:
+        if breaker_na or cable_na or thermal_na:
+            equipment_status = "NEED_MORE"
+            equipment_final_line = "규정 판정(Hard Engineering): NEED_MORE"
+            need = []
+            if breaker_na:
+                need.append("차단기/단락 입력")
+            if cable_na:
+                need.append("케이블 조건")
+            if thermal_na:
+                need.append("차단시간(t_clear) 또는 TCC 추정치")
+            equipment_final_sub = "추가 입력 후 재평가 필요: " + (", ".join(need) if need else "-")
+        else:
+            equipment_status = "PASS"
+            equipment_final_line = "규정 판정(Hard Engineering): PASS"
+            equipment_final_sub = "차단기/케이블/열상승 항목이 기준을 충족"
+
+    return {
+        "asset_id": merged.get("asset_id"),
+        "dt": dt,
+        "limit_current": I_load,
+        "I_load": I_load,
+        "design_margin": design_margin,
+        "I_design": I_design,
+        "I_allow_hard": hard_I_allow,
+        "t_clear_input": t_clear_input,
+        "t_trip_est": t_trip_est,
+        "t_clear_used": t_clear_used,
+        "t_clear_policy": t_clear_policy,
+        "t_clear_end": t_clear_end,
+        "Isc_A": Isc_A,
+        "Isc_end_A": Isc_end_A,
+        "cable_length_m": cable_length_m,
+        "In_A": In_A,
+        "breaker_result": breaker_result,
+        "breaker_reason": breaker_reason,
+        "protection_ratio": protection_ratio,
+        "breaker_margin_grade": breaker_margin,
+        "breaker_margin_pct": breaker_margin_pct,
+        "equipment_status": equipment_status,
+        "equipment_final_line": equipment_final_line,
+        "equipment_final_sub": equipment_final_sub,
+        "cable_hard": cable_hard,
+        "cable_op": cable_op,
+        "thermal": thermal,
+        "standard": standard,
+        "breaker_pickup": breaker_pickup,
+        "breaker_tms": breaker_tms,
+        "breaker_curve": breaker_curve,
+        "t_limit_s": t_limit_s,
+        "demo_seed": DEMO_SEED,
+    }
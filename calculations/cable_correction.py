@@ -1,32 +1,98 @@
-def temperature_correction_factor_xlpe(temp_c: float) -> float:
+# calculations/cable_correction.py
+"""
+케이블 주위온도 보정계수 엔진 (IEC 60364-5-52)
+
+- 기중(air, 기준 30℃): Table B.52.14
+- 지중(ground, 기준 20℃): Table B.52.15
+- 절연별(XLPE / EPR / PVC) 절점 배열을 모듈 로드 시 1회 구성하고 np.interp로 보간
+- 스칼라 → float, 배열 → 배열 (기상 이력 10^5점도 1회 호출)
+- 표 범위 밖은 양 끝 값으로 고정(np.interp 기본 동작)
+
+engineering._temp_factor_30_base / 배치 / 역산(headroom)이 모두 이 엔진을 사용한다.
+"""
+import numpy as np
+
+
+REFERENCE_AIR = "air"
+REFERENCE_GROUND = "ground"
+REFERENCE_TEMP_C = {REFERENCE_AIR: 30.0, REFERENCE_GROUND: 20.0}
+INSULATION_TYPES = ("XLPE", "EPR", "PVC")
+
+_TEMPS = np.arange(10.0, 85.0, 5.0)
+
+# 절연 → 보정계수(_TEMPS 순서), PVC는 60℃까지
+_TABLES = {
+    REFERENCE_AIR: {
+        "XLPE": (1.15, 1.12, 1.08, 1.04, 1.00, 0.96, 0.91, 0.87, 0.82, 0.76, 0.71, 0.65, 0.58, 0.50, 0.41),
+        "PVC": (1.22, 1.17, 1.12, 1.06, 1.00, 0.94, 0.87, 0.79, 0.71, 0.61, 0.50),
+    },
+    REFERENCE_GROUND: {
+        "XLPE": (1.07, 1.04, 1.00, 0.96, 0.93, 0.89, 0.85, 0.80, 0.76, 0.71, 0.65, 0.60, 0.53, 0.46, 0.38),
+        "PVC": (1.10, 1.05, 1.00, 0.95, 0.89, 0.84, 0.77, 0.71, 0.63, 0.55, 0.45),
+    },
+}
+
+
+def _compile():
+    out = {}
+    for ref, tables in _TABLES.items():
+        for ins, factors in tables.items():
+            k = np.asarray(factors, dtype=float)
+            out[(ref, ins)] = (_TEMPS[: k.size].copy(), k)
+        # EPR은 XLPE와 같은 표(90℃ 도체 허용온도)
+        out[(ref, "EPR")] = out[(ref, "XLPE")]
+    return out
+
+
+BREAKPOINTS = _compile()
+
+
+def _insulation_key(insulation):
+    s = "" if insulation is None else str(insulation).upper().strip()
+    if s in ("XLPE", "EPR"):
+        return s
+    # 미지정/기타 절연은 PVC 표(보수적, engineering._correction_factors의 k_ins 정책과 동일)
+    return "PVC"
+
+
+def breakpoints(insulation="XLPE", reference=REFERENCE_AIR):
+    """(온도 배열, 보정계수 배열) — 읽기 전용으로 사용"""
+    return BREAKPOINTS[(str(reference).lower(), _insulation_key(insulation))]
+
+
+def temperature_correction_factor(temp_c, insulation="XLPE", reference=REFERENCE_AIR, credit_below_reference=True):
     """
-    IEC XLPE 케이블 주변온도 보정계수(대표 표)
-    기준온도: 30℃
+    주위온도 → 보정계수 k_temp
+    credit_below_reference=False: 기준온도 이하는 1.0 (설계 판정에서 저온 가산을 인정하지 않는 정책)
+    temp_c가 None이면 1.0
     """
-    table = {
-        20: 1.08,
-        25: 1.04,
-        30: 1.00,
-        35: 0.96,
-        40: 0.91,
-        45: 0.87,
-        50: 0.82,
-    }
-
     if temp_c is None:
         return 1.0
+    temps, k = breakpoints(insulation, reference)
+    t = np.asarray(temp_c, dtype=float)
+    if not credit_below_reference:
+        t = np.maximum(t, REFERENCE_TEMP_C[str(reference).lower()])
+    out = np.interp(t, temps, k)
+    return float(out) if out.ndim == 0 else out
 
-    if temp_c <= 20:
-        return table[20]
-    if temp_c >= 50:
-        return table[50]
 
-    keys = sorted(table.keys())
-    for i in range(len(keys) - 1):
-        t1, t2 = keys[i], keys[i + 1]
-        if t1 <= temp_c <= t2:
-            k1, k2 = table[t1], table[t2]
-            # 선형 보간
-            return k1 + (k2 - k1) * (temp_c - t1) / (t2 - t1)
+def ambient_for_factor(k_temp, insulation="XLPE", reference=REFERENCE_AIR):
+    """
+    temperature_correction_factor(T) ≥ k_temp 를 만족하는 최대 T [℃] (표 구간 선형 역보간)
+    표 끝값 이하면 표 최고온도(XLPE 80℃ / PVC 60℃ — 그 이상은 표로 확인 불가, 외삽하지 않음),
+    표 최대값보다 크면 -inf, NaN은 NaN
+    """
+    temps, k = breakpoints(insulation, reference)
+    kk = np.asarray(k_temp, dtype=float)
+    # 계수는 온도에 대해 단조 감소 → 뒤집어서 오름차순으로 보간
+    out = np.interp(kk, k[::-1], temps[::-1])
+    out = np.where(kk <= k[-1], temps[-1], np.where(kk > k[0], -np.inf, out))
+    out = np.where(np.isnan(kk), np.nan, out)
+    return float(out) if out.ndim == 0 else out
+
 
-    return 1.0
+def temperature_correction_factor_xlpe(temp_c: float) -> float:
+    """
+    IEC XLPE 케이블 주변온도 보정계수(기중, 기준온도 30℃)
+    """
+    return temperature_correction_factor(temp_c, "XLPE", REFERENCE_AIR)
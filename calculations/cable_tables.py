@@ -0,0 +1,283 @@
+# calculations/cable_tables.py
+"""
+케이블 허용전류 테이블 레지스트리
+
+- data/cable_tables/*.csv|*.json (기본 프로파일) + CABLE_TABLE_PATH 환경변수 경로(제조사 카탈로그 등)를 1회 로드
+- (profile, material, insulation, install) 키별로 단면적 오름차순 NumPy 배열로 컴파일
+- 컴파일 결과는 원본 옆 .npz로 캐시(원본 mtime/size 일치 시 파싱 생략)
+
+CSV 컬럼: profile, material, insulation, install, section_mm2, ampacity_a
+  - profile 생략 시 파일명(확장자 제외)
+  - material/insulation/install 생략 또는 "*"는 와일드카드(전체 공통)
+JSON: {"profile": "...", "rows": [{...CSV와 같은 키...}]} 또는 rows 리스트
+
+도체 임피던스(data/cable_impedance.csv): material, section_mm2, r_ohm_km(20℃ 직류, IEC 60228), x_ohm_km
+"""
+import csv
+import json
+import os
+
+import numpy as np
+
+
+BUILTIN_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "cable_tables")
+IMPEDANCE_PATH = os.path.join(os.path.dirname(BUILTIN_DIR), "cable_impedance.csv")
+DEFAULT_PROFILE = "IEC_CONSERVATIVE"
+WILDCARD = "*"
+
+_KEY_SEP = "|"
+
+
+def _norm(x):
+    s = "" if x is None else str(x).strip()
+    return s if s else WILDCARD
+
+
+class CableTable:
+    """
+    컴파일된 테이블 1개(단면적 오름차순)
+    - ampacity_cummax: 허용전류 누적최대(np.searchsorted로 'I 이상인 첫 단면적' 탐색용)
+    """
+    __slots__ = ("profile", "key", "sections", "ampacity", "ampacity_cummax")
+
+    def __init__(self, profile, key, sections, ampacity):
+        sections = np.asarray(sections, dtype=float)
+        ampacity = np.asarray(ampacity, dtype=float)
+        order = np.argsort(sections, kind="stable")
+        self.profile = profile
+        self.key = key
+        self.sections = sections[order]
+        self.ampacity = ampacity[order]
+        self.ampacity_cummax = np.maximum.accumulate(self.ampacity) if self.ampacity.size else self.ampacity
+
+    @classmethod
+    def from_rows(cls, rows, profile="CUSTOM"):
+        t = np.asarray(rows, dtype=float).reshape(-1, 2)
+        return cls(profile, (profile, WILDCARD, WILDCARD, WILDCARD), t[:, 0], t[:, 1])
+
+    def rows(self):
+        return [(_as_number(s), _as_number(a)) for s, a in zip(self.sections, self.ampacity)]
+
+    def __len__(self):
+        return int(self.sections.size)
+
+
+def _as_number(x):
+    x = float(x)
+    return int(x) if x.is_integer() else x
+
+
+def _read_csv(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            row.setdefault("profile", stem)
+            if not row.get("profile"):
+                row["profile"] = stem
+            yield row
+
+
+def _read_json(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    if isinstance(payload, dict):
+        profile = payload.get("profile") or stem
+        rows = payload.get("rows", [])
+    else:
+        profile = stem
+        rows = payload
+    for row in rows:
+        row = dict(row)
+        if not row.get("profile"):
+            row["profile"] = profile
+        yield row
+
+
+def _parse_file(path):
+    """
+    원본 파일 → {key: (sections, ampacity)}
+    """
+    reader = _read_json if path.lower().endswith(".json") else _read_csv
+    grouped = {}
+    for row in reader(path):
+        key = (
+            _norm(row.get("profile")).upper(),
+            _norm(row.get("material")),
+            _norm(row.get("insulation")),
+            _norm(row.get("install")),
+        )
+        try:
+            s = float(row["section_mm2"])
+            a = float(row["ampacity_a"])
+        except Exception:
+            continue
+        grouped.setdefault(key, ([], []))
+        grouped[key][0].append(s)
+        grouped[key][1].append(a)
+    return {k: (np.asarray(v[0]), np.asarray(v[1])) for k, v in grouped.items()}
+
+
+def _cache_path(path):
+    return os.path.splitext(path)[0] + ".npz"
+
+
+def _load_cache(path):
+    cpath = _cache_path(path)
+    if not os.path.exists(cpath):
+        return None
+    try:
+        st = os.stat(path)
+        with np.load(cpath, allow_pickle=False) as z:
+            if int(z["src_mtime_ns"]) != st.st_mtime_ns or int(z["src_size"]) != st.st_size:
+                return None
+            keys = [tuple(k.split(_KEY_SEP)) for k in z["keys"].tolist()]
+            offsets = z["offsets"]
+            sections = z["sections"]
+            ampacity = z["ampacity"]
+    except Exception:
+        return None
+
+    out = {}
+    for i, key in enumerate(keys):
+        a, b = int(offsets[i]), int(offsets[i + 1])
+        out[key] = (sections[a:b], ampacity[a:b])
+    return out
+
+
+def _save_cache(path, parsed):
+    keys = list(parsed.keys())
+    sizes = [len(parsed[k][0]) for k in keys]
+    offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+    st = os.stat(path)
+    try:
+        np.savez(
+            _cache_path(path),
+            keys=np.array([_KEY_SEP.join(k) for k in keys]),
+            offsets=offsets,
+            sections=np.concatenate([parsed[k][0] for k in keys]) if keys else np.zeros(0),
+            ampacity=np.concatenate([parsed[k][1] for k in keys]) if keys else np.zeros(0),
+            src_mtime_ns=np.int64(st.st_mtime_ns),
+            src_size=np.int64(st.st_size),
+        )
+    except OSError:
+        # 읽기 전용 설치 경로 등: 캐시 없이 계속
+        pass
+
+
+class CableTableRegistry:
+    def __init__(self):
+        self._tables = {}
+        self._profiles = set()
+
+    def load_file(self, path, use_cache=True):
+        parsed = _load_cache(path) if use_cache else None
+        if parsed is None:
+            parsed = _parse_file(path)
+            if use_cache:
+                _save_cache(path, parsed)
+        for key, (sections, ampacity) in parsed.items():
+            self._tables[key] = CableTable(key[0], key, sections, ampacity)
+            self._profiles.add(key[0])
+
+    def load_dir(self, path, use_cache=True):
+        if os.path.isfile(path):
+            self.load_file(path, use_cache=use_cache)
+            return
+        if not os.path.isdir(path):
+            return
+        for name in sorted(os.listdir(path)):
+            if name.lower().endswith((".csv", ".json")):
+                self.load_file(os.path.join(path, name), use_cache=use_cache)
+
+    def profiles(self):
+        return sorted(self._profiles)
+
+    def has_profile(self, profile):
+        return _norm(profile).upper() in self._profiles
+
+    def get(self, profile, material=None, insulation=None, install=None):
+        """
+        정확한 키 → 설치 와일드카드 → 절연 와일드카드 → 재질 와일드카드 순으로 조회
+        등록되지 않은 프로파일은 DEFAULT_PROFILE로 대체(cable_table_base 기존 정책)
+        """
+        p = _norm(profile).upper()
+        if not self.has_profile(p):
+            p = DEFAULT_PROFILE
+        m, i, s = _norm(material), _norm(insulation), _norm(install)
+        for key in (
+            (p, m, i, s),
+            (p, m, i, WILDCARD),
+            (p, m, WILDCARD, WILDCARD),
+            (p, WILDCARD, WILDCARD, WILDCARD),
+        ):
+            t = self._tables.get(key)
+            if t is not None:
+                return t
+        raise KeyError(f"케이블 테이블 없음: {p}/{m}/{i}/{s}")
+
+
+_REGISTRY = None
+_GENERATION = 0
+
+
+def get_registry():
+    global _REGISTRY
+    if _REGISTRY is None:
+        reg = CableTableRegistry()
+        reg.load_dir(BUILTIN_DIR)
+        for extra in os.environ.get("CABLE_TABLE_PATH", "").split(os.pathsep):
+            if extra.strip():
+                reg.load_dir(extra.strip())
+        _REGISTRY = reg
+    return _REGISTRY
+
+
+def reload_registry():
+    global _REGISTRY, _GENERATION
+    _REGISTRY = None
+    _GENERATION += 1
+    return get_registry()
+
+
+def registry_generation():
+    """reload_registry() 호출마다 증가(결과 캐시 키에 포함해 오래된 테이블 결과를 무효화)"""
+    return _GENERATION
+
+
+# =========================
+# 도체 임피던스 (단락전류 계산용)
+# =========================
+_IMPEDANCE = None
+
+
+def _load_impedance():
+    global _IMPEDANCE
+    if _IMPEDANCE is None:
+        grouped = {}
+        with open(IMPEDANCE_PATH, "r", encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    vals = (float(row["section_mm2"]), float(row["r_ohm_km"]), float(row["x_ohm_km"]))
+                except Exception:
+                    continue
+                grouped.setdefault(_norm(row.get("material")), []).append(vals)
+        out = {}
+        for m, rows in grouped.items():
+            t = np.asarray(sorted(rows), dtype=float)
+            out[m] = (t[:, 0], t[:, 1], t[:, 2])
+        _IMPEDANCE = out
+    return _IMPEDANCE
+
+
+def cable_impedance(material, section_mm2):
+    """
+    (재질, 단면적) → (r, x) [Ω/km], section_mm2는 스칼라/배열
+    - 표에 없는 단면적은 '이상인 첫 단면적' 값(저항이 작아 단락전류를 크게 보는 쪽)
+    - 표 범위를 넘으면 최대 단면적 값, 재질 미등록은 Cu
+    """
+    table = _load_impedance()
+    sections, r, x = table.get(_norm(material)) or table["Cu"]
+    S = np.asarray(section_mm2, dtype=float)
+    idx = np.minimum(np.searchsorted(sections, S, side="left"), sections.size - 1)
+    return r[idx], x[idx]
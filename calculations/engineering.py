@@ -1,5 +1,23 @@
 # calculations/engineering.py
 import math
+from functools import lru_cache
+
+import numpy as np
+
+from calculations.cable_correction import REFERENCE_AIR, temperature_correction_factor
+from calculations.cable_tables import CableTable, cable_impedance, get_registry, registry_generation
+from calculations.tcc import trip_time
+from calculations.results import (
+    Status,
+    CableResult,
+    CableOpResult,
+    CableBatchResult,
+    ThermalResult,
+    REASON_MANUAL,
+    REASON_AUTO_OK,
+    REASON_AUTO_FAIL,
+    REASON_AUTO_SC_FAIL,
+)
 
 
 def rated_current(V_kV, S_kVA):
@@ -19,37 +37,7 @@ def breaker_judgement(I_sc_A, breaker_kA, standard):
 
 
 def cable_table_base(profile: str = "IEC_CONSERVATIVE"):
-    p = str(profile).upper().strip()
-
-    if p == "KESC_DEFAULT":
-        return [
-            (25, 110),
-            (35, 135),
-            (50, 170),
-            (70, 215),
-            (95, 260),
-            (120, 300),
-            (150, 340),
-            (185, 385),
-            (240, 450),
-            (300, 520),
-            (400, 610),
-            (500, 690),
-            (630, 800),
-        ]
-
-    if p == "IEC_REALISTIC_1C":
-        return [
-            (25, 190), (35, 235), (50, 285), (70, 355),
-            (95, 430), (120, 490), (150, 560), (185, 640),
-            (240, 780), (300, 900), (400, 1080), (500, 1250), (630, 1450),
-        ]
-
-    return [
-        (25, 130), (35, 160), (50, 195), (70, 245),
-        (95, 300), (120, 345), (150, 400), (185, 455),
-        (240, 540), (300, 630), (400, 750), (500, 860), (630, 1000),
-    ]
+    return get_registry().get(profile).rows()
 
 
 def _group_factor(parallel: int) -> float:
@@ -68,10 +56,16 @@ def _group_factor(parallel: int) -> float:
     return 0.75
 
 
-def _temp_factor_30_base(ambient_c: float) -> float:
-    if ambient_c <= 30.0:
-        return 1.0
-    return max(0.7, 1.0 - 0.01 * (ambient_c - 30.0))
+def _temp_insulation(insulation) -> str:
+    # 온도보정 표 선택은 k_ins와 같은 구분(XLPE / 그 외 → PVC 표)
+    return "XLPE" if insulation == "XLPE" else "PVC"
+
+
+def _temp_factor_30_base(ambient_c: float, insulation="XLPE") -> float:
+    # 기중 30℃ 기준 표(cable_correction), 30℃ 이하는 가산 없이 1.0
+    return temperature_correction_factor(
+        ambient_c, _temp_insulation(insulation), REFERENCE_AIR, credit_below_reference=False
+    )
 
 
 def _correction_factors(material, insulation, install, ambient, parallel):
@@ -85,14 +79,20 @@ def _correction_factors(material, insulation, install, ambient, parallel):
     else:
         k_inst = 0.75
 
-    k_temp = _temp_factor_30_base(float(ambient))
+    k_temp = _temp_factor_30_base(float(ambient), insulation)
     k_group = _group_factor(parallel)
     return k_mat, k_ins, k_inst, k_temp, k_group
 
 
-def _resolve_table(table, table_profile, standard):
+def _resolve_table(table, table_profile, standard, material=None, insulation=None, install=None):
+    """
+    반환: (CableTable, 사용 프로파일명)
+    - table(목록)이 주어지면 그대로 컴파일(CUSTOM)
+    - 아니면 레지스트리에서 (프로파일, 재질, 절연, 설치) 키로 조회
+    """
     if table is not None:
-        return table, (table_profile or "CUSTOM")
+        prof = table_profile or "CUSTOM"
+        return CableTable.from_rows(table, profile=prof), prof
 
     st = str(standard).upper().strip()
     prof = (table_profile or "").upper().strip() if table_profile is not None else None
@@ -104,7 +104,98 @@ def _resolve_table(table, table_profile, standard):
         if not prof:
             prof = "IEC_CONSERVATIVE"
 
-    return cable_table_base(profile=prof), prof
+    return get_registry().get(prof, material, insulation, install), prof
+
+
+ADIABATIC_K = {
+    ("Cu", "PVC"): 115.0,
+    ("Cu", "XLPE"): 143.0,
+    ("Al", "PVC"): 76.0,
+    ("Al", "XLPE"): 94.0,
+}
+
+
+def adiabatic_limit_s(I_sc_A, section_mm2, material, insulation):
+    """
+    케이블 단열 한계 차단시간 (k·S/Isc)² [s] — thermal_adiabatic_check와 같은 k
+    입력은 스칼라 또는 배열, k 매핑 불가·Isc/S 미입력은 NaN (optimize_tcc_settings t_limit_s 입력)
+    """
+    k = ADIABATIC_K.get((material, insulation), np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = (k * np.asarray(section_mm2, dtype=float) / np.asarray(I_sc_A, dtype=float)) ** 2
+    return np.where(np.isfinite(t) & (t > 0), t, np.nan)
+
+
+def _num(x):
+    x = float(x)
+    return int(x) if x.is_integer() else x
+
+
+# 전원측(변압기 2차) 임피던스 X/R 가정값 (network.py와 공용)
+TRANSFORMER_X_R = 6.0
+
+
+def feeder_end_isc(Isc_A, V_kV, length_m, r_ohm_km, x_ohm_km, parallel=1, x_r=TRANSFORMER_X_R):
+    """
+    전원측 Isc + 케이블 임피던스 → 케이블 말단 3상 단락전류 [A]
+    입력은 스칼라 또는 배열(브로드캐스트 — 후보 단면적 전체, 스윕 격자를 한 번에 계산)
+    """
+    E = np.asarray(V_kV, dtype=float) * 1000.0 / math.sqrt(3)
+    z_src = E / np.asarray(Isc_A, dtype=float)
+    r_src = z_src / math.sqrt(1.0 + x_r * x_r)
+    L_km = np.asarray(length_m, dtype=float) / 1000.0 / np.maximum(1, np.asarray(parallel).astype(np.int64))
+    R = r_src + np.asarray(r_ohm_km, dtype=float) * L_km
+    X = r_src * x_r + np.asarray(x_ohm_km, dtype=float) * L_km
+    return E / np.hypot(R, X)
+
+
+def _feeder_sc_inputs(length_m, Isc_A, V_kV, t_clear_s, material, insulation, trip=None):
+    """
+    말단 Isc 계산 입력 정규화 → (length, Isc, V, t, k, trip) 또는 None(길이/전원 Isc/전압 중 누락)
+    t/k는 없으면 None(말단 Isc만 계산, 단락열 조건은 생략)
+    trip: (pickup, tms, curve, t_floor) — 말단 고장 차단시간을 TCC로 다시 계산, 형식 오류면 None
+    """
+    try:
+        L = float(length_m)
+        Isc = float(Isc_A)
+        V = float(V_kV)
+    except Exception:
+        return None
+    if not (L > 0 and Isc > 0 and V > 0):
+        return None
+    try:
+        t = float(t_clear_s)
+    except Exception:
+        t = None
+    if t is not None and not (t > 0):
+        t = None
+    k = ADIABATIC_K.get((material, insulation))
+    if trip is not None:
+        try:
+            pickup, tms, curve, t_floor = trip
+            trip = (float(pickup), float(tms), str(curve).upper(), None if t_floor is None else float(t_floor))
+        except Exception:
+            trip = None
+        if trip is not None and not (trip[0] > 0 and trip[1] > 0):
+            trip = None
+    return L, Isc, V, t, k, trip
+
+
+def feeder_fault_duty(Isc_src, isc_end, t_src, trip=None):
+    """
+    송전단/말단 고장 중 큰 I·√t → (I·√t, 말단 차단시간)
+    trip이 있으면 말단 차단시간 = max(TCC(isc_end), t_floor), pickup 이하(미동작)는 inf
+    없으면 양단 모두 t_src
+    """
+    if trip is None:
+        t_end = np.full(np.shape(isc_end), float(t_src))
+    else:
+        pickup, tms, curve, t_floor = trip
+        t_end = trip_time(isc_end, pickup, tms, curve)
+        if t_floor is not None:
+            t_end = np.maximum(t_end, t_floor)
+    lhs = np.maximum(float(Isc_src) * math.sqrt(t_src), np.asarray(isc_end, dtype=float) * np.sqrt(t_end))
+    return lhs, t_end
 
 
 def cable_allowable_current_adv(
@@ -120,7 +211,20 @@ def cable_allowable_current_adv(
     standard="KESC",
     table_profile=None,
     design_margin=1.25,
+    length_m=None,
+    Isc_A=None,
+    t_clear_s=None,
+    V_kV=None,
+    trip=None,
 ):
+    """
+    반환: CableResult (dict 호환, reason은 접근 시 생성)
+    length_m/Isc_A(전원측)/V_kV가 있으면 케이블 말단 Isc를 계산하고,
+    t_clear_s까지 있으면 AUTO는 후보 전체에 대해 S ≥ S_min = max(I_src·√t, I_end·√t_end)/k 를 함께
+    만족하는 최소 단면적을 선정(허용전류 + 단락열 동시 조건)
+    trip=(pickup, tms, curve, t_floor)이면 t_end는 말단 Isc에서의 TCC 동작시간(미동작이면 해당 후보 불가),
+    없으면 t_end = t_clear_s
+    """
     missing = []
     if material is None:
         missing.append("재질")
@@ -134,18 +238,7 @@ def cable_allowable_current_adv(
         missing.append("병렬 케이블 수")
 
     if missing:
-        return {
-            "status": "계산 불가",
-            "section_mm2_used": None,
-            "parallel": None,
-            "I_allow_total": None,
-            "I_allow_single": None,
-            "k_temp": None,
-            "table_profile_used": None,
-            "design_margin_used": None,
-            "I_design_A": None,
-            "reason": f"입력 누락으로 계산 불가: {', '.join(missing)} 미입력",
-        }
+        return CableResult.na(f"입력 누락으로 계산 불가: {', '.join(missing)} 미입력")
 
     try:
         I_load = float(I_load)
@@ -153,170 +246,126 @@ def cable_allowable_current_adv(
         parallel = int(parallel)
         dm = float(design_margin) if design_margin is not None else 1.25
     except Exception:
-        return {
-            "status": "계산 불가",
-            "section_mm2_used": None,
-            "parallel": None,
-            "I_allow_total": None,
-            "I_allow_single": None,
-            "k_temp": None,
-            "table_profile_used": None,
-            "design_margin_used": None,
-            "I_design_A": None,
-            "reason": "입력 형식 오류로 계산 불가(I_load/ambient/parallel/design_margin)",
-        }
+        return CableResult.na("입력 형식 오류로 계산 불가(I_load/ambient/parallel/design_margin)")
 
     if parallel <= 0:
         parallel = 1
     if dm <= 0:
         dm = 1.25
 
-    table_used, profile_used = _resolve_table(table, table_profile, standard)
+    table_used, profile_used = _resolve_table(table, table_profile, standard, material, insulation, install)
 
     k_mat, k_ins, k_inst, k_temp, k_group = _correction_factors(
         material, insulation, install, ambient, parallel
     )
 
     I_design = I_load * dm
+    sc = _feeder_sc_inputs(length_m, Isc_A, V_kV, t_clear_s, material, insulation, trip)
+
+    common = {
+        "parallel": parallel,
+        "k_temp": float(k_temp),
+        "table_profile_used": profile_used,
+        "design_margin_used": float(dm),
+        "I_design_A": float(I_design),
+    }
 
     if str(mode).upper() == "MANUAL":
         if section_mm2_input is None:
-            return {
-                "status": "계산 불가",
-                "section_mm2_used": None,
-                "parallel": parallel,
-                "I_allow_total": None,
-                "I_allow_single": None,
-                "k_temp": float(k_temp),
-                "table_profile_used": profile_used,
-                "design_margin_used": float(dm),
-                "I_design_A": float(I_design),
-                "reason": "수동 입력 모드인데 단면적(S) 미입력으로 계산 불가",
-            }
+            return CableResult.na("수동 입력 모드인데 단면적(S) 미입력으로 계산 불가", **common)
         try:
             S_in = float(section_mm2_input)
         except Exception:
-            return {
-                "status": "계산 불가",
-                "section_mm2_used": None,
-                "parallel": parallel,
-                "I_allow_total": None,
-                "I_allow_single": None,
-                "k_temp": float(k_temp),
-                "table_profile_used": profile_used,
-                "design_margin_used": float(dm),
-                "I_design_A": float(I_design),
-                "reason": "단면적(S) 형식 오류로 계산 불가",
-            }
+            return CableResult.na("단면적(S) 형식 오류로 계산 불가", **common)
         if S_in <= 0:
-            return {
-                "status": "계산 불가",
-                "section_mm2_used": None,
-                "parallel": parallel,
-                "I_allow_total": None,
-                "I_allow_single": None,
-                "k_temp": float(k_temp),
-                "table_profile_used": profile_used,
-                "design_margin_used": float(dm),
-                "I_design_A": float(I_design),
-                "reason": "단면적(S)은 0보다 커야 합니다.",
-            }
-
-        table_sorted = sorted(table_used, key=lambda x: x[0])
-        base_allow = None
-        mm2_for_base = None
-        for mm2, allow in table_sorted:
-            if S_in <= mm2:
-                mm2_for_base = mm2
-                base_allow = allow
-                break
-        if base_allow is None:
-            mm2_for_base = table_sorted[-1][0]
-            base_allow = table_sorted[-1][1]
+            return CableResult.na("단면적(S)은 0보다 커야 합니다.", **common)
+
+        idx = min(int(np.searchsorted(table_used.sections, S_in, side="left")), len(table_used) - 1)
+        mm2_for_base = _num(table_used.sections[idx])
+        base_allow = float(table_used.ampacity[idx])
 
         single_allow = base_allow * k_mat * k_ins * k_inst * k_temp
         total_allow = single_allow * parallel * k_group
 
         ok = (I_design <= total_allow)
-        status = "적합" if ok else "부적합"
-        reason = (
-            "수동 입력 모드(자동선정 OFF)\n"
-            f"- 목표 설계전류 I_design = I_load×여유계수 = {I_load:.0f}×{dm:.2f} = {I_design:.0f} A\n"
-            f"- S(입력)={S_in:.0f}mm² / 테이블환산={mm2_for_base}mm² ({profile_used})\n"
-            f"- 병렬 {parallel} × 집합계수 {k_group:.2f}\n"
-            f"- 온도보정 k_temp={k_temp:.3f}\n"
-            f"- 총 허용전류: {total_allow:.0f} A"
+        ctx = (I_load, S_in, mm2_for_base, k_group)
+        if sc is not None:
+            L, Isc_src, V, t, k, trip = sc
+            r, x = cable_impedance(material, S_in)
+            isc_end = float(feeder_end_isc(Isc_src, V, L, r, x, parallel))
+            s_min = None
+            if t is not None and k is not None:
+                s_min = float(feeder_fault_duty(Isc_src, isc_end, t, trip)[0]) / k
+            common.update(length_m=L, Isc_end_A=isc_end, S_min_mm2=s_min)
+            ctx = ctx + ((Isc_src, t, k),)
+        return CableResult(
+            Status.OK if ok else Status.FAIL,
+            section_mm2_used=float(S_in),
+            I_allow_total=float(total_allow),
+            I_allow_single=float(single_allow),
+            reason_kind=REASON_MANUAL,
+            ctx=ctx,
+            **common,
         )
 
-        return {
-            "status": status,
-            "section_mm2_used": float(S_in),
-            "parallel": parallel,
-            "I_allow_total": float(total_allow),
-            "I_allow_single": float(single_allow),
-            "k_temp": float(k_temp),
-            "table_profile_used": profile_used,
-            "design_margin_used": float(dm),
-            "I_design_A": float(I_design),
-            "reason": reason,
-        }
-
-    chosen_S = None
-    chosen_single = None
-    chosen_total = None
-
-    for mm2, base_allow in sorted(table_used, key=lambda x: x[0]):
-        single_allow = base_allow * k_mat * k_ins * k_inst * k_temp
-        total_allow = single_allow * parallel * k_group
-        if I_design <= total_allow:
-            chosen_S = mm2
-            chosen_single = float(single_allow)
-            chosen_total = float(total_allow)
-            break
-
-    if chosen_S is None:
-        max_mm2, max_base = sorted(table_used, key=lambda x: x[0])[-1]
-        max_single = max_base * k_mat * k_ins * k_inst * k_temp
-        max_total = max_single * parallel * k_group
-        return {
-            "status": "부적합",
-            "section_mm2_used": float(max_mm2),
-            "parallel": parallel,
-            "I_allow_total": float(max_total),
-            "I_allow_single": float(max_single),
-            "k_temp": float(k_temp),
-            "table_profile_used": profile_used,
-            "design_margin_used": float(dm),
-            "I_design_A": float(I_design),
-            "reason": (
-                "자동선정 모드: 설계여유계수 포함 기준 미달\n"
-                f"- 목표 설계전류 I_design = {I_design:.0f} A (I_load {I_load:.0f}×{dm:.2f})\n"
-                f"- 최대 후보: {max_mm2}mm² ({profile_used})\n"
-                f"- 병렬 {parallel} × 집합계수 {k_group:.2f}\n"
-                f"- 온도보정 k_temp={k_temp:.3f}\n"
-                f"- 총 허용전류: {max_total:.0f} A"
-            ),
-        }
-
-    return {
-        "status": "적합",
-        "section_mm2_used": float(chosen_S),
-        "parallel": parallel,
-        "I_allow_total": float(chosen_total),
-        "I_allow_single": float(chosen_single),
-        "k_temp": float(k_temp),
-        "table_profile_used": profile_used,
-        "design_margin_used": float(dm),
-        "I_design_A": float(I_design),
-        "reason": (
-            "자동선정 모드: 설계여유계수 포함 기준 만족\n"
-            f"- 목표 설계전류 I_design = {I_design:.0f} A (I_load {I_load:.0f}×{dm:.2f})\n"
-            f"- 선정 S: {chosen_S}mm² ({profile_used})\n"
-            f"- 병렬 {parallel} × 집합계수 {k_group:.2f}\n"
-            f"- 온도보정 k_temp={k_temp:.3f}\n"
-            f"- 총 허용전류: {chosen_total:.0f} A"
-        ),
-    }
+    singles = table_used.ampacity * k_mat * k_ins * k_inst * k_temp
+    totals = singles * parallel * k_group
+    amp_ok = I_design <= totals
+
+    # 후보 전체의 말단 Isc / 단락열 조건을 한 번에 계산
+    isc_end = s_min = None
+    reason_fail = REASON_AUTO_FAIL
+    ok = amp_ok
+    if sc is not None:
+        L, Isc_src, V, t, k, trip = sc
+        r, x = cable_impedance(material, table_used.sections)
+        isc_end = feeder_end_isc(Isc_src, V, L, r, x, parallel)
+        if t is not None and k is not None:
+            lhs = feeder_fault_duty(Isc_src, isc_end, t, trip)[0]
+            s_min = lhs / k
+            ok = amp_ok & (lhs <= k * table_used.sections)
+            if amp_ok.any():
+                reason_fail = REASON_AUTO_SC_FAIL
+
+    def _sc_fields(j):
+        if isc_end is None:
+            return {}, ()
+        return (
+            {
+                "length_m": L,
+                "Isc_end_A": float(isc_end[j]),
+                "S_min_mm2": float(s_min[j]) if s_min is not None else None,
+            },
+            ((Isc_src, t, k),),
+        )
+
+    ok_idx = np.flatnonzero(ok)
+
+    if ok_idx.size == 0:
+        extra, ctx_sc = _sc_fields(-1)
+        return CableResult(
+            Status.FAIL,
+            section_mm2_used=float(table_used.sections[-1]),
+            I_allow_total=float(totals[-1]),
+            I_allow_single=float(singles[-1]),
+            reason_kind=reason_fail,
+            ctx=(I_load, None, _num(table_used.sections[-1]), k_group) + ctx_sc,
+            **extra,
+            **common,
+        )
+
+    j = int(ok_idx[0])
+    extra, ctx_sc = _sc_fields(j)
+    return CableResult(
+        Status.OK,
+        section_mm2_used=float(table_used.sections[j]),
+        I_allow_total=float(totals[j]),
+        I_allow_single=float(singles[j]),
+        reason_kind=REASON_AUTO_OK,
+        ctx=(I_load, None, _num(table_used.sections[j]), k_group) + ctx_sc,
+        **extra,
+        **common,
+    )
 
 
 def thermal_adiabatic_check(
@@ -329,58 +378,160 @@ def thermal_adiabatic_check(
     t_clear_input=None,
     t_trip_est=None,
     t_clear_policy="NONE",
+    I_end_A=None,
+    t_end_s=None,
 ):
+    """
+    반환: ThermalResult (dict 호환: status / reason / detail)
+    I_end_A가 있으면 말단 고장(t_end_s, 없으면 t_clear_s)도 검토해 I·√t가 큰 쪽으로 판정
+    말단 차단시간이 inf(pickup 이하 미동작)면 부적합
+    """
     if t_clear_s is None:
-        return {"status": "계산 불가", "reason": "입력 누락으로 계산 불가: 차단시간(t_used) 미확정", "detail": None}
+        return ThermalResult.na("입력 누락으로 계산 불가: 차단시간(t_used) 미확정")
 
     if section_mm2_used is None:
-        return {"status": "계산 불가", "reason": "입력 누락으로 계산 불가: 최종 케이블 단면적(S) 미확정", "detail": None}
+        return ThermalResult.na("입력 누락으로 계산 불가: 최종 케이블 단면적(S) 미확정")
 
     try:
         I_sc_A = float(I_sc_A)
         t = float(t_clear_s)
         S = float(section_mm2_used)
     except Exception:
-        return {"status": "계산 불가", "reason": "입력 형식 오류로 계산 불가(Isc/t_used/S)", "detail": None}
+        return ThermalResult.na("입력 형식 오류로 계산 불가(Isc/t_used/S)")
 
     if t <= 0:
-        return {"status": "계산 불가", "reason": "차단시간(t_used)은 0보다 커야 합니다.", "detail": None}
+        return ThermalResult.na("차단시간(t_used)은 0보다 커야 합니다.")
     if S <= 0:
-        return {"status": "계산 불가", "reason": "단면적(S)은 0보다 커야 합니다.", "detail": None}
+        return ThermalResult.na("단면적(S)은 0보다 커야 합니다.")
 
     if material is None or insulation is None:
-        return {"status": "계산 불가", "reason": "입력 누락으로 계산 불가: 케이블 재질/절연 정보 없음", "detail": None}
+        return ThermalResult.na("입력 누락으로 계산 불가: 케이블 재질/절연 정보 없음")
 
-    k_table = {
-        ("Cu", "PVC"): 115.0,
-        ("Cu", "XLPE"): 143.0,
-        ("Al", "PVC"): 76.0,
-        ("Al", "XLPE"): 94.0,
-    }
-    k = k_table.get((material, insulation))
+    k = ADIABATIC_K.get((material, insulation))
     if k is None:
-        return {"status": "계산 불가", "reason": "k 값 매핑 불가(재질/절연 조합)", "detail": None}
+        return ThermalResult.na("k 값 매핑 불가(재질/절연 조합)")
 
     lhs = I_sc_A * math.sqrt(t)
     rhs = k * S
+    fault_end = None
+    t_end = None
+    if I_end_A is not None:
+        try:
+            I_end = float(I_end_A)
+            t_end = t if t_end_s is None else float(t_end_s)
+        except Exception:
+            return ThermalResult.na("입력 형식 오류로 계산 불가(말단 Isc/t_end)")
+        if not t_end > 0:
+            return ThermalResult.na("말단 차단시간(t_end)은 0보다 커야 합니다.")
+        if math.isinf(t_end):
+            return ThermalResult(
+                Status.FAIL,
+                reason=(
+                    "단열(adiabatic) 열적 검토 결과\n"
+                    f"- 말단 고장전류 {I_end:,.0f} A가 차단기 픽업 이하 → 미동작(차단시간 ∞)\n"
+                    "- 말단 단락 시 케이블 열적 보호 불가"
+                ),
+            )
+        lhs_end = I_end * math.sqrt(t_end)
+        fault_end = "말단" if lhs_end > lhs else "송전단"
+        lhs = max(lhs, lhs_end)
+
+    return ThermalResult(
+        Status.OK if lhs <= rhs else Status.FAIL,
+        lhs=lhs,
+        rhs=rhs,
+        k=k,
+        S=S,
+        t_used=t,
+        t_clear_input=t_clear_input,
+        t_trip_est=t_trip_est,
+        t_clear_policy=t_clear_policy,
+        t_end=t_end,
+        fault_end=fault_end,
+    )
 
-    status = "적합" if lhs <= rhs else "부적합"
-
-    input_txt = "-" if t_clear_input is None else f"{float(t_clear_input):.3f}s"
-    tcc_txt = "-" if t_trip_est is None else f"{float(t_trip_est):.3f}s"
-
-    return {
-        "status": status,
-        "reason": (
-            "단열(adiabatic) 열적 검토 결과\n"
-            f"- I·√t_used = {lhs:,.0f}\n"
-            f"- k·S = {rhs:,.0f}  (k={k}, S={S:.0f}mm²)\n"
-            f"- t_clear 입력 = {input_txt}\n"
-            f"- TCC 추정 = {tcc_txt}\n"
-            f"- t_used = {t:.3f}s ({t_clear_policy})"
-        ),
-        "detail": {"lhs": lhs, "rhs": rhs, "k": k, "S": S, "t_used": t, "t_clear_input": t_clear_input, "t_trip_est": t_trip_est},
-    }
+
+# =========================
+# 케이블 결과 캐시 (hard/op 공용)
+# =========================
+CABLE_CACHE_SIZE = 4096
+AMBIENT_ROUND_DIGITS = 1
+
+
+def _cable_cache_key(I_load, material, insulation, install, ambient, parallel,
+                     mode, section_mm2_input, standard, table_profile, design_margin,
+                     length_m=None, Isc_A=None, t_clear_s=None, V_kV=None, trip=None):
+    """
+    정규화된 캐시 키(정규화 불가 입력이면 None → 캐시 우회)
+    - 주위온도는 0.1℃ 단위로 반올림(기상 데이터 분해능)
+    - KESC는 프로파일을 KESC_DEFAULT로 고정하므로 키도 동일하게 정규화
+    """
+    if None in (material, insulation, install, ambient, parallel):
+        return None
+    try:
+        I_load = float(I_load)
+        ambient = round(float(ambient), AMBIENT_ROUND_DIGITS)
+        parallel = max(int(parallel), 1)
+        dm = float(design_margin) if design_margin is not None else 1.25
+        S = float(section_mm2_input) if section_mm2_input is not None else None
+    except Exception:
+        return None
+
+    if dm <= 0:
+        dm = 1.25
+    if str(standard).upper().strip() == "KESC":
+        prof = "KESC_DEFAULT"
+    else:
+        prof = (str(table_profile).upper().strip() if table_profile is not None else "") or "IEC_CONSERVATIVE"
+    mode = str(mode).upper()
+    if mode != "MANUAL":
+        S = None
+
+    sc = _feeder_sc_inputs(length_m, Isc_A, V_kV, t_clear_s, material, insulation, trip)
+    sc = sc[:4] + sc[5:] if sc is not None else (None, None, None, None, None)
+
+    return (
+        str(material), str(insulation), str(install), parallel, prof,
+        ambient, I_load, dm, mode, S) + sc + (registry_generation(),)
+
+
+@lru_cache(maxsize=CABLE_CACHE_SIZE)
+def _cable_adv_cached(material, insulation, install, parallel, profile,
+                      ambient, I_load, dm, mode, S, length_m, Isc_A, V_kV, t_clear_s, trip, generation):
+    return cable_allowable_current_adv(
+        I_load=I_load,
+        material=material,
+        insulation=insulation,
+        install=install,
+        ambient=ambient,
+        parallel=parallel,
+        mode=mode,
+        section_mm2_input=S,
+        standard="IEC",
+        table_profile=profile,
+        design_margin=dm,
+        length_m=length_m,
+        Isc_A=Isc_A,
+        t_clear_s=t_clear_s,
+        V_kV=V_kV,
+        trip=trip,
+    )
+
+
+def _cable_adv_memo(**kwargs):
+    key = _cable_cache_key(**kwargs)
+    if key is None:
+        return cable_allowable_current_adv(**kwargs)
+    return _cable_adv_cached(*key)
+
+
+def cable_cache_info():
+    """functools 캐시 통계(hits/misses/maxsize/currsize)"""
+    return _cable_adv_cached.cache_info()
+
+
+def cable_cache_clear():
+    _cable_adv_cached.cache_clear()
 
 
 def cable_allowable_hard_op(
@@ -395,8 +546,18 @@ def cable_allowable_hard_op(
     standard="KESC",
     table_profile=None,
     design_margin=1.25,
+    length_m=None,
+    Isc_A=None,
+    t_clear_s=None,
+    V_kV=None,
+    trip=None,
 ):
-    hard = cable_allowable_current_adv(
+    """
+    반환: (hard, op) — hard는 30℃ 고정 판정, op는 운영온도 평가
+    length_m/Isc_A/t_clear_s/V_kV/trip은 cable_allowable_current_adv의 말단 Isc·단락열 선정 조건(양쪽 공통)
+    """
+    feeder = {"length_m": length_m, "Isc_A": Isc_A, "t_clear_s": t_clear_s, "V_kV": V_kV, "trip": trip}
+    hard = _cable_adv_memo(
         I_load=I_load,
         material=material,
         insulation=insulation,
@@ -408,35 +569,28 @@ def cable_allowable_hard_op(
         standard=standard,
         table_profile=table_profile,
         design_margin=design_margin,
+        **feeder,
     )
 
     if ambient_op is None:
-        op = {
-            "status": "평가 불가",
-            "reason": "운영 온도 데이터 없음(기상/수동 미확정)",
-            "ambient": None,
-            "k_temp": None,
-            "I_allow_total": None,
-            "I_allow_single": None,
-            "table_profile_used": hard.get("table_profile_used"),
-        }
+        op = CableOpResult(
+            Status.NA,
+            table_profile_used=hard.get("table_profile_used"),
+            reason="운영 온도 데이터 없음(기상/수동 미확정)",
+        )
         return hard, op
 
     try:
-        ambient_op = float(ambient_op)
+        ambient_op = round(float(ambient_op), AMBIENT_ROUND_DIGITS)
     except Exception:
-        op = {
-            "status": "평가 불가",
-            "reason": "운영 온도 형식 오류",
-            "ambient": None,
-            "k_temp": None,
-            "I_allow_total": None,
-            "I_allow_single": None,
-            "table_profile_used": hard.get("table_profile_used"),
-        }
+        op = CableOpResult(
+            Status.NA,
+            table_profile_used=hard.get("table_profile_used"),
+            reason="운영 온도 형식 오류",
+        )
         return hard, op
 
-    op_raw = cable_allowable_current_adv(
+    op_raw = _cable_adv_memo(
         I_load=I_load,
         material=material,
         insulation=insulation,
@@ -448,15 +602,244 @@ def cable_allowable_hard_op(
         standard=standard,
         table_profile=table_profile,
         design_margin=design_margin,
+        **feeder,
     )
 
-    op = {
-        "status": "규정 충족" if op_raw["status"] == "적합" else ("규정 미달" if op_raw["status"] == "부적합" else "평가 불가"),
-        "ambient": ambient_op,
-        "k_temp": op_raw.get("k_temp"),
-        "I_allow_total": op_raw.get("I_allow_total"),
-        "I_allow_single": op_raw.get("I_allow_single"),
-        "table_profile_used": op_raw.get("table_profile_used"),
-        "reason": op_raw.get("reason"),
-    }
+    op = CableOpResult.from_cable(ambient_op, op_raw)
     return hard, op
+
+
+# =========================
+# Batch (vectorized) API
+# =========================
+MATERIAL_CODES = ("Cu", "Al")
+INSULATION_CODES = ("XLPE", "PVC")
+INSTALL_CODES = ("트레이", "덕트", "매설")
+
+# 코드 배열 인덱스: 0..n-1 = 위 튜플 순서, n = 기타(목록 외 문자열), -1 = 미입력
+_K_MAT = np.array([1.0, 0.8, 0.8])
+_K_INS = np.array([1.0, 0.9, 0.9])
+_K_INST = np.array([1.0, 0.85, 0.75, 0.75])
+_K_GROUP = np.array([1.0, 1.0, 0.90, 0.85, 0.80, 0.78, 0.76, 0.75])
+
+STATUS_OK = int(Status.OK)
+STATUS_FAIL = int(Status.FAIL)
+STATUS_NA = int(Status.NA)
+
+
+def _encode_codes(values, codes, n):
+    """
+    문자열/코드 배열 → int 코드 배열(길이 n)
+    - 정수 배열이면 그대로 사용(-1=미입력)
+    - 문자열이면 codes 순서로 매핑, 목록 외 값은 len(codes), None은 -1
+    """
+    if values is None:
+        return np.full(n, -1, dtype=np.int64)
+    if isinstance(values, str):
+        return np.full(n, codes.index(values) if values in codes else len(codes), dtype=np.int64)
+    arr = np.asarray(values)
+    if arr.dtype.kind in "iu":
+        return np.broadcast_to(arr.astype(np.int64), (n,))
+
+    arr = np.broadcast_to(arr, (n,))
+    # 고정폭 문자열 배열은 그대로 정렬(object → str 변환 비용 회피)
+    uniq, inv = np.unique(arr if arr.dtype.kind == "U" else arr.astype(object).astype(str), return_inverse=True)
+    lut = np.array([codes.index(u) if u in codes else len(codes) for u in uniq], dtype=np.int64)
+    out = lut[inv.reshape(-1)]
+    if arr.dtype == object:
+        out[np.array([v is None for v in arr], dtype=bool)] = -1
+    return out
+
+
+def _batch_len(*values):
+    n = 1
+    for v in values:
+        if v is None or isinstance(v, str):
+            continue
+        if np.ndim(v) > 0:
+            n = max(n, len(v))
+    return n
+
+
+def _code_name(codes, c):
+    return codes[c] if 0 <= c < len(codes) else None
+
+
+def _temp_factor_30_base_arr(ambient_c, ins=None):
+    """
+    _temp_factor_30_base의 배열 버전
+    ins: INSULATION_CODES 코드 배열(None이면 전부 XLPE). XLPE(0) 외 코드는 PVC 표
+    """
+    ambient_c = np.asarray(ambient_c, dtype=float)
+    k_xlpe = _temp_factor_30_base(ambient_c, "XLPE")
+    if ins is None:
+        return np.asarray(k_xlpe, dtype=float)
+    return np.where(np.asarray(ins) == 0, k_xlpe, _temp_factor_30_base(ambient_c, "PVC"))
+
+
+def cable_allowable_current_batch(
+    I_load,
+    material,
+    insulation,
+    install,
+    ambient,
+    parallel,
+    mode="AUTO",
+    section_mm2_input=None,
+    table=None,
+    standard="KESC",
+    table_profile=None,
+    design_margin=1.25,
+):
+    """
+    cable_allowable_current_adv의 배열 버전(피더 N개를 한 번에)
+    - 입력: 길이 N 배열 또는 스칼라(브로드캐스트). 재질/절연/설치는 문자열 또는 코드(MATERIAL_CODES 등 인덱스)
+    - mode: "AUTO"/"MANUAL" 스칼라 또는 배열(행별 혼합 가능)
+    - 미입력은 None(코드 -1) / NaN 으로 표현
+    반환: CableBatchResult (컬럼 이름으로 배열 접근, records()/row(i) 제공)
+      status(STATUS_OK/FAIL/NA), section_mm2_used, I_allow_single, I_allow_total,
+      k_temp, I_design_A, parallel, table_profile_used
+    판정/단면적은 스칼라 함수와 비트 단위로 동일하다(같은 연산 순서 사용).
+    """
+    n = _batch_len(I_load, material, insulation, install, ambient, parallel, mode, section_mm2_input, design_margin)
+
+    I_load = np.asarray(I_load if I_load is not None else np.nan, dtype=float)
+    ambient = np.asarray(ambient if ambient is not None else np.nan, dtype=float)
+    par_in = np.asarray(parallel if parallel is not None else np.nan, dtype=float)
+
+    I_load = np.broadcast_to(I_load, (n,))
+    ambient = np.broadcast_to(ambient, (n,))
+    par_in = np.broadcast_to(par_in, (n,))
+
+    mat = _encode_codes(material, MATERIAL_CODES, n)
+    ins = _encode_codes(insulation, INSULATION_CODES, n)
+    inst = _encode_codes(install, INSTALL_CODES, n)
+
+    if isinstance(mode, str) or mode is None:
+        is_manual = np.full(n, str(mode).upper() == "MANUAL")
+    elif np.asarray(mode).dtype == bool:
+        is_manual = np.broadcast_to(np.asarray(mode), (n,))
+    else:
+        uniq, inv = np.unique(np.asarray(mode).astype(str), return_inverse=True)
+        lut = np.array([u.upper() == "MANUAL" for u in uniq], dtype=bool)
+        is_manual = np.broadcast_to(lut[inv.reshape(-1)], (n,))
+
+    if section_mm2_input is None:
+        S_in = np.full(n, np.nan)
+    else:
+        S_in = np.broadcast_to(np.asarray(section_mm2_input, dtype=float), (n,))
+
+    if design_margin is None:
+        dm = np.full(n, 1.25)
+    else:
+        dm = np.broadcast_to(np.asarray(design_margin, dtype=float), (n,)).copy()
+        dm[~(dm > 0)] = 1.25
+
+    missing = (mat < 0) | (ins < 0) | (inst < 0) | np.isnan(ambient) | np.isnan(par_in) | np.isnan(I_load)
+
+    par = np.where(np.isnan(par_in), 1, par_in).astype(np.int64)
+    par[par <= 0] = 1
+
+    k_mat = _K_MAT[np.clip(mat, 0, None)]
+    k_ins = _K_INS[np.clip(ins, 0, None)]
+    k_inst = _K_INST[np.clip(inst, 0, None)]
+    k_temp = _temp_factor_30_base_arr(np.where(np.isnan(ambient), 30.0, ambient), ins)
+    k_group = _K_GROUP[np.clip(par, 0, len(_K_GROUP) - 1)]
+    par_f = par.astype(float)
+
+    I_design = I_load * dm
+
+    def _total(b, rows):
+        single = b * k_mat[rows] * k_ins[rows] * k_inst[rows] * k_temp[rows]
+        return single, single * par_f[rows] * k_group[rows]
+
+    status = np.full(n, STATUS_NA, dtype=np.int8)
+    section_used = np.full(n, np.nan)
+    single_out = np.full(n, np.nan)
+    total_out = np.full(n, np.nan)
+    mm2_table = np.full(n, np.nan)
+
+    # 레지스트리 테이블은 (재질, 절연, 설치)별로 다를 수 있으므로 조합 → 테이블로 묶어서 처리
+    valid = ~missing
+    groups = {}
+    if table is not None:
+        tbl, profile_used = _resolve_table(table, table_profile, standard)
+        groups[id(tbl)] = (tbl, valid)
+    else:
+        combo = (mat * 16 + ins) * 16 + inst
+        # 조합 코드는 작은 정수이므로 정렬(np.unique) 대신 bincount로 존재하는 조합만 추림
+        for c in np.flatnonzero(np.bincount(combo[valid])) if valid.any() else ():
+            m_i, rest = divmod(int(c), 256)
+            i_i, s_i = divmod(rest, 16)
+            tbl, profile_used = _resolve_table(
+                None, table_profile, standard,
+                _code_name(MATERIAL_CODES, m_i), _code_name(INSULATION_CODES, i_i), _code_name(INSTALL_CODES, s_i),
+            )
+            sel = valid & (combo == c)
+            if id(tbl) in groups:
+                groups[id(tbl)] = (tbl, groups[id(tbl)][1] | sel)
+            else:
+                groups[id(tbl)] = (tbl, sel)
+        if not groups:
+            _, profile_used = _resolve_table(None, table_profile, standard)
+
+    for tbl, sel in groups.values():
+        sections, base, base_cummax = tbl.sections, tbl.ampacity, tbl.ampacity_cummax
+        nt = len(tbl)
+
+        # ---- MANUAL: S 이상인 첫 테이블 단면적(없으면 최대)
+        man = np.flatnonzero(sel & is_manual & (S_in > 0))
+        if man.size:
+            idx = np.minimum(np.searchsorted(sections, S_in[man], side="left"), nt - 1)
+            single, total = _total(base[idx], man)
+            status[man] = np.where(I_design[man] <= total, STATUS_OK, STATUS_FAIL)
+            section_used[man] = S_in[man]
+            mm2_table[man] = sections[idx]
+            single_out[man] = single
+            total_out[man] = total
+
+        # ---- AUTO: I_design <= total 인 첫 단면적
+        auto = np.flatnonzero(sel & ~is_manual)
+        if auto.size:
+            denom = k_mat[auto] * k_ins[auto] * k_inst[auto] * k_temp[auto] * par_f[auto] * k_group[auto]
+            idx = np.searchsorted(base_cummax, I_design[auto] / denom, side="left")
+
+            # 나눗셈 반올림 오차 보정: 곱셈 결과는 base에 대해 단조이므로 한 칸씩 이동하며 수렴
+            while True:
+                r = np.flatnonzero(idx < nt)
+                bad = r[I_design[auto[r]] > _total(base_cummax[idx[r]], auto[r])[1]]
+                if bad.size == 0:
+                    break
+                idx[bad] += 1
+            while True:
+                r = np.flatnonzero(idx > 0)
+                back = r[I_design[auto[r]] <= _total(base_cummax[idx[r] - 1], auto[r])[1]]
+                if back.size == 0:
+                    break
+                idx[back] -= 1
+
+            found = idx < nt
+            pick = np.where(found, idx, nt - 1)
+            single, total = _total(base[pick], auto)
+            status[auto] = np.where(found, STATUS_OK, STATUS_FAIL)
+            section_used[auto] = sections[pick]
+            mm2_table[auto] = sections[pick]
+            single_out[auto] = single
+            total_out[auto] = total
+
+    return CableBatchResult(
+        status=status,
+        section_mm2_used=section_used,
+        I_allow_single=single_out,
+        I_allow_total=total_out,
+        k_temp=np.where(missing, np.nan, k_temp),
+        I_design_A=np.where(missing, np.nan, I_design),
+        parallel=np.where(missing, 0, par),
+        table_profile_used=profile_used,
+        I_load=I_load,
+        S_in=S_in,
+        mm2_table=mm2_table,
+        k_group=k_group,
+        is_manual=is_manual,
+        design_margin=dm,
+    )
@@ -0,0 +1,250 @@
+# calculations/headroom.py
+"""
+역산(여유 한계) 계산 — PASS/FAIL 대신 '얼마나 남았는지'
+
+- 최대 부하전류: I_allow_total / 설계여유계수 (운영온도 / Hard 30℃)
+- 한계 주위온도: k_temp(T) ≥ I_design / I_allow(30℃) 를 만족하는 최대 T (온도보정 표 구간 역보간)
+- 필요 최소 Icu: Isc × 계수(IEC 1.1) — breaker_judgement의 역
+- 최대 허용 차단시간: (k·S / Isc)² — thermal_adiabatic_check의 역
+- 단락열 최소 단면적: Isc·√t / k
+
+모든 함수는 자산 배열(스칼라는 브로드캐스트)에 대해 한 번에 계산하며, 미입력은 NaN.
+한계 주위온도는 'T 이하에서 적합'의 T이며, 온도보정 표 끝값에서도 충족하면 표 최고온도
+(XLPE 80℃ / PVC 60℃, ambient_max_at_end=True — 그 이상은 표 밖이라 보장하지 않음),
+30℃ 이하에서도 부적합이면 -inf.
+"""
+import math
+
+import numpy as np
+
+from calculations.cable_correction import REFERENCE_AIR, ambient_for_factor, breakpoints
+from calculations.engineering import (
+    ADIABATIC_K,
+    INSTALL_CODES,
+    INSULATION_CODES,
+    MATERIAL_CODES,
+    _batch_len,
+    _encode_codes,
+    _temp_insulation,
+    cable_allowable_current_batch,
+)
+
+
+AMBIENT_REF_C = 30.0
+
+
+def _arr(x):
+    return np.asarray(np.nan if x is None else x, dtype=float)
+
+
+def _breaker_margin(standard):
+    return 1.1 if str(standard).upper() == "IEC" else 1.0
+
+
+def min_breaker_icu(Isc_A, standard="KESC"):
+    """필요 최소 Icu [kA] (breaker_judgement가 적합이 되는 최소값)"""
+    return _arr(Isc_A) * _breaker_margin(standard) / 1000.0
+
+
+def max_fault_current(breaker_kA, standard="KESC"):
+    """차단기 Icu로 감당 가능한 최대 Isc [A]"""
+    return _arr(breaker_kA) * 1000.0 / _breaker_margin(standard)
+
+
+# (MATERIAL_CODES × INSULATION_CODES) → k, 목록 외/미입력 코드는 NaN
+_K_ADIABATIC = np.full((len(MATERIAL_CODES) + 2, len(INSULATION_CODES) + 2), np.nan)
+for (_m, _i), _k in ADIABATIC_K.items():
+    _K_ADIABATIC[MATERIAL_CODES.index(_m), INSULATION_CODES.index(_i)] = _k
+
+
+def _adiabatic_k(material, insulation):
+    """재질/절연(스칼라 또는 배열) → 단열 k (미매핑 NaN)"""
+    if not isinstance(material, (list, tuple, np.ndarray)) and not isinstance(insulation, (list, tuple, np.ndarray)):
+        return ADIABATIC_K.get((material, insulation), np.nan)
+    n = _batch_len(material, insulation)
+    # 정수 배열은 이미 코드(-1=미입력)
+    m = _encode_codes(material, MATERIAL_CODES, n)
+    i = _encode_codes(insulation, INSULATION_CODES, n)
+    return _K_ADIABATIC[m, i]
+
+
+def max_clearing_time(Isc_A, section_mm2, material, insulation):
+    """단락열 기준 최대 허용 차단시간 [s]: I²t ≤ (kS)²"""
+    Isc = _arr(Isc_A)
+    S = _arr(section_mm2)
+    k = _adiabatic_k(material, insulation)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where((Isc > 0) & (S > 0), (k * S / Isc) ** 2, np.nan)
+
+
+def min_thermal_section(Isc_A, t_clear_s, material, insulation):
+    """단락열 기준 최소 단면적 [mm²]: S ≥ I·√t / k"""
+    Isc = _arr(Isc_A)
+    t = _arr(t_clear_s)
+    k = _adiabatic_k(material, insulation)
+    with np.errstate(invalid="ignore"):
+        return np.where((Isc > 0) & (t > 0), Isc * np.sqrt(np.where(t > 0, t, np.nan)) / k, np.nan)
+
+
+def max_ambient(k_temp_required, insulation=None):
+    """
+    k_temp(T) ≥ k_temp_required 인 최대 T [℃] (k_temp는 T에 대해 비증가)
+    insulation: 절연 문자열/코드 배열(None이면 XLPE) — 절연별 표를 닫힌 형태로 역보간
+    30℃ 이하 가산 없음 정책: k_temp_required > 1 이면 -inf
+    표 끝값 이하면 표 최고온도(ambient_at_table_end로 구분)
+    """
+    k_req = _arr(k_temp_required)
+    shape = k_req.shape
+    k_req = k_req.reshape(-1)
+    n = k_req.size
+
+    ins = np.zeros(n, dtype=np.int64) if insulation is None else _encode_codes(insulation, INSULATION_CODES, n)
+    out = np.empty(n)
+    xlpe = ins == 0
+    out[xlpe] = ambient_for_factor(k_req[xlpe], _temp_insulation("XLPE"), REFERENCE_AIR)
+    out[~xlpe] = ambient_for_factor(k_req[~xlpe], _temp_insulation(None), REFERENCE_AIR)
+    out[k_req > 1.0] = -np.inf
+    return out.reshape(shape)
+
+
+def ambient_at_table_end(k_temp_required, insulation=None):
+    """max_ambient가 표 최고온도에서 잘린 자산(k_temp_required ≤ 표 끝 계수) — 'T 이상'으로 표시"""
+    k_req = _arr(k_temp_required)
+    shape = k_req.shape
+    k_req = k_req.reshape(-1)
+    n = k_req.size
+
+    ins = np.zeros(n, dtype=np.int64) if insulation is None else _encode_codes(insulation, INSULATION_CODES, n)
+    k_end = np.where(
+        ins == 0,
+        breakpoints(_temp_insulation("XLPE"), REFERENCE_AIR)[1][-1],
+        breakpoints(_temp_insulation(None), REFERENCE_AIR)[1][-1],
+    )
+    return (k_req <= k_end).reshape(shape)
+
+
+def headroom_batch(
+    I_load,
+    material,
+    insulation,
+    install,
+    ambient,
+    parallel,
+    section_mm2,
+    Isc_A=None,
+    breaker_kA=None,
+    t_clear_s=None,
+    standard="KESC",
+    table_profile=None,
+    design_margin=1.25,
+):
+    """
+    자산 배열의 여유 한계를 한 번에 계산 (입력 규약은 cable_allowable_current_batch와 동일)
+    section_mm2: 현재(또는 선정된) 단면적 — 케이블 한계는 이 단면적 기준
+    반환 dict(배열):
+      I_allow_total / I_load_max / I_load_headroom        (운영온도 ambient 기준)
+      I_allow_total_30 / I_load_max_30 / I_load_headroom_30 (Hard 30℃)
+      ambient_max / ambient_max_at_end(표 최고온도에서 잘림)
+      Icu_min_kA / Icu_headroom_kA / Isc_max_A
+      t_clear_max_s / S_min_thermal_mm2
+    """
+    I_load = _arr(I_load)
+    dm = _arr(design_margin if design_margin is not None else 1.25)
+    dm = np.where(dm > 0, dm, 1.25)
+
+    # 문자열 → 코드 변환은 한 번만(운영/30℃ 두 번의 배치 호출과 k 조회에서 공유)
+    n = _batch_len(I_load, material, insulation, install, ambient, parallel, section_mm2)
+    material = _encode_codes(material, MATERIAL_CODES, n)
+    insulation = _encode_codes(insulation, INSULATION_CODES, n)
+    install = _encode_codes(install, INSTALL_CODES, n)
+
+    common = dict(
+        material=material,
+        insulation=insulation,
+        install=install,
+        parallel=parallel,
+        mode="MANUAL",
+        section_mm2_input=section_mm2,
+        standard=standard,
+        table_profile=table_profile,
+        design_margin=dm,
+    )
+    # 허용전류는 부하와 무관 → 부하 0으로 한 번씩(운영/30℃) 계산
+    zero = np.zeros(n)
+    op = cable_allowable_current_batch(I_load=zero, ambient=ambient, **common)
+    hard = cable_allowable_current_batch(I_load=zero, ambient=AMBIENT_REF_C, **common)
+
+    allow = op["I_allow_total"]
+    allow_30 = hard["I_allow_total"]
+    I_max = allow / dm
+    I_max_30 = allow_30 / dm
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k_req = np.where(allow_30 > 0, I_load * dm / allow_30, np.nan)
+    amb_max = max_ambient(k_req, insulation)
+    amb_end = ambient_at_table_end(k_req, insulation)
+
+    Icu_min = min_breaker_icu(Isc_A, standard)
+    Isc_max = max_fault_current(breaker_kA, standard)
+
+    return {
+        "I_allow_total": allow,
+        "I_load_max": I_max,
+        "I_load_headroom": I_max - I_load,
+        "I_allow_total_30": allow_30,
+        "I_load_max_30": I_max_30,
+        "I_load_headroom_30": I_max_30 - I_load,
+        "ambient_max": amb_max,
+        "ambient_max_at_end": amb_end,
+        "Icu_min_kA": Icu_min,
+        "Icu_headroom_kA": _arr(breaker_kA) - Icu_min,
+        "Isc_max_A": Isc_max,
+        "t_clear_max_s": max_clearing_time(Isc_A, section_mm2, material, insulation),
+        "S_min_thermal_mm2": min_thermal_section(Isc_A, t_clear_s, material, insulation),
+    }
+
+
+def assessment_headroom(res: dict, inputs: dict) -> dict:
+    """
+    run_assessment 결과 1건 + 입력(merged) → 스칼라 여유 한계 dict (결과 페이지 카드용)
+    케이블 한계는 판정에 쓰인 단면적(section_mm2_used), 단락열은 말단 Isc(있으면) 기준
+    """
+    cable_hard = res.get("cable_hard") or {}
+    section = cable_hard.get("section_mm2_used")
+    Isc = res.get("Isc_A")
+    Isc_thermal = res.get("Isc_end_A") if res.get("Isc_end_A") is not None else Isc
+    ambient = inputs.get("cable_ambient")
+
+    h = headroom_batch(
+        I_load=res.get("I_load"),
+        material=inputs.get("cable_material"),
+        insulation=inputs.get("cable_insulation"),
+        install=inputs.get("cable_install"),
+        ambient=ambient,
+        parallel=inputs.get("cable_parallel"),
+        section_mm2=section,
+        Isc_A=Isc,
+        breaker_kA=inputs.get("breaker"),
+        t_clear_s=res.get("t_clear_used"),
+        standard=res.get("standard", "KESC"),
+        table_profile=inputs.get("cable_table_profile"),
+        design_margin=res.get("design_margin"),
+    )
+    out = {k: float(np.asarray(v).reshape(-1)[0]) for k, v in h.items()}
+
+    # 단락열 항목은 말단 Isc 기준으로 다시(차단기 항목은 모선 Isc 유지)
+    if Isc_thermal is not None and Isc_thermal != Isc:
+        out["t_clear_max_s"] = float(max_clearing_time(
+            Isc_thermal, section, inputs.get("cable_material"), inputs.get("cable_insulation")))
+        # 최소 단면적은 송전단(t_used)·말단(t_clear_end) 고장 중 큰 쪽 — 말단 미동작이면 inf
+        t_end = res.get("t_clear_end")
+        s_end = min_thermal_section(
+            Isc_thermal, t_end if t_end is not None else res.get("t_clear_used"),
+            inputs.get("cable_material"), inputs.get("cable_insulation"))
+        out["S_min_thermal_mm2"] = float(np.fmax(h["S_min_thermal_mm2"], s_end).reshape(-1)[0])
+
+    out["ambient_op"] = None if ambient is None else float(ambient)
+    out["section_mm2"] = None if section is None else float(section)
+    out["t_clear_used"] = res.get("t_clear_used")
+    out["breaker_kA"] = None if inputs.get("breaker") is None else float(inputs.get("breaker"))
+    return {k: (None if isinstance(v, float) and math.isnan(v) else v) for k, v in out.items()}
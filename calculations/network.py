@@ -0,0 +1,339 @@
+# calculations/network.py
+"""
+방사형 배전망 3상 단락전류 해석 (per-unit, 희소행렬)
+
+short_circuit_current(V, S, Z%)는 무한모선 뒤 변압기 1대만 보므로
+긴 피더 말단의 Isc를 과대평가하고 병렬 변압기를 반영하지 못한다.
+여기서는 모선/지로(전원, 변압기, 케이블)로 계통을 구성하고 모든 모선의 Isc를 한 번에 구한다.
+
+- 전원: 계통 단락용량 MVAsc, X/R (미입력 시 무한모선)
+- 변압기: kVA, Z%, X/R, 병렬 대수(같은 모선 쌍의 지로는 병렬 합성)
+- 케이블: 길이(m), 단면적/재질 → cable_impedance(Ω/km) 또는 r/x 직접 입력, 병렬 조수
+- 방사형(단일 전원, 트리): BFS 순서의 지로-모선 행렬 L(하삼각)을 한 번 구성해
+  spsolve_triangular 1회로 Zbus 대각(전원→모선 경로 임피던스 합)을 계산
+- 루프/다중 전원: Ybus를 splu로 1회 분해 후 단위벡터 블록 풀이로 Zbus 대각(소규모 계통용)
+
+Isc = c / |Z_ii| × I_base,  I_base = S_base / (√3·V_base)
+(변압기 1대 + 무한모선이면 short_circuit_current와 같은 값, 무한모선 자체의 Isc는 inf)
+모선별 결과는 run_assessment의 Isc_local_A 입력이나 network_checks()로 판정에 사용
+"""
+import math
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import breadth_first_order
+from scipy.sparse.linalg import splu, spsolve_triangular
+
+from calculations.cable_tables import cable_impedance
+from calculations.engineering import ADIABATIC_K, TRANSFORMER_X_R
+from calculations.results import Status
+
+
+BASE_MVA = 100.0
+SOURCE_X_R = 10.0
+# 0 임피던스 지로(모선 연결) / 무한모선을 Ybus에 넣을 때 쓰는 대체값(pu)
+Z_TIE_PU = 1e-9
+MESH_BLOCK = 256
+
+BRANCH_TRANSFORMER = "TR"
+BRANCH_CABLE = "CABLE"
+BRANCH_IMPEDANCE = "Z"
+
+
+def _split_rx(z_abs, x_r):
+    """|Z|와 X/R → 복소 임피던스"""
+    x_r = float(x_r) if x_r is not None and float(x_r) > 0 else 0.0
+    r = z_abs / math.sqrt(1.0 + x_r * x_r)
+    return complex(r, r * x_r)
+
+
+class RadialNetwork:
+    """
+    모선/지로 목록(추가 순서 유지) → solve()에서 배열로 컴파일
+    모선 id는 임의의 hashable(자산 ID, 문자열 등)
+    """
+
+    def __init__(self, base_mva: float = BASE_MVA):
+        self.base_mva = float(base_mva)
+        self.bus_ids = []
+        self._bus_index = {}
+        self._bus_kv = []
+        self._bus_breaker_ka = []
+        self._sources = []        # (bus_idx, z_pu)
+        self._br_from = []
+        self._br_to = []
+        self._br_z = []           # complex pu
+        self._br_kind = []
+        self._cables = []         # (branch_idx, material, insulation, section_mm2)
+
+    # ---- 구성
+    def add_bus(self, bus_id, kV: float, breaker_kA: float = None) -> int:
+        if bus_id in self._bus_index:
+            raise ValueError(f"중복 모선: {bus_id}")
+        idx = len(self.bus_ids)
+        self._bus_index[bus_id] = idx
+        self.bus_ids.append(bus_id)
+        self._bus_kv.append(float(kV))
+        self._bus_breaker_ka.append(np.nan if breaker_kA is None else float(breaker_kA))
+        return idx
+
+    def bus_index(self, bus_id) -> int:
+        try:
+            return self._bus_index[bus_id]
+        except KeyError:
+            raise KeyError(f"등록되지 않은 모선: {bus_id}") from None
+
+    def add_source(self, bus_id, mva_sc: float = None, x_r: float = SOURCE_X_R):
+        """mva_sc 미입력/0 이하 → 무한모선"""
+        b = self.bus_index(bus_id)
+        if mva_sc is None or not (float(mva_sc) > 0):
+            z = 0j
+        else:
+            z = _split_rx(self.base_mva / float(mva_sc), x_r)
+        self._sources.append((b, z))
+
+    def _add_branch(self, from_bus, to_bus, z_pu, kind):
+        self._br_from.append(self.bus_index(from_bus))
+        self._br_to.append(self.bus_index(to_bus))
+        self._br_z.append(complex(z_pu))
+        self._br_kind.append(kind)
+        return len(self._br_z) - 1
+
+    def add_transformer(self, from_bus, to_bus, kVA: float, z_pct: float,
+                        x_r: float = TRANSFORMER_X_R, count: int = 1):
+        """변압기 정격전압 = 양단 모선 기준전압으로 가정, count대 동일 병렬"""
+        if not (float(kVA) > 0 and float(z_pct) > 0):
+            raise ValueError("변압기 kVA/Z%는 0보다 커야 합니다.")
+        z_abs = (float(z_pct) / 100.0) * (self.base_mva / (float(kVA) / 1000.0))
+        n = max(1, int(count or 1))
+        return self._add_branch(from_bus, to_bus, _split_rx(z_abs, x_r) / n, BRANCH_TRANSFORMER)
+
+    def add_cable(self, from_bus, to_bus, length_m: float, section_mm2: float = None,
+                  material: str = "Cu", insulation: str = "XLPE", parallel: int = 1,
+                  r_ohm_km: float = None, x_ohm_km: float = None):
+        """r/x 미입력 시 cable_impedance(재질, 단면적) 사용"""
+        if r_ohm_km is None or x_ohm_km is None:
+            if section_mm2 is None:
+                raise ValueError("케이블 단면적 또는 r/x(Ω/km)가 필요합니다.")
+            r_tab, x_tab = cable_impedance(material, section_mm2)
+            r_ohm_km = float(r_tab) if r_ohm_km is None else float(r_ohm_km)
+            x_ohm_km = float(x_tab) if x_ohm_km is None else float(x_ohm_km)
+        n = max(1, int(parallel or 1))
+        kv = self._bus_kv[self.bus_index(from_bus)]
+        z_ohm = complex(r_ohm_km, x_ohm_km) * (float(length_m) / 1000.0) / n
+        br = self._add_branch(from_bus, to_bus, z_ohm * self.base_mva / (kv * kv), BRANCH_CABLE)
+        self._cables.append((br, material, insulation, np.nan if section_mm2 is None else float(section_mm2)))
+        return br
+
+    def add_impedance(self, from_bus, to_bus, r_ohm: float, x_ohm: float):
+        """일반 직렬 임피던스(Ω, from 모선 전압 기준). 0이면 모선 연결"""
+        kv = self._bus_kv[self.bus_index(from_bus)]
+        return self._add_branch(from_bus, to_bus, complex(r_ohm, x_ohm) * self.base_mva / (kv * kv), BRANCH_IMPEDANCE)
+
+    @classmethod
+    def from_records(cls, buses, branches, sources, base_mva: float = BASE_MVA):
+        """
+        buses:    [{"bus_id", "kV", "breaker_kA"?}]
+        branches: [{"type": "TR"|"CABLE"|"Z", "from", "to", ...add_* 인자}]
+        sources:  [{"bus_id", "mva_sc"?, "x_r"?}]
+        """
+        net = cls(base_mva)
+        for b in buses:
+            net.add_bus(b["bus_id"], b["kV"], b.get("breaker_kA"))
+        for s in sources:
+            net.add_source(s["bus_id"], s.get("mva_sc"), s.get("x_r", SOURCE_X_R))
+        for br in branches:
+            kind = str(br.get("type", BRANCH_CABLE)).upper()
+            args = {k: v for k, v in br.items() if k not in ("type", "from", "to")}
+            if kind == BRANCH_TRANSFORMER:
+                net.add_transformer(br["from"], br["to"], **args)
+            elif kind == BRANCH_CABLE:
+                net.add_cable(br["from"], br["to"], **args)
+            else:
+                net.add_impedance(br["from"], br["to"], **args)
+        return net
+
+    def __len__(self):
+        return len(self.bus_ids)
+
+    # ---- 해석
+    def _merged_branches(self):
+        """같은 모선 쌍의 지로를 병렬 합성 → (a, b, z) 배열 (a < b)"""
+        f = np.asarray(self._br_from, dtype=np.int64)
+        t = np.asarray(self._br_to, dtype=np.int64)
+        z = np.asarray(self._br_z, dtype=complex)
+        if f.size == 0:
+            return f, t, z
+        if np.any(f == t):
+            raise ValueError("자기 자신으로 연결된 지로가 있습니다.")
+        a, b = np.minimum(f, t), np.maximum(f, t)
+        key, inv = np.unique(a * len(self.bus_ids) + b, return_inverse=True)
+        inv = inv.reshape(-1)
+        is_tie = z == 0
+        y = np.zeros(z.shape, dtype=complex)
+        y[~is_tie] = 1.0 / z[~is_tie]
+        y_sum = np.zeros(key.size, dtype=complex)
+        np.add.at(y_sum, inv, y)
+        ties = np.bincount(inv, weights=is_tie.astype(float), minlength=key.size) > 0
+        z_eq = np.zeros(key.size, dtype=complex)
+        z_eq[~ties] = 1.0 / y_sum[~ties]
+        n = len(self.bus_ids)
+        return key // n, key % n, z_eq
+
+    def _solve_radial(self, a, b, z, src, z_src):
+        n = len(self.bus_ids)
+        adj = sparse.coo_matrix(
+            (np.arange(1, a.size + 1, dtype=np.int64), (a, b)), shape=(n, n)
+        ).tocsr()
+        adj = adj + adj.T
+        order, pred = breadth_first_order(adj, src, directed=False, return_predecessors=True)
+
+        parent = np.full(n, -1, dtype=np.int64)
+        parent[order] = pred[order]
+        parent[src] = -1
+        reached = np.zeros(n, dtype=bool)
+        reached[order] = True
+
+        # 각 모선의 상위 지로 임피던스(전원 모선은 전원 임피던스)
+        child = order[1:]
+        edge = np.asarray(adj[child, parent[child]]).reshape(-1) - 1
+        z_up = np.zeros(n, dtype=complex)
+        z_up[child] = z[edge]
+        z_up[src] = z_src
+
+        # BFS 순서 좌표에서 L = I - P (P[자식, 부모] = 1) 는 하삼각 → 전진대입 1회로 경로 합
+        m = order.size
+        pos = np.empty(n, dtype=np.int64)
+        pos[order] = np.arange(m)
+        rows = np.concatenate([np.arange(m), pos[child]])
+        cols = np.concatenate([np.arange(m), pos[parent[child]]])
+        vals = np.concatenate([np.ones(m), -np.ones(child.size)])
+        L = sparse.csr_matrix((vals, (rows, cols)), shape=(m, m))
+        rhs = np.column_stack([z_up[order].real, z_up[order].imag])
+        path = spsolve_triangular(L, rhs, lower=True)
+
+        z_th = np.full(n, np.nan + 0j)
+        z_th[order] = path[:, 0] + 1j * path[:, 1]
+        return z_th, parent, reached
+
+    def _solve_mesh(self, a, b, z):
+        n = len(self.bus_ids)
+        y = 1.0 / np.where(z == 0, Z_TIE_PU, z)
+        diag = np.zeros(n, dtype=complex)
+        np.add.at(diag, a, y)
+        np.add.at(diag, b, y)
+        for bus, zs in self._sources:
+            diag[bus] += 1.0 / (zs if zs != 0 else Z_TIE_PU)
+        Y = sparse.coo_matrix(
+            (np.concatenate([diag, -y, -y]),
+             (np.concatenate([np.arange(n), a, b]), np.concatenate([np.arange(n), b, a]))),
+            shape=(n, n),
+        ).tocsc()
+
+        # 전원과 연결되지 않은 모선은 Ybus가 특이 → 연결 성분으로 걸러냄
+        adj = sparse.coo_matrix((np.ones(a.size), (a, b)), shape=(n, n)).tocsr()
+        reached = np.zeros(n, dtype=bool)
+        for bus, _zs in self._sources:
+            reached[breadth_first_order(adj, bus, directed=False, return_predecessors=False)] = True
+        idx = np.flatnonzero(reached)
+
+        lu = splu(Y[idx][:, idx].tocsc())
+        z_th = np.full(n, np.nan + 0j)
+        m = idx.size
+        for s in range(0, m, MESH_BLOCK):
+            e = min(m, s + MESH_BLOCK)
+            rhs = np.zeros((m, e - s), dtype=complex)
+            rhs[np.arange(s, e), np.arange(e - s)] = 1.0
+            sol = lu.solve(rhs)
+            z_th[idx[s:e]] = sol[np.arange(s, e), np.arange(e - s)]
+        return z_th, np.full(n, -1, dtype=np.int64), reached
+
+    def solve(self, c_factor: float = 1.0) -> dict:
+        """
+        반환 dict:
+          bus_id(list), kV, Z_pu(complex, 고장점 테브난 임피던스), Isc_A,
+          upstream(방사형일 때 상위 모선 인덱스, 그 외 -1), isolated(전원 미연결), method("radial"/"mesh")
+        """
+        n = len(self.bus_ids)
+        if n == 0:
+            raise ValueError("모선이 없습니다.")
+        if not self._sources:
+            raise ValueError("전원(add_source)이 없습니다.")
+
+        a, b, z = self._merged_branches()
+        radial = len(self._sources) == 1 and a.size <= n - 1
+        if radial:
+            src, z_src = self._sources[0]
+            z_th, parent, reached = self._solve_radial(a, b, z, src, z_src)
+            # 간선 수가 n-1 이하라도 도달 모선 사이에 루프가 있으면 트리가 아님
+            if a.size - np.count_nonzero(~reached[a]) != np.count_nonzero(reached) - 1:
+                radial = False
+        if not radial:
+            z_th, parent, reached = self._solve_mesh(a, b, z)
+
+        kv = np.asarray(self._bus_kv, dtype=float)
+        I_base = (self.base_mva * 1e6) / (math.sqrt(3) * kv * 1e3)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Isc = np.where(reached, float(c_factor) / np.abs(z_th) * I_base, np.nan)
+
+        return {
+            "bus_id": list(self.bus_ids),
+            "kV": kv,
+            "Z_pu": z_th,
+            "Isc_A": Isc,
+            "upstream": parent,
+            "isolated": ~reached,
+            "method": "radial" if radial else "mesh",
+        }
+
+    def bus_isc(self, sc: dict, bus_id) -> float:
+        return float(sc["Isc_A"][self.bus_index(bus_id)])
+
+
+def network_checks(net: RadialNetwork, sc: dict, standard: str = "KESC", t_clear_s=None) -> dict:
+    """
+    모선별 국부 Isc로 breaker_judgement / thermal_adiabatic_check를 벡터 평가
+    - 모선: 차단기 Icu(add_bus breaker_kA) ≥ Isc × 계수(IEC 1.1)
+    - 케이블 지로: 양단 중 큰 Isc(송전단 고장)로 Isc·√t ≤ k·S
+    반환: Status 코드 배열(OK/FAIL/NA) + 여유율(비율-1)
+    Isc가 inf(전원 임피던스 0)인 모선과 그 모선에 닿은 케이블은 NA
+    """
+    Isc = np.asarray(sc["Isc_A"], dtype=float)
+    margin = 1.1 if str(standard).upper() == "IEC" else 1.0
+
+    breaker_A = np.asarray(net._bus_breaker_ka, dtype=float) * 1000.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        required = Isc * margin
+        # 임피던스 0 전원 직결 모선(Isc = inf)은 차단 의무 산정 불가 → NEED_MORE
+        b_na = np.isnan(breaker_A) | ~np.isfinite(required)
+        b_status = np.where(b_na, int(Status.NA), np.where(breaker_A >= required, int(Status.OK), int(Status.FAIL)))
+        b_margin = np.where(b_na, np.nan, breaker_A / required - 1.0)
+
+    if net._cables:
+        br = np.array([c[0] for c in net._cables], dtype=np.int64)
+        f = np.asarray(net._br_from, dtype=np.int64)[br]
+        t = np.asarray(net._br_to, dtype=np.int64)[br]
+        S = np.array([c[3] for c in net._cables], dtype=float)
+        k = np.array([ADIABATIC_K.get((c[1], c[2]), np.nan) for c in net._cables], dtype=float)
+        I_cable = np.fmax(Isc[f], Isc[t])
+    else:
+        f = t = np.zeros(0, dtype=np.int64)
+        S = k = I_cable = np.zeros(0)
+
+    t_val = np.nan if t_clear_s is None else float(t_clear_s)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lhs = I_cable * math.sqrt(t_val) if t_val > 0 else np.full(I_cable.shape, np.nan)
+        rhs = k * S
+        c_na = ~np.isfinite(lhs) | np.isnan(rhs) | ~(S > 0)
+        c_status = np.where(c_na, int(Status.NA), np.where(lhs <= rhs, int(Status.OK), int(Status.FAIL)))
+        c_margin = np.where(c_na, np.nan, rhs / lhs - 1.0)
+
+    return {
+        "bus_breaker_status": b_status.astype(np.int8),
+        "bus_breaker_margin": b_margin,
+        "cable_from": f,
+        "cable_to": t,
+        "cable_Isc_A": I_cable,
+        "cable_thermal_status": c_status.astype(np.int8),
+        "cable_thermal_margin": c_margin,
+    }
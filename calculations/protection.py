@@ -1,21 +1,17 @@
-
 import numpy as np
 
+from calculations.tcc import DEFAULT_CURVE, curve_code, trip_time
+
+
+GRADING_MARGIN_S = 0.3
+GRID_POINTS = 240
+
 
 def tcc_curve(I):
     """
-    단순 IEC Inverse 계전 특성 (예시)
+    단순 IEC Inverse 계전 특성 (pickup 1 A, TMS 1 — calculations.tcc.trip_time)
     """
-    k = 0.14
-    alpha = 0.02
-    return k / ((I / 1.0) ** alpha - 1)
-
-
-def relay_coordination(Isc, I_load):
-    status = "정상"
-    if Isc > I_load * 10:
-        status = "즉시 차단 영역"
-    return {"status": status}
+    return trip_time(np.asarray(I, dtype=float), 1.0, 1.0, "IEC_SI")
 
 
 def relay_coordination(I_sc, I_load):
@@ -40,7 +36,275 @@ def relay_coordination(I_sc, I_load):
 
     return result
 
-def relay_coordination(Isc, I_load):
-    if Isc > I_load * 10:
-        return {"status": "협조 양호"}
-    return {"status": "재검토 필요"}
+
+# =========================
+# 직렬 보호기기 협조 검토
+# =========================
+def _col(records, key, default=np.nan):
+    return np.array([np.nan if r.get(key) is None else r.get(key, default) for r in records], dtype=float)
+
+
+def coordination_devices(records):
+    """
+    기기 레코드 목록 → 배열 dict (coordination_study 입력)
+    레코드 키: id, upstream(상위 기기 id, 최상위는 None), pickup, tms, curve,
+              inst_pickup/inst_time(선택), fault_A(설치 위치 최대 고장전류, 선택)
+    직렬 체인은 upstream을 바로 위 기기로 두면 되고, 방사형 트리도 같은 형식.
+    """
+    records = list(records)
+    index = {r["id"]: i for i, r in enumerate(records)}
+    upstream = np.array(
+        [-1 if r.get("upstream") is None else index[r["upstream"]] for r in records],
+        dtype=np.int64,
+    )
+    inst_time = _col(records, "inst_time")
+    return {
+        "id": [r["id"] for r in records],
+        "upstream": upstream,
+        "pickup": _col(records, "pickup"),
+        "tms": _col(records, "tms"),
+        "curve": np.array([curve_code(r.get("curve") or DEFAULT_CURVE) for r in records], dtype=np.int64),
+        "inst_pickup": _col(records, "inst_pickup"),
+        "inst_time": np.where(np.isnan(inst_time), 0.0, inst_time),
+        "fault_A": _col(records, "fault_A"),
+    }
+
+
+def coordination_grid(pickup, fault_A=None, n=GRID_POINTS):
+    """공유 로그 전류 격자: 최소 pickup×0.9 ~ 최대 고장전류(없으면 최대 pickup×30)"""
+    pickup = np.asarray(pickup, dtype=float)
+    lo = np.nanmin(pickup) * 0.9
+    hi = np.nanmax(fault_A) if fault_A is not None and np.isfinite(fault_A).any() else np.nan
+    if not (hi > lo):
+        hi = np.nanmax(pickup) * 30.0
+    return np.logspace(np.log10(lo), np.log10(hi), int(n))
+
+
+def _runs(mask):
+    """(P, N) bool → 연속 True 구간 (행, 시작, 끝) 배열 (끝 포함)"""
+    P, N = mask.shape
+    pad = np.zeros((P, 1), dtype=bool)
+    d = np.diff(np.hstack([pad, mask, pad]).astype(np.int8), axis=1)
+    r0, c0 = np.nonzero(d == 1)
+    r1, c1 = np.nonzero(d == -1)
+    # 행 우선 순서로 시작/끝이 1:1 대응
+    return r0, c0, c1 - 1
+
+
+def coordination_study(devices, I_grid=None, margin_s=GRADING_MARGIN_S, n=GRID_POINTS):
+    """
+    상·하위 기기 쌍(하위 d ↔ upstream[d])의 시간 협조 검토
+    devices: coordination_devices() 결과(또는 같은 키의 배열 dict)
+    - 전 기기 곡선을 공유 로그 격자에서 한 번에 평가: T (D, N)
+    - 쌍 여유 = T[상위] − T[하위], 하위가 동작하고(유한) 하위 최대 고장전류 이하인 전류에서만 검토
+    - 여유 < margin_s 인 격자 구간을 위반으로 보고(고장전류 범위 I_from ~ I_to)
+    반환 dict:
+      I_grid, T, pairs (P, 2: 하위, 상위), margin (P, N: 검토 범위 밖 NaN)
+      min_margin / I_at_min (P,), ok (P,: 검토 구간 없음도 True)
+      violations: [{down, up, I_from_A, I_to_A, min_margin_s}]
+    """
+    up_all = np.asarray(devices["upstream"], dtype=np.int64)
+    pickup = np.asarray(devices["pickup"], dtype=float)
+    fault = devices.get("fault_A")
+    fault = np.full(pickup.shape, np.nan) if fault is None else np.asarray(fault, dtype=float)
+
+    I = coordination_grid(pickup, fault, n) if I_grid is None else np.asarray(I_grid, dtype=float)
+
+    T = trip_time(
+        I[None, :],
+        pickup[:, None],
+        np.asarray(devices["tms"], dtype=float)[:, None],
+        np.asarray(devices["curve"])[:, None],
+        inst_pickup=np.asarray(devices.get("inst_pickup", np.nan), dtype=float).reshape(-1, 1),
+        inst_time=np.asarray(devices.get("inst_time", 0.0), dtype=float).reshape(-1, 1),
+    )
+
+    down = np.flatnonzero(up_all >= 0)
+    up = up_all[down]
+    Td, Tu = T[down], T[up]
+
+    # 하위 기기 위치의 최대 고장전류를 넘는 전류는 그 쌍에서 발생하지 않음
+    f = fault[down, None]
+    in_range = np.isfinite(Td) & (np.isnan(f) | (I[None, :] <= f))
+    with np.errstate(invalid="ignore"):
+        margin = np.where(in_range, Tu - Td, np.nan)
+        viol = in_range & (margin < margin_s)
+
+    has = in_range.any(axis=1)
+    filled = np.where(in_range, margin, np.inf)
+    k = np.argmin(filled, axis=1)
+    rows = np.arange(down.size)
+    min_margin = np.where(has, filled[rows, k], np.nan)
+    I_at_min = np.where(has, I[k], np.nan)
+
+    r, a, b = _runs(viol)
+    seg_min = np.minimum.reduceat(np.where(viol, margin, np.inf).ravel(), (r * I.size + a)) if r.size else np.array([])
+    ids = devices.get("id")
+    name = (lambda i: ids[i]) if ids is not None else int
+    violations = [
+        {
+            "down": name(down[p]),
+            "up": name(up[p]),
+            "I_from_A": float(I[i0]),
+            "I_to_A": float(I[i1]),
+            "min_margin_s": float(m),
+        }
+        for p, i0, i1, m in zip(r, a, b, seg_min)
+    ]
+
+    return {
+        "I_grid": I,
+        "T": T,
+        "pairs": np.column_stack([down, up]),
+        "margin": margin,
+        "min_margin": min_margin,
+        "I_at_min": I_at_min,
+        "ok": ~viol.any(axis=1),
+        "violations": violations,
+        "margin_s": float(margin_s),
+    }
+
+
+# =========================
+# pickup / TMS 자동 선정
+# =========================
+PICKUP_STEPS = np.round(np.arange(1.0, 2.001, 0.05), 2)   # pickup 하한 대비 배수 후보
+TMS_MIN = 0.10
+TMS_MAX = 1.00
+TMS_STEP = 0.01
+
+
+def pickup_floor(In_A, I_load):
+    """
+    pickup 하한 [A]: 1.25×In (In 없으면 I_load), 부하가 하한의 1/0.8을 넘으면 1.10×I_load
+    스칼라 또는 배열(NaN·0 이하는 미입력), 둘 다 없으면 NaN
+    """
+    In = np.asarray(In_A, dtype=float)
+    IL = np.asarray(I_load, dtype=float)
+    with np.errstate(invalid="ignore"):
+        base = np.where(In > 0, In, np.where(IL > 0, IL, np.nan))
+        pickup = base * 1.25
+        return np.where((IL > 0) & (pickup < 0.8 * IL), IL * 1.10, pickup)
+
+
+def _depth(upstream):
+    """트리 깊이(최상위 0), 상위 포인터를 배열 단위로 따라 올라감"""
+    depth = np.zeros(upstream.size, dtype=np.int64)
+    p = upstream.copy()
+    while (p >= 0).any():
+        live = p >= 0
+        depth[live] += 1
+        p[live] = upstream[p[live]]
+    return depth
+
+
+def optimize_tcc_settings(
+    upstream,
+    pickup_min,
+    Isc_A,
+    t_limit_s=None,
+    curve=DEFAULT_CURVE,
+    margin_s=GRADING_MARGIN_S,
+    pickup_steps=PICKUP_STEPS,
+    tms_min=TMS_MIN,
+    tms_max=TMS_MAX,
+    tms_step=TMS_STEP,
+):
+    """
+    피더 체인/방사형 트리 계전기 전체의 pickup·TMS 선정
+    upstream: 상위 계전기 인덱스(최상위 -1), pickup_min: pickup 하한 [A](부하 기준)
+    Isc_A: 계전기 위치 최대 고장전류, t_limit_s: 보호 케이블 단열 한계 (k·S/Isc)² (없으면 NaN)
+    조건
+      - pickup < Isc (설치 위치 고장 검출)
+      - t(Isc_자신) ≤ t_limit (케이블 단락열)
+      - t(Isc_하위) ≥ t_하위(Isc_하위) + margin_s (하위 계전기 모두에 대해)
+    t = TMS·g(I/pickup) 이므로 pickup 후보마다 TMS 범위가 닫힌 형태로 정해짐:
+      TMS_하한 = max(tms_min, max_하위 (t_하위 + margin) / g(Isc_하위/pickup))
+      TMS_상한 = min(tms_max, t_limit / g(Isc/pickup))
+    깊이가 깊은 단계부터(하위 → 상위) 같은 깊이의 계전기 × pickup 후보를 한 번에 계산하고,
+    가능한 후보 중 자기 위치 동작시간이 가장 짧은 것을 선택(없으면 협조 우선, thermal_ok=False).
+    반환 dict(배열): pickup, tms, t_trip_s, t_limit_s, grading_ok, thermal_ok, feasible
+    """
+    upstream = np.asarray(upstream, dtype=np.int64)
+    n = upstream.size
+    p_min = np.broadcast_to(np.asarray(pickup_min, dtype=float), (n,))
+    Isc = np.broadcast_to(np.asarray(Isc_A, dtype=float), (n,))
+    t_lim = np.full(n, np.nan) if t_limit_s is None else np.broadcast_to(np.asarray(t_limit_s, dtype=float), (n,))
+    if isinstance(curve, str):
+        codes = np.full(n, curve_code(curve), dtype=np.int64)
+    elif np.asarray(curve).dtype.kind in "iu":
+        codes = np.broadcast_to(np.asarray(curve, dtype=np.int64), (n,))
+    else:
+        codes = np.array([curve_code(c) for c in curve], dtype=np.int64)
+    steps = np.asarray(pickup_steps, dtype=float)
+
+    pickup = np.full(n, np.nan)
+    tms = np.full(n, np.nan)
+    t_own = np.full(n, np.nan)
+    grading_ok = np.ones(n, dtype=bool)
+    thermal_ok = np.ones(n, dtype=bool)
+
+    # 깊이별 계전기 / 상위 깊이별 하위 계전기를 한 번 정렬해 두고 단계마다 구간만 사용
+    depth = _depth(upstream)
+    n_lv = int(depth.max()) + 1 if n else 0
+    order = np.argsort(depth, kind="stable")
+    bounds = np.searchsorted(depth[order], np.arange(n_lv + 1))
+    slot = np.empty(n, dtype=np.int64)
+    slot[order] = np.arange(n) - bounds[depth[order]]
+    kids = np.flatnonzero(upstream >= 0)
+    kids = kids[np.argsort(depth[upstream[kids]], kind="stable")]
+    kid_bounds = np.searchsorted(depth[upstream[kids]], np.arange(n_lv + 1))
+
+    for lv in range(n_lv - 1, -1, -1):
+        rel = order[bounds[lv]:bounds[lv + 1]]
+
+        cand = p_min[rel, None] * steps[None, :]                       # (R, P)
+        cc = codes[rel, None]
+        with np.errstate(invalid="ignore"):
+            g_own = trip_time(Isc[rel, None], cand, 1.0, cc)          # TMS=1 동작시간
+            lo = np.full(cand.shape, float(tms_min))
+            hi = np.where(np.isnan(t_lim[rel, None]), float(tms_max), np.minimum(tms_max, t_lim[rel, None] / g_own))
+
+        # 하위 계전기(이미 확정)와의 협조 → 상위 후보별 TMS 하한
+        ch = kids[kid_bounds[lv]:kid_bounds[lv + 1]]
+        if ch.size:
+            s = slot[upstream[ch]]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                g_ch = trip_time(Isc[ch, None], cand[s], 1.0, codes[upstream[ch], None])
+                need = (t_own[ch, None] + margin_s) / g_ch
+            # 하위 고장전류 미입력 등 계산 불가 쌍, 하위가 검출 못 하는 쌍(t_하위 = inf)은 제약에서 제외
+            # (검출 불가 하위 1대가 상위 전체를 TMS 상한·협조 실패로 만들지 않게 — 그 하위만 불가로 보고)
+            need = np.where(np.isfinite(t_own[ch, None]) & ~np.isnan(need), need, 0.0)
+            np.maximum.at(lo, s, need)
+
+        # 설정 단위로 올림(하한)/내림(상한)
+        lo = np.ceil(lo / tms_step - 1e-9) * tms_step
+        hi = np.floor(hi / tms_step + 1e-9) * tms_step
+        detect = np.isfinite(g_own)                                     # pickup < Isc
+        grade = detect & (lo <= tms_max)
+        feas = grade & (lo <= hi)
+
+        t_cand = np.where(grade, np.minimum(lo, tms_max) * g_own, np.inf)
+        score = np.where(feas, t_cand, np.inf)
+        # 가능한 후보가 없으면 협조만 만족하는 가장 빠른 후보, 그것도 없으면 최저 pickup
+        best = np.argmin(score, axis=1)
+        none = ~feas.any(axis=1)
+        best = np.where(none, np.argmin(t_cand, axis=1), best)
+        r = np.arange(rel.size)
+
+        tms_sel = np.clip(lo[r, best], tms_min, tms_max)
+        pickup[rel] = cand[r, best]
+        tms[rel] = np.round(tms_sel, 6)
+        t_own[rel] = tms[rel] * g_own[r, best]
+        grading_ok[rel] = grade[r, best]
+        thermal_ok[rel] = np.isnan(t_lim[rel]) | (t_own[rel] <= t_lim[rel])
+
+    return {
+        "pickup": pickup,
+        "tms": tms,
+        "t_trip_s": t_own,
+        "t_limit_s": np.asarray(t_lim, dtype=float),
+        "grading_ok": grading_ok,
+        "thermal_ok": thermal_ok,
+        "feasible": grading_ok & thermal_ok,
+    }
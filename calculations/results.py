@@ -0,0 +1,455 @@
+# calculations/results.py
+"""
+엔지니어링 결과 레코드 (__slots__ + 근거 문자열 지연 생성)
+
+- 수치 필드와 상태 코드(Status)만 보관하고, 한국어 reason은 .reason 접근 시 1회 렌더링
+- dict 호환 접근자(r["status"], r.get(...), keys/items)를 제공하므로
+  ResultWidget / DetailResultWidget / 배치 코드는 dict와 동일하게 사용
+- 레코드는 읽기 전용으로 취급(캐시에서 공유됨)
+"""
+import math
+from collections.abc import Mapping
+from enum import IntEnum
+
+import numpy as np
+
+
+class Status(IntEnum):
+    OK = 0
+    FAIL = 1
+    NA = 2
+
+
+STATUS_LABELS = ("적합", "부적합", "계산 불가")
+OP_STATUS_LABELS = ("규정 충족", "규정 미달", "평가 불가")
+
+
+def status_from_label(label):
+    try:
+        return Status(STATUS_LABELS.index(label))
+    except ValueError:
+        return Status.NA
+
+
+class ResultRecord(Mapping):
+    """
+    dict 호환(Mapping) 레코드 베이스
+    _KEYS: 매핑으로 노출할 키(순서 유지). 각 키는 같은 이름의 속성/프로퍼티로 조회
+    """
+    __slots__ = ()
+    _KEYS = ()
+
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self._KEYS if k != "reason")
+        return f"{type(self).__name__}({fields})"
+
+
+# =========================
+# 케이블 허용전류
+# =========================
+REASON_TEXT = 0      # 고정 문구(계산 불가 등)
+REASON_MANUAL = 1
+REASON_AUTO_OK = 2
+REASON_AUTO_FAIL = 3
+REASON_AUTO_SC_FAIL = 4   # 허용전류 만족 후보는 있으나 단락열(말단 Isc) 동시 만족 후보 없음
+
+
+class CableResult(ResultRecord):
+    __slots__ = (
+        "status_code",
+        "section_mm2_used",
+        "parallel",
+        "I_allow_total",
+        "I_allow_single",
+        "k_temp",
+        "table_profile_used",
+        "design_margin_used",
+        "I_design_A",
+        "length_m",
+        "Isc_end_A",
+        "S_min_mm2",
+        "_reason_kind",
+        "_ctx",
+        "_reason",
+    )
+    _KEYS = (
+        "status",
+        "section_mm2_used",
+        "parallel",
+        "I_allow_total",
+        "I_allow_single",
+        "k_temp",
+        "table_profile_used",
+        "design_margin_used",
+        "I_design_A",
+        "length_m",
+        "Isc_end_A",
+        "S_min_mm2",
+        "reason",
+    )
+
+    def __init__(
+        self,
+        status_code,
+        section_mm2_used=None,
+        parallel=None,
+        I_allow_total=None,
+        I_allow_single=None,
+        k_temp=None,
+        table_profile_used=None,
+        design_margin_used=None,
+        I_design_A=None,
+        length_m=None,
+        Isc_end_A=None,
+        S_min_mm2=None,
+        reason_kind=REASON_TEXT,
+        ctx=None,
+        reason=None,
+    ):
+        self.status_code = Status(status_code)
+        self.section_mm2_used = section_mm2_used
+        self.parallel = parallel
+        self.I_allow_total = I_allow_total
+        self.I_allow_single = I_allow_single
+        self.k_temp = k_temp
+        self.table_profile_used = table_profile_used
+        self.design_margin_used = design_margin_used
+        self.I_design_A = I_design_A
+        self.length_m = length_m
+        self.Isc_end_A = Isc_end_A
+        self.S_min_mm2 = S_min_mm2
+        self._reason_kind = reason_kind
+        self._ctx = ctx
+        self._reason = reason
+
+    @classmethod
+    def na(cls, reason, **fields):
+        return cls(Status.NA, reason=reason, **fields)
+
+    @property
+    def status(self):
+        return STATUS_LABELS[self.status_code]
+
+    @property
+    def reason(self):
+        if self._reason is None:
+            self._reason = self._render_reason()
+        return self._reason
+
+    def _render_reason(self):
+        """
+        ctx = (I_load, S_in, mm2_table, k_group[, (Isc_src, t, k)])
+        """
+        if self._reason_kind == REASON_TEXT or self._ctx is None:
+            return ""
+
+        I_load, S_in, mm2_table, k_group = self._ctx[:4]
+        dm = self.design_margin_used
+        I_design = self.I_design_A
+        profile_used = self.table_profile_used
+        parallel = self.parallel
+        k_temp = self.k_temp
+        total_allow = self.I_allow_total
+
+        if self._reason_kind == REASON_MANUAL:
+            text = (
+                "수동 입력 모드(자동선정 OFF)\n"
+                f"- 목표 설계전류 I_design = I_load×여유계수 = {I_load:.0f}×{dm:.2f} = {I_design:.0f} A\n"
+                f"- S(입력)={S_in:.0f}mm² / 테이블환산={mm2_table}mm² ({profile_used})\n"
+                f"- 병렬 {parallel} × 집합계수 {k_group:.2f}\n"
+                f"- 온도보정 k_temp={k_temp:.3f}\n"
+                f"- 총 허용전류: {total_allow:.0f} A"
+            )
+        elif self._reason_kind == REASON_AUTO_FAIL:
+            text = (
+                "자동선정 모드: 설계여유계수 포함 기준 미달\n"
+                f"- 목표 설계전류 I_design = {I_design:.0f} A (I_load {I_load:.0f}×{dm:.2f})\n"
+                f"- 최대 후보: {mm2_table}mm² ({profile_used})\n"
+                f"- 병렬 {parallel} × 집합계수 {k_group:.2f}\n"
+                f"- 온도보정 k_temp={k_temp:.3f}\n"
+                f"- 총 허용전류: {total_allow:.0f} A"
+            )
+        elif self._reason_kind == REASON_AUTO_SC_FAIL:
+            text = (
+                "자동선정 모드: 허용전류·단락열(말단 Isc) 동시 만족 후보 없음\n"
+                f"- 목표 설계전류 I_design = {I_design:.0f} A (I_load {I_load:.0f}×{dm:.2f})\n"
+                f"- 최대 후보: {mm2_table}mm² ({profile_used})\n"
+                f"- 병렬 {parallel} × 집합계수 {k_group:.2f}\n"
+                f"- 온도보정 k_temp={k_temp:.3f}\n"
+                f"- 총 허용전류: {total_allow:.0f} A"
+            )
+        else:
+            text = (
+                "자동선정 모드: 설계여유계수 포함 기준 만족\n"
+                f"- 목표 설계전류 I_design = {I_design:.0f} A (I_load {I_load:.0f}×{dm:.2f})\n"
+                f"- 선정 S: {mm2_table}mm² ({profile_used})\n"
+                f"- 병렬 {parallel} × 집합계수 {k_group:.2f}\n"
+                f"- 온도보정 k_temp={k_temp:.3f}\n"
+                f"- 총 허용전류: {total_allow:.0f} A"
+            )
+
+        if len(self._ctx) > 4 and self.Isc_end_A is not None:
+            Isc_src, t, k = self._ctx[4]
+            text += (
+                f"\n- 케이블 말단 Isc: {self.Isc_end_A:,.0f} A "
+                f"(길이 {self.length_m:.0f} m, 전원측 {Isc_src:,.0f} A)"
+            )
+            if self.S_min_mm2 is not None and math.isinf(self.S_min_mm2):
+                text += "\n- 단락열: 말단 고장전류가 픽업 이하 → 차단기 미동작(선정 불가)"
+            elif self.S_min_mm2 is not None:
+                text += (
+                    f"\n- 단락열 최소단면적 S_min = max(I_src·√t, I_end·√t_end)/k = {self.S_min_mm2:.1f}mm² "
+                    f"(t={t:.3f}s, k={k:.0f})"
+                )
+        return text
+
+
+class CableOpResult(ResultRecord):
+    """
+    운영온도 평가(cable_allowable_hard_op의 두 번째 반환값)
+    reason은 운영온도 케이블 결과(CableResult)의 reason을 그대로 위임
+    """
+    __slots__ = (
+        "status_code",
+        "ambient",
+        "k_temp",
+        "I_allow_total",
+        "I_allow_single",
+        "table_profile_used",
+        "_source",
+        "_reason",
+    )
+    _KEYS = (
+        "status",
+        "ambient",
+        "k_temp",
+        "I_allow_total",
+        "I_allow_single",
+        "table_profile_used",
+        "reason",
+    )
+
+    def __init__(self, status_code, ambient=None, k_temp=None, I_allow_total=None, I_allow_single=None,
+                 table_profile_used=None, source=None, reason=None):
+        self.status_code = Status(status_code)
+        self.ambient = ambient
+        self.k_temp = k_temp
+        self.I_allow_total = I_allow_total
+        self.I_allow_single = I_allow_single
+        self.table_profile_used = table_profile_used
+        self._source = source
+        self._reason = reason
+
+    @classmethod
+    def from_cable(cls, ambient, cable):
+        return cls(
+            cable.status_code,
+            ambient=ambient,
+            k_temp=cable.k_temp,
+            I_allow_total=cable.I_allow_total,
+            I_allow_single=cable.I_allow_single,
+            table_profile_used=cable.table_profile_used,
+            source=cable,
+        )
+
+    @property
+    def status(self):
+        return OP_STATUS_LABELS[self.status_code]
+
+    @property
+    def reason(self):
+        if self._reason is None:
+            self._reason = self._source.reason if self._source is not None else ""
+        return self._reason
+
+
+# =========================
+# 단락열(단열식)
+# =========================
+class ThermalResult(ResultRecord):
+    __slots__ = (
+        "status_code",
+        "lhs",
+        "rhs",
+        "k",
+        "S",
+        "t_used",
+        "t_clear_input",
+        "t_trip_est",
+        "t_clear_policy",
+        "t_end",
+        "fault_end",
+        "_reason",
+    )
+    _KEYS = ("status", "reason", "detail")
+
+    def __init__(self, status_code, lhs=None, rhs=None, k=None, S=None, t_used=None,
+                 t_clear_input=None, t_trip_est=None, t_clear_policy="NONE", t_end=None, fault_end=None,
+                 reason=None):
+        self.status_code = Status(status_code)
+        self.lhs = lhs
+        self.rhs = rhs
+        self.k = k
+        self.S = S
+        self.t_used = t_used
+        self.t_clear_input = t_clear_input
+        self.t_trip_est = t_trip_est
+        self.t_clear_policy = t_clear_policy
+        self.t_end = t_end
+        self.fault_end = fault_end
+        self._reason = reason
+
+    @classmethod
+    def na(cls, reason):
+        return cls(Status.NA, reason=reason)
+
+    @property
+    def status(self):
+        return STATUS_LABELS[self.status_code]
+
+    @property
+    def detail(self):
+        if self.lhs is None:
+            return None
+        return {
+            "lhs": self.lhs,
+            "rhs": self.rhs,
+            "k": self.k,
+            "S": self.S,
+            "t_used": self.t_used,
+            "t_clear_input": self.t_clear_input,
+            "t_trip_est": self.t_trip_est,
+            "t_end": self.t_end,
+            "fault_end": self.fault_end,
+        }
+
+    @property
+    def reason(self):
+        if self._reason is None:
+            input_txt = "-" if self.t_clear_input is None else f"{float(self.t_clear_input):.3f}s"
+            tcc_txt = "-" if self.t_trip_est is None else f"{float(self.t_trip_est):.3f}s"
+            self._reason = (
+                "단열(adiabatic) 열적 검토 결과\n"
+                f"- I·√t_used = {self.lhs:,.0f}\n"
+                f"- k·S = {self.rhs:,.0f}  (k={self.k}, S={self.S:.0f}mm²)\n"
+                f"- t_clear 입력 = {input_txt}\n"
+                f"- TCC 추정 = {tcc_txt}\n"
+                f"- t_used = {self.t_used:.3f}s ({self.t_clear_policy})"
+            )
+            if self.fault_end is not None:
+                self._reason += f"\n- 말단 t_end = {self.t_end:.3f}s, 지배 고장점 = {self.fault_end}"
+        return self._reason
+
+
+# =========================
+# 배치 결과(컬럼 배열)
+# =========================
+class CableBatchResult:
+    """
+    cable_allowable_current_batch 반환값
+    - r["status"] 등 컬럼 이름으로 배열 접근(기존 dict 사용처 호환)
+    - records(): NumPy 구조화 배열(array-of-struct) 뷰
+    - row(i): i번째 피더의 CableResult(근거 문자열은 접근 시 생성)
+    """
+    __slots__ = (
+        "status",
+        "section_mm2_used",
+        "I_allow_single",
+        "I_allow_total",
+        "k_temp",
+        "I_design_A",
+        "parallel",
+        "table_profile_used",
+        "_I_load",
+        "_S_in",
+        "_mm2_table",
+        "_k_group",
+        "_is_manual",
+        "_design_margin",
+    )
+    COLUMNS = (
+        "status",
+        "section_mm2_used",
+        "I_allow_single",
+        "I_allow_total",
+        "k_temp",
+        "I_design_A",
+        "parallel",
+    )
+
+    def __init__(self, status, section_mm2_used, I_allow_single, I_allow_total, k_temp, I_design_A, parallel,
+                 table_profile_used, I_load, S_in, mm2_table, k_group, is_manual, design_margin):
+        self.status = status
+        self.section_mm2_used = section_mm2_used
+        self.I_allow_single = I_allow_single
+        self.I_allow_total = I_allow_total
+        self.k_temp = k_temp
+        self.I_design_A = I_design_A
+        self.parallel = parallel
+        self.table_profile_used = table_profile_used
+        self._I_load = I_load
+        self._S_in = S_in
+        self._mm2_table = mm2_table
+        self._k_group = k_group
+        self._is_manual = is_manual
+        self._design_margin = design_margin
+
+    def __getitem__(self, key):
+        if key in self.COLUMNS or key == "table_profile_used":
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(self.COLUMNS) + ["table_profile_used"]
+
+    def __len__(self):
+        return int(self.status.size)
+
+    def records(self):
+        return np.rec.fromarrays([getattr(self, c) for c in self.COLUMNS], names=list(self.COLUMNS))
+
+    def row(self, i):
+        code = int(self.status[i])
+        if code == Status.NA:
+            return CableResult.na("입력 누락 또는 형식 오류로 계산 불가")
+
+        if self._is_manual[i]:
+            kind = REASON_MANUAL
+        else:
+            kind = REASON_AUTO_OK if code == Status.OK else REASON_AUTO_FAIL
+
+        mm2 = float(self._mm2_table[i])
+        return CableResult(
+            code,
+            section_mm2_used=float(self.section_mm2_used[i]),
+            parallel=int(self.parallel[i]),
+            I_allow_total=float(self.I_allow_total[i]),
+            I_allow_single=float(self.I_allow_single[i]),
+            k_temp=float(self.k_temp[i]),
+            table_profile_used=self.table_profile_used,
+            design_margin_used=float(self._design_margin[i]),
+            I_design_A=float(self.I_design_A[i]),
+            reason_kind=kind,
+            ctx=(float(self._I_load[i]), float(self._S_in[i]), int(mm2) if mm2.is_integer() else mm2,
+                 float(self._k_group[i])),
+        )
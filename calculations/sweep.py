@@ -0,0 +1,398 @@
+# calculations/sweep.py
+"""
+설계공간 스윕 (파라미터 범위 × 전수 격자, NumPy 벡터화)
+
+- 축마다 값 배열을 받아 데카르트 격자 전체를 평가(차단기 Icu / 케이블 허용전류 / 단락열)
+- 각 검토는 자신이 의존하는 축만으로 된 부분 격자에서 계산한 뒤 브로드캐스트로 합침
+  (예: kVA×Icu 스윕이면 케이블은 1점만 계산)
+- 케이블 부분 격자는 chunk_size 단위로 나눠 cable_allowable_current_batch에 전달(메모리 상한)
+
+판정 규칙은 run_assessment와 동일:
+  차단기 부적합 또는 케이블/단락열 부적합 → FAIL, 그 외 계산 불가 항목 → NEED_MORE, 모두 충족 → PASS
+단락열 차단시간도 run_assessment와 같이 max(입력 t_clear, TCC 추정 동작시간)
+(auto_tcc_params와 같은 pickup_floor·optimize_tcc_settings 선정을 격자 전체에 한 번 적용)
+Isc_local_A(모선 국부 단락전류)가 있으면 변압기 단독 Isc 대신 사용
+cable_length_m이 있으면 말단 Isc(선정 단면적 임피던스)와 말단 고장 TCC 차단시간으로
+송전단·말단 중 큰 I·√t를 검토하고, AUTO는 그 조건까지 만족하는 최소 단면적을 다시 선정
+(cable_allowable_current_adv의 말단 Isc·단락열 동시 선정과 같은 규칙, 후보 단면적 수만큼 격자 연산)
+"""
+import math
+
+import numpy as np
+
+from calculations.cable_tables import cable_impedance
+from calculations.engineering import (
+    ADIABATIC_K,
+    AMBIENT_ROUND_DIGITS,
+    _resolve_table,
+    cable_allowable_current_batch,
+    feeder_end_isc,
+)
+from calculations.protection import TMS_MIN, optimize_tcc_settings, pickup_floor
+from calculations.results import Status
+from calculations.tcc import DEFAULT_CURVE, curve_code, trip_time
+
+
+# 축 이름 → 의존하는 검토
+BREAKER_AXES = ("V", "S", "Z", "breaker")
+CABLE_AXES = ("I_load", "cable_ambient", "cable_parallel", "cable_section_mm2_input")
+THERMAL_AXES = ("t_clear",)
+SWEEP_AXES = BREAKER_AXES + CABLE_AXES + THERMAL_AXES
+
+AXIS_LABELS = {
+    "V": "전압 V (kV)",
+    "S": "변압기 용량 S (kVA)",
+    "Z": "임피던스 Z (%)",
+    "breaker": "차단용량 Icu (kA)",
+    "I_load": "부하전류 I_load (A)",
+    "cable_ambient": "주위온도 (℃)",
+    "cable_parallel": "병렬 수",
+    "cable_section_mm2_input": "단면적 S (mm²)",
+    "t_clear": "차단시간 t_clear (s)",
+}
+
+SWEEP_LABELS = ("PASS", "FAIL", "NEED_MORE")
+SWEEP_CHUNK = 262144
+DESIGN_MARGIN = 1.25
+
+
+def _f(x):
+    try:
+        return float(x)
+    except Exception:
+        return np.nan
+
+
+def _axis_array(name, values):
+    arr = np.asarray(values, dtype=float).reshape(-1)
+    if arr.size == 0:
+        raise ValueError(f"스윕 축 값이 비어 있음: {name}")
+    return arr
+
+
+def _along(arr, pos, ndim):
+    """1차원 배열을 ndim 격자의 pos번째 축 방향으로 세움"""
+    shape = [1] * ndim
+    shape[pos] = arr.size
+    return arr.reshape(shape)
+
+
+def _param(name, base, axes, names):
+    """축이면 격자 방향 배열, 아니면 base 스칼라(없으면 NaN)"""
+    if name in axes:
+        return _along(axes[name], names.index(name), len(names))
+    return np.float64(_f(base.get(name)))
+
+
+def linspace_axis(lo, hi, n):
+    return np.linspace(float(lo), float(hi), int(n))
+
+
+def _tcc_params(In_A, I_load, Isc, curve):
+    """
+    assessment.auto_tcc_params의 배열 버전 → (pickup, tms), 산정 불가는 NaN
+    pickup 하한(pickup_floor) 격자 점 전체를 optimize_tcc_settings(하위 없음) 한 번으로 선정
+    (하위가 없으면 t_limit_s와 무관하게 가장 빠른 후보가 선택되므로 단열 한계 재선정은 생략)
+    """
+    p_min = pickup_floor(In_A, I_load)
+    shape = np.broadcast(p_min, Isc).shape
+    p_min = np.broadcast_to(p_min, shape).ravel()
+    isc = np.broadcast_to(Isc, shape).ravel()
+    pickup = p_min.copy()
+    tms = np.where(np.isnan(p_min), np.nan, TMS_MIN)
+    with np.errstate(invalid="ignore"):
+        low = (isc > 0) & (p_min >= isc)
+        opt = (isc > 0) & (p_min < isc)
+    # 하한이 Isc 이상(검출 불가)이면 0.3×Isc, TMS 최소값
+    pickup[low] = isc[low] * 0.3
+    if opt.any():
+        r = optimize_tcc_settings(np.full(int(opt.sum()), -1), p_min[opt], isc[opt], curve=curve)
+        pickup[opt] = r["pickup"]
+        tms[opt] = r["tms"]
+    return pickup.reshape(shape), tms.reshape(shape)
+
+
+def _cable_subgrid(base, axes, names, standard, chunk_size, ambient=None):
+    """
+    케이블 축으로만 된 부분 격자 평가 → (status, I_allow_total, I_design, section_used) 격자 방향 배열
+    ambient: 고정 주위온도(Hard 30℃). None이면 cable_ambient 축/값(운영온도) 사용
+    """
+    sub_axes = CABLE_AXES if ambient is None else tuple(n for n in CABLE_AXES if n != "cable_ambient")
+    cable_names = [n for n in names if n in sub_axes]
+    sub_shape = tuple(axes[n].size for n in cable_names)
+    total = int(np.prod(sub_shape)) if sub_shape else 1
+
+    mode = str(base.get("cable_mode") or "AUTO").upper()
+    if "cable_section_mm2_input" in axes:
+        mode = "MANUAL"
+    profile = base.get("cable_table_profile")
+
+    status = np.empty(total, dtype=np.int8)
+    allow = np.empty(total)
+    design = np.empty(total)
+    section = np.empty(total)
+
+    for a in range(0, total, chunk_size):
+        b = min(total, a + chunk_size)
+        idx = np.unravel_index(np.arange(a, b), sub_shape) if sub_shape else ()
+        cols = {n: axes[n][idx[i]] for i, n in enumerate(cable_names)}
+
+        def _col(key):
+            if key in cols:
+                return cols[key]
+            v = base.get(key)
+            return _f(v) if v is not None else None
+
+        amb = ambient if ambient is not None else _col("cable_ambient")
+        if amb is not None and ambient is None:
+            # cable_allowable_hard_op의 운영온도 반올림과 동일
+            amb = np.round(amb, AMBIENT_ROUND_DIGITS)
+
+        # run_assessment와 같이 I_load 미입력(형식 오류 포함)은 0 A로 평가
+        i_load = _col("I_load")
+        i_load = 0.0 if i_load is None else np.where(np.isnan(i_load), 0.0, i_load)
+
+        r = cable_allowable_current_batch(
+            I_load=i_load,
+            material=base.get("cable_material"),
+            insulation=base.get("cable_insulation"),
+            install=base.get("cable_install"),
+            ambient=amb,
+            parallel=_col("cable_parallel"),
+            mode=mode,
+            section_mm2_input=_col("cable_section_mm2_input"),
+            standard=standard,
+            table_profile=profile,
+            design_margin=DESIGN_MARGIN,
+        )
+        m = b - a
+        status[a:b] = np.broadcast_to(r["status"], (m,))
+        allow[a:b] = np.broadcast_to(r["I_allow_total"], (m,))
+        design[a:b] = np.broadcast_to(r["I_design_A"], (m,))
+        section[a:b] = np.broadcast_to(r["section_mm2_used"], (m,))
+
+    # 부분 격자 → 전체 격자 방향(부분 격자 축 외에는 길이 1)
+    grid_shape = [axes[n].size if n in sub_axes else 1 for n in names]
+    return tuple(x.reshape(grid_shape) for x in (status, allow, design, section))
+
+
+def _end_fault(Isc, V, L, par, S, material, t_clear, t_input, pickup, tms, curve):
+    """단면적 S 격자 → (말단 Isc, 말단 차단시간: TCC 산정 가능하면 max(입력, TCC(말단)) 미동작 inf, 아니면 t_clear)"""
+    r, x = cable_impedance(material, S)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        isc_end = feeder_end_isc(Isc, V, L, r, x, par)
+        t_end = np.where(np.isnan(pickup), t_clear, np.fmax(t_input, trip_time(isc_end, pickup, tms, curve)))
+    return isc_end, t_end
+
+
+def _end_duty(Isc, t_clear, isc_end, t_end):
+    """송전단·말단 고장 중 큰 I·√t (계산 불가 NaN)"""
+    with np.errstate(invalid="ignore"):
+        return np.maximum(Isc * np.sqrt(np.where(t_clear > 0, t_clear, np.nan)), isc_end * np.sqrt(t_end))
+
+
+def _feeder_select(cable, auto, table, k, shape, fault):
+    """
+    케이블 길이 입력 시 말단 Isc·단락열 동시 선정 (cable_allowable_current_adv의 격자 버전)
+    cable: _cable_subgrid 결과, fault: (Isc, V, L, par, material, t_clear, t_input, pickup, tms, curve)
+    AUTO: 허용전류 만족 후보 중 max(I_src·√t, I_end·√t_end) ≤ k·S 인 첫 단면적, 없으면 최대 후보 + 부적합
+    반환: (status, I_allow_total, I_design, section_used, Isc_end, t_end) 전체 격자
+    """
+    Isc, V, L, par, material, t_clear, t_input, pickup, tms, curve = fault
+    status, allow, design, section = (np.broadcast_to(x, shape).copy() for x in cable)
+
+    def _end(S):
+        return _end_fault(Isc, V, L, par, S, material, t_clear, t_input, pickup, tms, curve)
+
+    if auto and table is not None and not np.isnan(k):
+        sections, amp = table.sections, table.ampacity
+        active = (status == int(Status.OK)) & (t_clear > 0)
+        idx0 = np.minimum(np.searchsorted(sections, section), len(table) - 1)
+        factor = allow / amp[idx0]
+        pick = np.full(shape, -1, dtype=np.int64)
+        for j in range(len(table)):
+            isc_end, t_end = _end(sections[j])
+            with np.errstate(invalid="ignore"):
+                ok = active & (pick < 0) & (j >= idx0) & (design <= amp[j] * factor)
+                ok &= _end_duty(Isc, t_clear, isc_end, t_end) <= k * sections[j]
+            pick[ok] = j
+        none = active & (pick < 0)
+        pick = np.where(none, len(table) - 1, np.where(active, pick, idx0))
+        status[none] = int(Status.FAIL)
+        allow = np.where(active, amp[pick] * factor, allow)
+        section = np.where(active, sections[pick], section)
+
+    isc_end, t_end = _end(section)
+    return status, allow, design, section, isc_end, t_end
+
+
+def sweep_grid(base: dict, axes: dict, chunk_size: int = SWEEP_CHUNK) -> dict:
+    """
+    base: run_assessment 입력과 같은 키(V/S/Z/I_load/breaker/standard/t_clear/Isc_local_A + cable_*)
+    axes: {축 이름: 값 배열} (SWEEP_AXES 중 선택, 순서 = 결과 배열 축 순서)
+    반환 dict:
+      names / axes / shape
+      status(Status 코드: OK=PASS, FAIL, NA=NEED_MORE), pass_mask
+      breaker_ok / cable_ok / thermal_ok (bool, 계산 불가는 False) + *_na
+      breaker_margin = Icu/(Isc×계수) - 1
+      cable_margin   = I_allow_total/I_design - 1 (Hard 30℃, 판정에 사용)
+      cable_op_ok / cable_op_na / cable_op_margin: 운영온도(cable_ambient) 평가, 판정에는 미반영
+      thermal_margin = k·S/max(Isc·√t, Isc_end·√t_end) - 1
+      Isc_A, I_allow_total, section_mm2_used, t_trip_est, t_clear_used
+      Isc_end_A, t_clear_end (cable_length_m 입력 시, 아니면 NaN)
+    """
+    base = dict(base or {})
+    names = list(axes.keys())
+    for n in names:
+        if n not in SWEEP_AXES:
+            raise ValueError(f"지원하지 않는 스윕 축: {n}")
+    axes = {n: _axis_array(n, axes[n]) for n in names}
+    shape = tuple(axes[n].size for n in names)
+    chunk_size = max(1, int(chunk_size))
+
+    standard = str(base.get("standard") or "KESC").upper()
+
+    # ---- 차단기 (short_circuit_current / breaker_judgement와 같은 연산 순서)
+    V = _param("V", base, axes, names)
+    S_kVA = _param("S", base, axes, names)
+    Zpct = _param("Z", base, axes, names)
+    breaker_kA = _param("breaker", base, axes, names)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Isc = (S_kVA * 1000.0) / (math.sqrt(3) * (V * 1000.0)) * (100.0 / Zpct)
+        Isc = np.where((V > 0) & (Zpct > 0), Isc, np.nan)
+        Isc_local = _f(base.get("Isc_local_A"))
+        if Isc_local > 0:
+            Isc = np.broadcast_to(np.float64(Isc_local), np.shape(Isc))
+        margin = 1.1 if standard == "IEC" else 1.0
+        breaker_A = breaker_kA * 1000.0
+        required = Isc * margin
+        breaker_na = np.isnan(Isc) | np.isnan(breaker_A)
+        breaker_ok = ~breaker_na & (breaker_A >= required)
+        breaker_margin = np.where(breaker_na, np.nan, breaker_A / required - 1.0)
+
+    # ---- TCC 추정 동작시간 → 적용 차단시간(입력과 큰 쪽, 한쪽만 있으면 그 값)
+    I_load = _param("I_load", base, axes, names)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        In_A = np.where(V > 0, (S_kVA * 1000.0) / (math.sqrt(3) * (V * 1000.0)), np.nan)
+        curve = str(base.get("breaker_curve") or DEFAULT_CURVE).upper()
+        try:
+            curve_code(curve)
+        except ValueError:
+            curve = DEFAULT_CURVE               # run_assessment와 같이 미지원 곡선은 기본값
+        pickup, tms = _tcc_params(In_A, I_load, Isc, curve)
+        t_trip = trip_time(np.where(Isc > 0, Isc, np.nan), pickup, tms, curve)
+        t_trip = np.where(np.isfinite(t_trip), t_trip, np.nan)
+
+    # ---- 케이블: 판정은 Hard 30℃, 주위온도(cable_ambient)는 운영온도 평가에만 반영
+    has_cable = any(k.startswith("cable_") for k in base) or any(n in CABLE_AXES for n in names)
+    one = [1] * len(names)
+    na_grid = (np.full(one, int(Status.NA), dtype=np.int8),) + (np.full(one, np.nan),) * 3
+    if has_cable:
+        c_status, c_allow, c_design, c_section = _cable_subgrid(base, axes, names, standard, chunk_size, ambient=30.0)
+    else:
+        c_status, c_allow, c_design, c_section = na_grid
+    has_ambient = "cable_ambient" in axes or not np.isnan(_f(base.get("cable_ambient")))
+    if has_cable and has_ambient:
+        o_status, o_allow, o_design, o_section = _cable_subgrid(base, axes, names, standard, chunk_size)
+    else:
+        o_status, o_allow, o_design, o_section = na_grid
+
+    # ---- 케이블 길이: 말단 Isc·말단 고장 차단시간으로 단락열 동시 선정(Hard/운영 공통)
+    t_input = _param("t_clear", base, axes, names)
+    t_clear = np.fmax(t_input, t_trip)
+    material = base.get("cable_material")
+    k = ADIABATIC_K.get((material, base.get("cable_insulation")), np.nan)
+    L = _f(base.get("cable_length_m"))
+    Isc_end = t_end = np.full(one, np.nan)
+    if has_cable and L > 0 and not np.all(c_status == int(Status.NA)):
+        par = _param("cable_parallel", base, axes, names)
+        par = np.where(par > 0, par, 1.0).astype(np.int64)
+        with np.errstate(invalid="ignore"):
+            Isc_f = np.where(Isc > 0, Isc, np.nan)
+        fault = (Isc_f, np.where(V > 0, V, np.nan), L, par, material, t_clear, t_input,
+                 pickup, tms, curve)
+        auto = str(base.get("cable_mode") or "AUTO").upper() != "MANUAL" and "cable_section_mm2_input" not in axes
+        table = None
+        if auto:
+            table, _ = _resolve_table(None, base.get("cable_table_profile"), standard, material,
+                                      base.get("cable_insulation"), base.get("cable_install"))
+        c_status, c_allow, c_design, c_section, Isc_end, t_end = _feeder_select(
+            (c_status, c_allow, c_design, c_section), auto, table, k, shape, fault)
+        if not np.all(o_status == int(Status.NA)):
+            o_status, o_allow, o_design = _feeder_select(
+                (o_status, o_allow, o_design, o_section), auto, table, k, shape, fault)[:3]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cable_na = c_status == int(Status.NA)
+        cable_ok = c_status == int(Status.OK)
+        cable_margin = np.where(cable_na, np.nan, c_allow / c_design - 1.0)
+        op_na = o_status == int(Status.NA)
+        op_ok = o_status == int(Status.OK)
+        op_margin = np.where(op_na, np.nan, o_allow / o_design - 1.0)
+
+    # ---- 단락열(단열식): Isc·√t ≤ k·S (케이블 길이 입력 시 송전단·말단 중 큰 쪽, 말단 미동작은 inf → 부적합)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lhs = Isc * np.sqrt(np.where(t_clear > 0, t_clear, np.nan))
+        if L > 0 and has_cable:
+            lhs = np.where(np.isnan(Isc_end), lhs, _end_duty(Isc, t_clear, Isc_end, t_end))
+        rhs = k * np.where(c_section > 0, c_section, np.nan)
+        thermal_na = np.isnan(lhs) | np.isnan(rhs)
+        thermal_ok = ~thermal_na & (lhs <= rhs)
+        thermal_margin = np.where(thermal_na, np.nan, rhs / lhs - 1.0)
+
+    # ---- 종합 (run_assessment 최종 판정과 같은 우선순위)
+    fail = (~breaker_na & ~breaker_ok) | (~cable_na & ~cable_ok) | (~thermal_na & ~thermal_ok)
+    need = breaker_na | cable_na | thermal_na
+    status = np.where(fail, int(Status.FAIL), np.where(need, int(Status.NA), int(Status.OK))).astype(np.int8)
+    status = np.broadcast_to(status, shape)
+
+    def _full(x):
+        return np.broadcast_to(x, shape)
+
+    return {
+        "names": names,
+        "axes": axes,
+        "shape": shape,
+        "standard": standard,
+        "status": status,
+        "pass_mask": status == int(Status.OK),
+        "breaker_ok": _full(breaker_ok),
+        "breaker_na": _full(breaker_na),
+        "breaker_margin": _full(breaker_margin),
+        "cable_ok": _full(cable_ok),
+        "cable_na": _full(cable_na),
+        "cable_margin": _full(cable_margin),
+        "cable_op_ok": _full(op_ok),
+        "cable_op_na": _full(op_na),
+        "cable_op_margin": _full(op_margin),
+        "thermal_ok": _full(thermal_ok),
+        "thermal_na": _full(thermal_na),
+        "thermal_margin": _full(thermal_margin),
+        "Isc_A": _full(Isc),
+        "t_trip_est": _full(t_trip),
+        "t_clear_used": _full(t_clear),
+        "Isc_end_A": _full(Isc_end),
+        "t_clear_end": _full(t_end),
+        "I_allow_total": _full(c_allow),
+        "section_mm2_used": _full(c_section),
+    }
+
+
+def boundary_mask(mask):
+    """
+    PASS/FAIL 경계 셀: 축 방향 이웃과 값이 다른 셀 True (N차원)
+    """
+    mask = np.asarray(mask, dtype=bool)
+    out = np.zeros(mask.shape, dtype=bool)
+    for ax in range(mask.ndim):
+        if mask.shape[ax] < 2:
+            continue
+        d = np.diff(mask, axis=ax)
+        lo = [slice(None)] * mask.ndim
+        hi = [slice(None)] * mask.ndim
+        lo[ax] = slice(None, -1)
+        hi[ax] = slice(1, None)
+        out[tuple(lo)] |= d
+        out[tuple(hi)] |= d
+    return out
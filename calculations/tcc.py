@@ -1,12 +1,200 @@
+# calculations/tcc.py
+"""
+보호계전/차단기 TCC(시간-전류 특성) 곡선 라이브러리
+
+  t = TMS × ( A / (M^p − 1) + B ),  M = I / pickup
+
+- IEC 60255-151: SI / VI / EI / LTI
+- IEEE C37.112: MI / VI / EI (TMS 자리에 TD)
+- DT: 정한시(pickup 초과 시 t = TMS [s])
+- 순시요소(inst_pickup 이상에서 inst_time)와 정한시 요소(dt_pickup 이상에서 dt_time)는 곡선과 min 결합
+
+모든 인자는 NumPy 브로드캐스트: 전류 (N,) × 계전기 (R,1) → (R, N) 한 번 호출.
+curve도 계전기별 배열(문자열 또는 CURVE_CODES 코드) 가능.
+pickup 이하(M ≤ 1)는 동작하지 않으므로 inf.
+current_for_time()은 위 식을 M에 대해 닫힌 형태로 푼 역함수.
+"""
 import numpy as np
 
 
-def tcc_curve(I_pickup, curve_type="IEC"):
-    I = np.logspace(np.log10(I_pickup * 1.1), np.log10(I_pickup * 20), 50)
+# 이름 → (A, p, B)
+CURVES = {
+    "IEC_SI": (0.14, 0.02, 0.0),
+    "IEC_VI": (13.5, 1.0, 0.0),
+    "IEC_EI": (80.0, 2.0, 0.0),
+    "IEC_LTI": (120.0, 1.0, 0.0),
+    "IEEE_MI": (0.0515, 0.02, 0.114),
+    "IEEE_VI": (19.61, 2.0, 0.491),
+    "IEEE_EI": (28.2, 2.0, 0.1217),
+    "DT": (0.0, 1.0, 1.0),
+}
+CURVE_CODES = tuple(CURVES)
+
+# 복귀(reset) 특성 t_r = TMS × tr / (1 − M²) (M < 1), IEC 60255-151 / IEEE C37.112 tr [s]
+# DT는 순시 복귀(0)
+RESET_TR = {
+    "IEC_SI": 13.5,
+    "IEC_VI": 47.3,
+    "IEC_EI": 80.0,
+    "IEC_LTI": 120.0,
+    "IEEE_MI": 4.85,
+    "IEEE_VI": 21.6,
+    "IEEE_EI": 29.1,
+    "DT": 0.0,
+}
+CURVE_LABELS = {
+    "IEC_SI": "IEC Standard Inverse",
+    "IEC_VI": "IEC Very Inverse",
+    "IEC_EI": "IEC Extremely Inverse",
+    "IEC_LTI": "IEC Long-Time Inverse",
+    "IEEE_MI": "IEEE Moderately Inverse",
+    "IEEE_VI": "IEEE Very Inverse",
+    "IEEE_EI": "IEEE Extremely Inverse",
+    "DT": "Definite Time",
+}
+DEFAULT_CURVE = "IEC_SI"
+
+_PARAMS = np.array([CURVES[c] for c in CURVE_CODES], dtype=float)
+_RESET = np.array([RESET_TR[c] for c in CURVE_CODES], dtype=float)
+
+# 과거 호출부의 곡선 이름
+_ALIASES = {"IEC": "IEC_SI", "SI": "IEC_SI", "VI": "IEC_VI", "EI": "IEC_EI", "LTI": "IEC_LTI"}
+
 
-    if curve_type == "IEC":
-        t = 0.14 / ((I / I_pickup) ** 0.02 - 1)
+def curve_code(curve):
+    """곡선 이름 → CURVE_CODES 인덱스 (목록 외 이름은 ValueError)"""
+    name = str(curve).upper().strip()
+    name = _ALIASES.get(name, name)
+    if name not in CURVES:
+        raise ValueError(f"지원하지 않는 TCC 곡선: {curve}")
+    return CURVE_CODES.index(name)
+
+
+def _curve_params(curve):
+    """curve(스칼라/배열, 이름 또는 코드) → A, p, B 배열"""
+    if isinstance(curve, str):
+        A, p, B = _PARAMS[curve_code(curve)]
+        return np.float64(A), np.float64(p), np.float64(B)
+    arr = np.asarray(curve)
+    if arr.dtype.kind in "iu":
+        codes = arr
     else:
-        t = 13.5 / (I / I_pickup - 1)
+        uniq, inv = np.unique(arr.astype(str), return_inverse=True)
+        codes = np.array([curve_code(u) for u in uniq], dtype=np.int64)[inv].reshape(arr.shape)
+    prm = _PARAMS[codes]
+    return prm[..., 0], prm[..., 1], prm[..., 2]
+
+
+def _arr(x):
+    return np.asarray(x, dtype=float)
+
+
+def trip_time(
+    I,
+    pickup,
+    tms=1.0,
+    curve=DEFAULT_CURVE,
+    inst_pickup=None,
+    inst_time=0.0,
+    dt_pickup=None,
+    dt_time=None,
+):
+    """
+    동작시간 [s] (브로드캐스트 결과 배열, 미동작 inf, 입력 NaN은 NaN)
+    I: 전류 [A], pickup: 한시 요소 픽업 [A], tms: TMS/TD(DT는 동작시간 [s])
+    inst_pickup / inst_time: 순시 요소, dt_pickup / dt_time: 정한시 요소(없으면 생략)
+    """
+    I = _arr(I)
+    pickup = _arr(pickup)
+    tms = _arr(tms)
+    A, p, B = _curve_params(curve)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        M = I / pickup
+        above = M > 1.0
+        # M ≤ 1에서 M^p − 1 ≤ 0 → 분모 보호 후 inf 처리
+        Ms = np.where(above, M, 2.0)
+        inv = np.where(A > 0, A / (Ms ** p - 1.0), 0.0)
+        t = np.where(above, tms * (inv + B), np.inf)
 
-    return I, t
+        if dt_pickup is not None and dt_time is not None:
+            t = np.minimum(t, np.where(I >= _arr(dt_pickup), _arr(dt_time), np.inf))
+        if inst_pickup is not None:
+            t = np.minimum(t, np.where(I >= _arr(inst_pickup), _arr(inst_time), np.inf))
+
+    nan = np.isnan(I) | np.isnan(pickup) | np.isnan(tms)
+    return np.where(nan, np.nan, t)
+
+
+def current_for_time(
+    t,
+    pickup,
+    tms=1.0,
+    curve=DEFAULT_CURVE,
+    inst_pickup=None,
+    inst_time=0.0,
+    dt_pickup=None,
+    dt_time=None,
+):
+    """
+    trip_time의 역: 동작시간 t [s] 이내에 차단하는 최소 전류 [A]
+      M = ( A / (t/TMS − B) + 1 )^(1/p)
+    곡선이 t보다 빨라질 수 없으면(t/TMS ≤ B) 요소별 inf
+    DT: t ≥ TMS 이면 pickup(초과 전류 전부), 아니면 inf
+    """
+    t = _arr(t)
+    pickup = _arr(pickup)
+    tms = _arr(tms)
+    A, p, B = _curve_params(curve)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        r = t / tms - B
+        inverse = A > 0
+        rs = np.where(r > 0, r, 1.0)
+        M = np.where(inverse, (A / rs + 1.0) ** (1.0 / p), 1.0)
+        ok = np.where(inverse, r > 0, r >= 0)
+        I = np.where(ok, M * pickup, np.inf)
+
+        if dt_pickup is not None and dt_time is not None:
+            I = np.minimum(I, np.where(t >= _arr(dt_time), _arr(dt_pickup), np.inf))
+        if inst_pickup is not None:
+            I = np.minimum(I, np.where(t >= _arr(inst_time), _arr(inst_pickup), np.inf))
+
+    nan = np.isnan(t) | np.isnan(pickup) | np.isnan(tms)
+    return np.where(nan, np.nan, I)
+
+
+def reset_time(I, pickup, tms=1.0, curve=DEFAULT_CURVE):
+    """
+    복귀시간 [s]: 적산이 완전히 풀리는 시간, t_r = TMS × tr / (1 − M²)
+    pickup 이상(M ≥ 1)은 복귀하지 않으므로 inf, tr = 0(순시 복귀)은 0
+    """
+    I = _arr(I)
+    pickup = _arr(pickup)
+    tms = _arr(tms)
+    if isinstance(curve, str):
+        tr = np.float64(_RESET[curve_code(curve)])
+    else:
+        arr = np.asarray(curve)
+        tr = _RESET[arr] if arr.dtype.kind in "iu" else np.array([_RESET[curve_code(c)] for c in arr.ravel()]).reshape(arr.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        M = I / pickup
+        t = np.where(M < 1.0, tms * tr / (1.0 - M * M), np.inf)
+    nan = np.isnan(I) | np.isnan(pickup) | np.isnan(tms)
+    return np.where(nan, np.nan, t)
+
+
+def curve_points(pickup, curve=DEFAULT_CURVE, tms=1.0, m_lo=1.1, m_hi=20.0, n=50):
+    """그래프용 (I, t): pickup×m_lo ~ pickup×m_hi 로그 간격 n점"""
+    I = np.logspace(np.log10(pickup * m_lo), np.log10(pickup * m_hi), int(n))
+    return I, trip_time(I, pickup, tms, curve)
+
+
+def tcc_curve(I_pickup, curve_type="IEC"):
+    """
+    TMS=1 곡선 점 (I, t) — curve_type: "IEC"(SI) / 그 외 기존 호출은 IEC VI
+    """
+    name = str(curve_type).upper()
+    if name not in CURVES and name not in _ALIASES:
+        name = "IEC_VI"
+    return curve_points(I_pickup, name, 1.0)
@@ -1,6 +1,60 @@
 from db import get_conn
 
 
+# assets 보호계전 설정(calculations.protection.optimize_tcc_settings 결과) — 기존 DB는 컬럼 추가로 이관
+ASSET_RELAY_COLUMNS = (
+    ("relay_pickup_a", "REAL"),
+    ("relay_tms", "REAL"),
+    ("relay_curve", "TEXT"),
+    ("relay_t_trip_s", "REAL"),
+    ("relay_grading_ok", "INTEGER"),
+    ("relay_thermal_ok", "INTEGER"),
+    ("relay_updated_at", "TEXT"),
+)
+
+
+def migrate_asset_relay_columns(cur):
+    cols = {r[1] for r in cur.execute("PRAGMA table_info(assets);").fetchall()}
+    for name, typ in ASSET_RELAY_COLUMNS:
+        if name not in cols:
+            cur.execute(f"ALTER TABLE assets ADD COLUMN {name} {typ};")
+
+
+# assets 피더 계통(상위 보호기기 설비) — batch_assess --save-relay가 체인 단위로 pickup/TMS 선정
+ASSET_TOPOLOGY_COLUMNS = (
+    ("upstream_asset_id", "INTEGER"),
+)
+
+
+def migrate_asset_topology_columns(cur):
+    cols = {r[1] for r in cur.execute("PRAGMA table_info(assets);").fetchall()}
+    for name, typ in ASSET_TOPOLOGY_COLUMNS:
+        if name not in cols:
+            cur.execute(f"ALTER TABLE assets ADD COLUMN {name} {typ};")
+
+
+# assessments 분석 결과 컬럼(EVT/지속시간/TCC, fleet_assess 일괄 기록) — 이전 스키마 DB는 컬럼 추가로 이관
+ASSESSMENT_ANALYSIS_COLUMNS = (
+    ("hard_status", "TEXT"),
+    ("evt_method", "TEXT"),
+    ("evt_exceed_prob", "REAL"),
+    ("observed_exceed", "REAL"),
+    ("duration_max_s", "REAL"),
+    ("dt_s", "REAL"),
+    ("tcc_available", "INTEGER"),
+    ("tcc_margin", "REAL"),
+    ("t_clear_used_s", "REAL"),
+    ("note", "TEXT"),
+)
+
+
+def migrate_assessment_columns(cur):
+    cols = {r[1] for r in cur.execute("PRAGMA table_info(assessments);").fetchall()}
+    for name, typ in ASSESSMENT_ANALYSIS_COLUMNS:
+        if name not in cols:
+            cur.execute(f"ALTER TABLE assessments ADD COLUMN {name} {typ};")
+
+
 def init_db():
     conn = get_conn()
     cur = conn.cursor()
@@ -27,6 +81,9 @@ def init_db():
         """
     )
 
+    migrate_asset_relay_columns(cur)
+    migrate_asset_topology_columns(cur)
+
     # ---------- assessments ----------
     # hard_status: '적합'/'부적합'/'조건 미충족' 등 텍스트
     # risk_internal/external/final: NULL 허용 (없으면 NULL)
@@ -67,6 +124,8 @@ def init_db():
         """
     )
 
+    migrate_assessment_columns(cur)
+
     # ---------- weather_snapshot ----------
     # 기상청/기타 기상 스냅샷 저장용 (운전 위험도 보정 레이어)
     cur.execute(
@@ -80,7 +139,6 @@ def init_db():
             raw_json      TEXT,
             created_at    TEXT NOT NULL DEFAULT (datetime('now'))
         );
-CREATE INDEX IF NOT EXISTS idx_weather_site_ts ON weather_snapshot(site_code, obs_ts DESC);
         """
     )
 
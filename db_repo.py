@@ -250,3 +250,78 @@ def insert_kpx_snapshot(base_date: str, base_time=None, metric_name=None, metric
     sid = int(cur.lastrowid)
     conn.close()
     return sid
+
+
+def update_asset_relay_settings(asset_ids, settings, curve="IEC_SI"):
+    """
+    optimize_tcc_settings 결과를 assets에 일괄 반영(executemany, 단일 트랜잭션)
+    asset_ids: settings 배열과 같은 순서의 asset_id 목록
+    curve: 곡선 이름(스칼라) 또는 계전기별 목록
+    """
+    n = len(asset_ids)
+    curves = [curve] * n if isinstance(curve, str) else list(curve)
+
+    def _f(x):
+        x = float(x)
+        return x if x == x and x not in (float("inf"), float("-inf")) else None
+
+    rows = [
+        (
+            _f(settings["pickup"][i]),
+            _f(settings["tms"][i]),
+            str(curves[i]),
+            _f(settings["t_trip_s"][i]),
+            int(bool(settings["grading_ok"][i])),
+            int(bool(settings["thermal_ok"][i])),
+            int(asset_ids[i]),
+        )
+        for i in range(n)
+    ]
+
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.executemany(
+        """
+        UPDATE assets
+        SET relay_pickup_a   = ?,
+            relay_tms        = ?,
+            relay_curve      = ?,
+            relay_t_trip_s   = ?,
+            relay_grading_ok = ?,
+            relay_thermal_ok = ?,
+            relay_updated_at = datetime('now')
+        WHERE asset_id = ?
+        """,
+        rows,
+    )
+    conn.commit()
+    updated = cur.rowcount
+    conn.close()
+    return updated
+
+
+ASSESSMENT_BATCH_COLUMNS = (
+    "asset_id", "In_a", "Isc_ka", "breaker_ok", "hard_status",
+    "risk_internal", "evt_method", "evt_exceed_prob", "observed_exceed", "duration_max_s", "dt_s",
+    "tcc_available", "tcc_margin", "t_clear_used_s", "note",
+)
+
+
+def insert_assessments_batch(rows):
+    """
+    평가 결과 여러 건을 assessments에 추가(executemany, 단일 트랜잭션)
+    rows: ASSESSMENT_BATCH_COLUMNS 키를 가진 dict 목록(없는 키는 NULL)
+    """
+    if not rows:
+        return 0
+    cols = ", ".join(ASSESSMENT_BATCH_COLUMNS)
+    marks = ", ".join("?" * len(ASSESSMENT_BATCH_COLUMNS))
+    params = [tuple(r.get(c) for c in ASSESSMENT_BATCH_COLUMNS) for r in rows]
+
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.executemany(f"INSERT INTO assessments ({cols}) VALUES ({marks})", params)
+    conn.commit()
+    n = len(params)
+    conn.close()
+    return n
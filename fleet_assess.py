@@ -0,0 +1,357 @@
+# fleet_assess.py
+"""
+설비군 부하 시계열 EVT/운전 위험도 일괄 분석 (GUI 없이)
+
+사용 예:
+  python fleet_assess.py --i-load 800 --workers 32
+  python fleet_assess.py --assets 1,2,3 --window-days 30 --method lmom --out fleet.csv
+
+- 설비별 최근 window 구간을 series_store(memmap)에서 공유 메모리(multiprocessing.shared_memory)로 연속 배치
+  작업자에는 (버퍼, 오프셋, 길이)만 전달 → 시계열은 피클/복사 없이 뷰로 사용
+- 공유 메모리 2개를 번갈아 사용: 한 묶음(wave)을 작업자가 계산하는 동안 다음 묶음을 채움
+- 설비별: Hard 판정(run_assessment) → 기준선(I_design → I_load → 평균) → 블록 최대값 → fit_gev
+  → 초과 지속시간 / 관측 초과율(전체 표본 대비) → simulate_trip_integrator의 trip_margin
+  → calculate_operation_risk (DetailResultWidget과 같은 정책)
+- 결과는 assessments에 commit_rows행 단위 트랜잭션으로 추가(db_repo.insert_assessments_batch)
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from analysis.evt_analysis import fit_gev
+from analysis.peak_duration import peak_duration_analysis
+from analysis.risk_score import calculate_operation_risk, operation_risk_level, top_k_risk
+from analysis.trip_integrator import simulate_trip_integrator
+from batch_assess import normalize_row, read_asset_rows
+from calculations.assessment import run_assessment
+from calculations.tcc import DEFAULT_CURVE
+from series_store import SERIES_DIR, TS_PER_S, SeriesStore, has_series
+
+
+FLEET_WINDOW_S = 7 * 86400
+FLEET_SHM_BYTES = 512 << 20          # 공유 메모리 버퍼 1개 크기(2개 사용)
+FLEET_COMMIT_ROWS = 500
+DURATION_LIMIT_S = 5.0               # DetailResultWidget LIMIT_TIME과 동일
+MIN_BLOCKS = 8
+
+OUTPUT_COLUMNS = (
+    "asset_id",
+    "hard_status",
+    "risk_internal",
+    "risk_level",
+    "evt_method",
+    "evt_exceed_prob",
+    "observed_exceed",
+    "duration_max_s",
+    "tcc_margin",
+    "baseline_a",
+    "n_samples",
+    "dt_s",
+    "note",
+)
+
+# 작업자 프로세스: 버퍼 번호 → (SharedMemory, float32 뷰)
+_SHARED = {}
+
+
+def _attach(names):
+    for i, name in enumerate(names):
+        shm = shared_memory.SharedMemory(name=name)
+        _SHARED[i] = (shm, np.ndarray((shm.size // 4,), dtype=np.float32, buffer=shm.buf))
+
+
+def _f(v):
+    try:
+        v = float(v)
+    except (TypeError, ValueError):
+        return None
+    return v if np.isfinite(v) else None
+
+
+def _block_maxima(y, dt):
+    """DetailResultWidget._series_stage와 같은 블록(≈10 s) — NaN(수집 결측)은 제외"""
+    block_size = max(int(round(10.0 / dt)), 5)
+    n_blocks = y.size // block_size
+    if n_blocks >= MIN_BLOCKS:
+        mx = np.fmax.reduce(y[:n_blocks * block_size].reshape(n_blocks, block_size), axis=1)
+        mx = mx[~np.isnan(mx)].astype(float)
+        return mx, f"Block Maxima (block={block_size} samples, n={mx.size})"
+    raw = y[~np.isnan(y)].astype(float)
+    return raw, f"Raw series (fallback, n={raw.size})"
+
+
+def assess_asset(task):
+    """작업 1건(설비 1대) → assessments 행 dict"""
+    asset_id, buf, off, n, dt, data, cable_data, relay, note = task
+    y = _SHARED[buf][1][off:off + n]
+    notes = [note] if note else []
+
+    try:
+        res = run_assessment(data, cable_data)
+    except Exception as e:
+        res = {}
+        notes.append(f"Hard 판정 실패: {e}")
+
+    baseline = _f(res.get("I_design"))
+    if baseline is None:
+        baseline = _f(res.get("I_load")) or _f(data.get("I_load"))
+    if baseline is None:
+        baseline = float(np.nanmean(y))
+        notes.append("기준선=평균(대체)")
+
+    series_evt, evt_method = _block_maxima(y, dt)
+    evt_prob = None
+    try:
+        gev = fit_gev(series_evt, baseline, method=data.get("evt_fit", "mle"))
+        evt_prob = min(max(float(gev["exceed_prob"]), 0.0), 1.0)
+        evt_method = f"{evt_method} [{gev['method']}]"
+    except Exception as e:
+        notes.append(f"GEV 적합 실패: {e}")
+
+    durations = peak_duration_analysis(y, baseline, dt)
+    max_duration = float(durations.max()) if durations.size else 0.0
+    # DetailResultWidget과 같이 전체 표본 대비(NaN은 초과 아님)
+    observed = float(np.mean(y > baseline)) if y.size else None
+
+    # 계전기: assets에 저장된 정정값(batch_assess --db --save-relay) 우선, 없으면 Hard 판정의 자동 pickup/TMS
+    pickup = _f(relay.get("pickup")) or _f(res.get("breaker_pickup"))
+    tms = _f(relay.get("tms")) or _f(res.get("breaker_tms"))
+    curve = relay.get("curve") or res.get("breaker_curve") or DEFAULT_CURVE
+    isc = _f(res.get("Isc_A"))
+    tcc_available = bool(pickup and tms and isc and pickup > 0 and tms > 0 and isc > 0)
+    tcc_margin = None
+    if tcc_available:
+        # 부하 시계열 전체 계전기 적산(복귀 특성 포함) — DetailResultWidget과 같은 trip_margin
+        tcc_margin = float(simulate_trip_integrator(y, pickup, tms, dt, curve)["trip_margin"])
+
+    hard_status = res.get("equipment_status")
+    risk = calculate_operation_risk(
+        evt_prob=evt_prob,
+        max_duration=max_duration,
+        duration_limit=DURATION_LIMIT_S,
+        tcc_margin=tcc_margin,
+        breaker_ok=res.get("breaker_result") == "적합",
+        hard_status=hard_status,
+    )
+
+    breaker_result = res.get("breaker_result")
+    return {
+        "asset_id": asset_id,
+        "In_a": _f(res.get("In_A")),
+        "Isc_ka": isc / 1000.0 if isc is not None else None,
+        "breaker_ok": 1 if breaker_result == "적합" else 0 if breaker_result else None,
+        "hard_status": hard_status,
+        "risk_internal": risk["total"],
+        "risk_level": operation_risk_level(risk["total"]),
+        "evt_method": evt_method,
+        "evt_exceed_prob": evt_prob,
+        "observed_exceed": observed,
+        "duration_max_s": max_duration,
+        "dt_s": dt,
+        "tcc_available": int(tcc_available),
+        "tcc_margin": tcc_margin,
+        "t_clear_used_s": _f(res.get("t_clear_used")),
+        "baseline_a": baseline,
+        "n_samples": int(n),
+        "note": " | ".join(notes) or None,
+    }
+
+
+def _fill(buf, buf_id, assets, carry, window_ms, defaults, method, root, skipped):
+    """
+    buf에 설비 시계열을 차례로 복사(가득 차면 중단) → (작업 목록, 다음 묶음으로 넘길 설비)
+    저장소는 설비마다 열고 버림(수천 개 memmap을 동시에 열지 않음)
+    """
+    tasks = []
+    off = 0
+    while True:
+        item = carry if carry is not None else next(assets, None)
+        carry = None
+        if item is None:
+            break
+        asset_id, row = item
+        if not has_series(asset_id, root):
+            skipped.append((asset_id, "시계열 없음"))
+            continue
+        store = SeriesStore(asset_id, root)
+        t_last = store.span()[1]
+        if t_last is None:
+            skipped.append((asset_id, "시계열 없음"))
+            continue
+        parts = [v for _, v in store.window(t_last + 1 - window_ms, t_last + 1)]
+        n = sum(v.size for v in parts)
+        note = None
+        if off + n > buf.size:
+            if off > 0:
+                carry = item
+                break
+            # 버퍼보다 긴 구간: 최근 표본만
+            parts = [np.concatenate(parts)[-buf.size:]]
+            note = f"버퍼 한도로 최근 {buf.size:,}점만 사용"
+            n = buf.size
+
+        pos = off
+        for v in parts:
+            buf[pos:pos + v.size] = v
+            pos += v.size
+        dt = float(store.dt or 1.0)
+        del parts, store
+
+        row = dict(row)
+        relay = {
+            "pickup": row.pop("relay_pickup_a", None),
+            "tms": row.pop("relay_tms", None),
+            "curve": row.pop("relay_curve", None),
+        }
+        data, cable_data = normalize_row(row, defaults)
+        data["evt_fit"] = method
+        tasks.append((asset_id, buf_id, off, n, dt, data, cable_data, relay, note))
+        off += n
+    return tasks, carry
+
+
+def run_fleet(
+    assets,
+    defaults=None,
+    window_s=FLEET_WINDOW_S,
+    method="mle",
+    workers=None,
+    shm_bytes=FLEET_SHM_BYTES,
+    commit_rows=FLEET_COMMIT_ROWS,
+    write=True,
+    root=SERIES_DIR,
+    progress=None,
+):
+    """
+    assets: (asset_id, assets 행 dict) iterable
+    write: assessments에 commit_rows행마다 한 트랜잭션으로 추가
+    progress: 묶음마다 호출되는 콜백 f(처리한 설비 수)
+    반환 dict: rows(결과 행 목록) / skipped([(asset_id, 사유)]) / written / elapsed_s
+    """
+    from db_repo import insert_assessments_batch
+
+    t_begin = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    cap = max(int(shm_bytes) // 4, 1)
+    window_ms = int(float(window_s) * TS_PER_S)
+    assets = iter(assets)
+
+    rows, skipped, pending = [], [], []
+    written = 0
+    shms = [shared_memory.SharedMemory(create=True, size=cap * 4) for _ in range(2)]
+    bufs = [np.ndarray((cap,), dtype=np.float32, buffer=s.buf) for s in shms]
+    ex = None
+    try:
+        names = [s.name for s in shms]
+        if workers > 1:
+            ex = ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(names,))
+        else:
+            _attach(names)
+
+        k = 0
+        tasks, carry = _fill(bufs[k], k, assets, None, window_ms, defaults, method, root, skipped)
+        while tasks:
+            if ex is not None:
+                results = ex.map(assess_asset, tasks, chunksize=max(1, len(tasks) // (workers * 8)))
+            else:
+                results = map(assess_asset, tasks)
+
+            # 작업자가 이번 묶음을 계산하는 동안 다른 버퍼에 다음 묶음 적재
+            k ^= 1
+            nxt, carry = _fill(bufs[k], k, assets, carry, window_ms, defaults, method, root, skipped)
+
+            for r in results:
+                rows.append(r)
+                pending.append(r)
+                if write and len(pending) >= commit_rows:
+                    written += insert_assessments_batch(pending)
+                    pending = []
+            if progress is not None:
+                progress(len(rows))
+            tasks = nxt
+
+        if write and pending:
+            written += insert_assessments_batch(pending)
+    finally:
+        if ex is not None:
+            ex.shutdown(cancel_futures=True)
+        _SHARED.clear()
+        del bufs
+        for s in shms:
+            s.close()
+            s.unlink()
+
+    return {
+        "rows": rows,
+        "skipped": skipped,
+        "written": written,
+        "elapsed_s": time.perf_counter() - t_begin,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="설비군 EVT/운전 위험도 일괄 분석")
+    ap.add_argument("--assets", default=None, help="asset_id 목록(쉼표 구분, 기본: assets 전체)")
+    ap.add_argument("--window-days", type=float, default=FLEET_WINDOW_S / 86400, help="설비별 최근 분석 구간(일)")
+    ap.add_argument("--method", choices=("mle", "lmom"), default="mle", help="GEV 추정 방법")
+    ap.add_argument("--workers", type=int, default=None, help="프로세스 수(기본: CPU 코어 수)")
+    ap.add_argument("--shm-mb", type=int, default=FLEET_SHM_BYTES >> 20, help="공유 메모리 버퍼 크기(MB, 2개 사용)")
+    ap.add_argument("--commit-rows", type=int, default=FLEET_COMMIT_ROWS, help="DB 트랜잭션당 행 수")
+    ap.add_argument("--dry-run", action="store_true", help="assessments에 쓰지 않음")
+    ap.add_argument("--out", help="결과 CSV 경로")
+    ap.add_argument("--top", type=int, default=10, help="위험도 상위 설비 출력 개수")
+    ap.add_argument("--standard", default=None, help="행에 standard가 없을 때 기본값(KESC/IEC)")
+    ap.add_argument("--i-load", type=float, default=None, help="행에 I_load가 없을 때 기본 부하전류(A)")
+    ap.add_argument("--t-clear", type=float, default=None, help="행에 t_clear가 없을 때 기본 차단시간(s)")
+    args = ap.parse_args(argv)
+
+    assets = read_asset_rows()
+    if args.assets:
+        wanted = {int(a) for a in args.assets.split(",") if a.strip()}
+        assets = ((a, r) for a, r in assets if int(a) in wanted)
+
+    defaults = {"standard": args.standard, "I_load": args.i_load, "t_clear": args.t_clear}
+    out = run_fleet(
+        assets,
+        defaults=defaults,
+        window_s=args.window_days * 86400,
+        method=args.method,
+        workers=args.workers,
+        shm_bytes=args.shm_mb << 20,
+        commit_rows=args.commit_rows,
+        write=not args.dry_run,
+        progress=lambda n: print(f"  {n:,}대 처리", file=sys.stderr),
+    )
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8-sig", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=list(OUTPUT_COLUMNS), extrasaction="ignore")
+            w.writeheader()
+            w.writerows(out["rows"])
+
+    counts = {}
+    for r in out["rows"]:
+        counts[r["risk_level"]] = counts.get(r["risk_level"], 0) + 1
+    summary = " / ".join(f"{k} {v}" for k, v in sorted(counts.items()))
+    print(
+        f"완료: {len(out['rows']):,}대 ({summary}), 시계열 없음 {len(out['skipped']):,}대, "
+        f"DB {out['written']:,}행, {out['elapsed_s']:.1f}s",
+        file=sys.stderr,
+    )
+
+    rows = out["rows"]
+    total = np.array([np.nan if r["risk_internal"] is None else r["risk_internal"] for r in rows], dtype=float)
+    for i in top_k_risk(total, args.top):
+        r = rows[i]
+        print(f"  asset {r['asset_id']}: {r['risk_internal']:.1f}점 ({r['risk_level']})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,7 @@ from ui.input_widget import InputWidget
 from ui.cable_widget import CableWidget
 from ui.result_widget import ResultWidget
 from ui.detail_result_widget import DetailResultWidget
+from ui.sweep_widget import SweepWidget
 
 from utils.style import APP_STYLE
 
@@ -30,11 +31,13 @@ def main():
     cable_page = CableWidget(stack)
     result_page = ResultWidget(stack)
     detail_page = DetailResultWidget(stack)
+    sweep_page = SweepWidget(stack)
 
     stack.input_page = input_page
     stack.cable_page = cable_page
     stack.result_page = result_page
     stack.detail_page = detail_page
+    stack.sweep_page = sweep_page
 
     stack.cable_data = {}
 
@@ -42,6 +45,7 @@ def main():
     stack.addWidget(cable_page)
     stack.addWidget(result_page)
     stack.addWidget(detail_page)
+    stack.addWidget(sweep_page)
 
     stack.setCurrentWidget(input_page)
     stack.resize(1100, 800)
@@ -0,0 +1,494 @@
+# series_ingest.py
+"""
+로거/SCADA CSV·TSV → 부하 시계열 저장소(series_store) 스트리밍 수집
+
+사용 예:
+  python series_ingest.py export.csv --asset 12 --dt 1.0
+  python series_ingest.py export.tsv --asset 12 --dt 10 --agg mean --time-col ts --value-col I_A
+
+- 파일은 block_bytes씩 바이너리로 읽고 마지막 줄바꿈에서 자름(전체 read() 없음, 메모리 = 블록 크기)
+- 파싱은 바이트 배열 위에서 벡터화: 줄바꿈/구분자 위치 → 필드를 고정폭 바이트 행렬로 모음
+  값: 일반 소수 표기는 자릿수 행렬에서 정수 가수 ÷ 10^소수자릿수, 그 외는 bytes → float astype
+  시각: bytes → datetime64 astype
+  타임스탬프: ISO(YYYY-MM-DD HH:MM:SS[.fff], '/' 허용, tz_offset_h 현지시각) 또는 epoch 숫자(초/밀리초 자동)
+- 손상된 미래 시각: 파일 순서에서 max_jump_s 넘게 앞으로 튀었다가 되돌아오는 행은 bad_time
+  (되돌아오지 않는 점프는 실제 공백으로 유지 — 한 행의 미래 시각이 이후 행을 모두 late로 버리지 않게)
+- 이상값(음수, 비유한, max_valid 초과, 블록 중앙값 ± outlier_k·MAD 밖)은 NaN 처리 후 개수 보고
+- dt 격자(epoch 기준 정렬)로 재표본: 구간별 max 또는 mean, 블록 경계의 마지막 구간은 다음 블록과 병합
+- 공백: max_fill_s 이하 결측 구간은 NaN으로 채워 격자 유지, 더 긴 공백은 비워 두고 gaps로 보고
+- 체크포인트(바이트 오프셋 + 미완성 구간 상태)를 블록마다 저장 → 중단 후 같은 명령으로 이어서 수집
+  저장소 마지막 시각 이전 구간은 건너뛰므로 추가와 체크포인트 사이에서 중단돼도 중복 없음
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from series_store import SERIES_DIR, TS_PER_S, SeriesStore
+
+
+INGEST_BLOCK = 32 << 20
+MAX_FILL_S = 3600.0
+OUTLIER_MAD_K = 10.0
+MAX_JUMP_S = 300.0
+JUMP_LOOKAHEAD = 10000
+DEFAULT_TZ_H = 9.0
+FIELD_MAX = 64
+AGGREGATIONS = ("max", "mean")
+
+_NL, _CR, _QUOTE = 10, 13, 34
+
+
+# ---------- 파싱 ----------
+def _sniff(header):
+    text = header.decode("utf-8-sig").rstrip("\r\n")
+    sep = "\t" if "\t" in text else ";" if text.count(";") > text.count(",") else ","
+    names = [c.strip().strip('"') for c in text.split(sep)]
+    return sep, names
+
+
+def _col_index(names, col, default):
+    if col is None:
+        return default
+    if isinstance(col, int) or str(col).isdigit():
+        return int(col)
+    if col not in names:
+        raise ValueError(f"열을 찾을 수 없습니다: {col} (헤더: {', '.join(names)})")
+    return names.index(col)
+
+
+def _fields(buf, sep, ncols, cols):
+    """
+    완전한 줄들로 된 바이트 배열 → 선택 열별 고정폭 uint8 행렬(뒤는 0), 형식 오류 줄 수
+    """
+    nl = np.flatnonzero(buf == _NL)
+    starts = np.concatenate(([0], nl[:-1] + 1))
+    ends = nl.copy()
+    ends -= (ends > starts) & (buf[np.maximum(ends - 1, 0)] == _CR)
+
+    nonempty = ends > starts
+    sp = np.flatnonzero(buf == ord(sep))
+    line_of_sep = np.searchsorted(nl, sp)
+    count = np.bincount(line_of_sep, minlength=nl.size)
+    ok = nonempty & (count == ncols - 1)
+    malformed = int(np.count_nonzero(nonempty & ~ok))
+
+    seps = sp[ok[line_of_sep]].reshape(-1, ncols - 1)
+    ls, le = starts[ok], ends[ok]
+
+    # 행마다 FIELD_MAX 바이트 창(끝에 0 덧댐) → 필요한 행만 골라 복사
+    windows = np.lib.stride_tricks.sliding_window_view(np.concatenate((buf, np.zeros(FIELD_MAX, np.uint8))), FIELD_MAX)
+    out = []
+    for k in cols:
+        s = ls if k == 0 else seps[:, k - 1] + 1
+        e = le if k == ncols - 1 else seps[:, k]
+        # 따옴표 제거
+        q = (e > s) & (buf[np.minimum(s, buf.size - 1)] == _QUOTE)
+        s = s + q
+        q = (e > s) & (buf[np.maximum(e - 1, 0)] == _QUOTE)
+        e = e - q
+        lens = np.minimum(e - s, FIELD_MAX)
+        width = int(max(int(lens.max()) if lens.size else 1, 1))
+        mat = windows[s, :width]
+        mat *= np.arange(width) < lens[:, None]
+        out.append(mat)
+    return out, malformed
+
+
+def _as_bytes(mat):
+    return np.ascontiguousarray(mat).view(f"S{mat.shape[1]}").reshape(-1)
+
+
+def _to_float(mat):
+    """
+    고정폭 uint8 행렬 → float
+    부호/숫자/소수점/공백만 있는 칸(15자리 이하)은 정수 가수 ÷ 10^소수자릿수(정확한 반올림),
+    그 외(지수 표기, 문자 등)는 bytes → float astype, 그래도 안 되면 원소별
+    """
+    n, w = mat.shape
+    if n == 0:
+        return np.empty(0)
+    digit = (mat >= 48) & (mat <= 57)
+    dot = mat == 46
+    minus = mat == 45
+    plain = digit | dot | minus | (mat == 43) | (mat == 32) | (mat == 0)
+    nd = digit.sum(axis=1)
+    if plain.all() and nd.max() <= 15 and dot.sum(axis=1).max() <= 1 and minus.sum(axis=1).max() <= 1:
+        mant = np.zeros(n, dtype=np.int64)
+        frac = np.zeros(n, dtype=np.int64)
+        after = np.zeros(n, dtype=bool)
+        for j in range(w):
+            d = digit[:, j]
+            mant = np.where(d, mant * 10 + (mat[:, j].astype(np.int64) - 48), mant)
+            frac += d & after
+            after |= dot[:, j]
+        v = mant / 10.0 ** frac
+        v = np.where(minus.any(axis=1), -v, v)
+        return np.where(nd > 0, v, np.nan)
+
+    raw = _as_bytes(mat)
+    raw = np.where(np.char.strip(raw) == b"", b"nan", raw)
+    try:
+        return raw.astype(float)
+    except ValueError:
+        # 숫자가 아닌 칸이 섞인 블록만 원소별로
+        out = np.empty(raw.size)
+        for i, v in enumerate(raw):
+            try:
+                out[i] = float(v)
+            except ValueError:
+                out[i] = np.nan
+        return out
+
+
+def _detect_time_format(mat):
+    try:
+        float(_as_bytes(mat[:1])[0])
+        return "epoch"
+    except ValueError:
+        return "iso"
+
+
+def parse_times(mat, fmt="iso", tz_offset_h=DEFAULT_TZ_H):
+    """고정폭 uint8 행렬 → epoch 밀리초(int64), 파싱 불가 칸은 INT64_MIN"""
+    bad = np.iinfo(np.int64).min
+    if fmt == "epoch":
+        v = _to_float(mat)
+        scale = 1.0 if np.nanmedian(np.abs(v)) > 1e11 else TS_PER_S
+        ms = np.where(np.isfinite(v), np.rint(v * scale), np.nan)
+        return np.where(np.isnan(ms), bad, ms).astype(np.int64)
+
+    mat = np.where(mat == 47, np.uint8(45), mat)              # 2024/01/02 → 2024-01-02
+    raw = _as_bytes(mat)
+    try:
+        t = raw.astype("datetime64[ms]")
+    except ValueError:
+        t = np.array([_dt64_or_nat(v) for v in np.char.strip(raw)], dtype="datetime64[ms]")
+    ms = t.astype(np.int64)
+    ok = ~np.isnat(t)
+    return np.where(ok, ms - int(round(tz_offset_h * 3600 * TS_PER_S)), bad)
+
+
+def _dt64_or_nat(v):
+    try:
+        return np.datetime64(v.decode(), "ms")
+    except ValueError:
+        return np.datetime64("NaT")
+
+
+def time_excursions(t, ref, jump_ms, lookahead=JUMP_LOOKAHEAD):
+    """
+    파일 순서 시각 t [ms]에서 jump_ms 넘게 앞으로 튀었다가 lookahead행 안에 되돌아오는 구간 마스크
+    ref: 직전 블록까지의 기준 시각(없으면 None), 되돌아오지 않는 점프는 실제 공백으로 보고 유지
+    """
+    bad = np.zeros(t.size, dtype=bool)
+    seq = t if ref is None else np.concatenate(([ref], t))
+    off = seq.size - t.size
+    done = 0
+    for i in np.flatnonzero(np.diff(seq) > jump_ms) + 1:
+        if i < done:
+            continue
+        back = np.flatnonzero(seq[i + 1:i + 1 + lookahead] <= seq[i - 1] + jump_ms)
+        if back.size:
+            done = i + 1 + int(back[0])
+            bad[max(i - off, 0):done - off] = True
+    return bad
+
+
+def flag_outliers(x, k=OUTLIER_MAD_K, max_valid=None):
+    """이상값 마스크: 비유한 / 음수 / max_valid 초과 / |x − 중앙값| > k·1.4826·MAD (k=None이면 생략)"""
+    bad = ~np.isfinite(x) | (x < 0)
+    if max_valid is not None:
+        bad |= x > float(max_valid)
+    if k is not None:
+        good = x[~bad]
+        if good.size >= 10:
+            med = np.median(good)
+            mad = 1.4826 * np.median(np.abs(good - med))
+            if mad > 0:
+                bad |= np.abs(x - med) > float(k) * mad
+    return bad
+
+
+# ---------- 재표본 ----------
+def _bin_stats(bins, x):
+    """정렬된 구간 번호별 (구간, 유효 합, 유효 개수, 최댓값)"""
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bins)) + 1))
+    nan = np.isnan(x)
+    s = np.add.reduceat(np.where(nan, 0.0, x), starts)
+    c = np.add.reduceat((~nan).astype(np.int64), starts)
+    m = np.fmax.reduceat(x, starts)
+    return bins[starts], s, c, m
+
+
+def _fill_gaps(bins, vals, last_bin, max_fill_bins):
+    """
+    연속 구간 사이 결측을 NaN으로 채움(max_fill_bins 이하), 긴 공백은 (시작 구간, 끝 구간) 목록으로
+    """
+    prev = np.concatenate(([bins[0] - 1 if last_bin is None else last_bin], bins[:-1]))
+    miss = bins - prev - 1
+    long_gap = miss > max_fill_bins
+    gaps = list(zip((prev[long_gap] + 1).tolist(), (bins[long_gap] - 1).tolist()))
+    f = np.where(long_gap, 0, miss)
+    if not f.any():
+        return bins, vals, gaps, 0
+
+    total = bins.size + int(f.sum())
+    first = np.arange(bins.size) + np.cumsum(f) - f            # 각 세그먼트(채움 + 원래 값) 시작 위치
+    out_bins = np.repeat(bins - f, 1 + f) + (np.arange(total) - np.repeat(first, 1 + f))
+    out_vals = np.full(total, np.nan)
+    out_vals[first + f] = vals
+    return out_bins, out_vals, gaps, int(f.sum())
+
+
+# ---------- 체크포인트 ----------
+def _checkpoint_path(store, path):
+    return os.path.join(store.path, f"ingest_{os.path.basename(path)}.ckpt.json")
+
+
+def _load_checkpoint(ckpt, path):
+    if not os.path.exists(ckpt):
+        return None
+    with open(ckpt, "r", encoding="utf-8") as f:
+        st = json.load(f)
+    return st if st.get("source") == os.path.abspath(path) else None
+
+
+def _save_checkpoint(ckpt, state):
+    os.makedirs(os.path.dirname(ckpt), exist_ok=True)
+    tmp = ckpt + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, ckpt)
+
+
+# ---------- 수집 ----------
+def ingest_csv(
+    path,
+    asset_id,
+    dt=1.0,
+    time_col=None,
+    value_col=None,
+    agg="max",
+    tz_offset_h=DEFAULT_TZ_H,
+    max_fill_s=MAX_FILL_S,
+    outlier_k=OUTLIER_MAD_K,
+    max_valid=None,
+    max_jump_s=MAX_JUMP_S,
+    block_bytes=INGEST_BLOCK,
+    resume=True,
+    root=SERIES_DIR,
+    progress=None,
+):
+    """
+    로거 파일 하나를 저장소에 수집(체크포인트가 있으면 이어서)
+    time_col / value_col: 헤더 이름 또는 열 번호(기본 0 / 1)
+    progress: 블록마다 호출되는 콜백 f(읽은 바이트, 전체 바이트)
+    반환 dict: rows / malformed / bad_time / late / outliers / written / nan_filled / gaps / bytes / elapsed_s
+    """
+    agg = str(agg).lower()
+    if agg not in AGGREGATIONS:
+        raise ValueError(f"지원하지 않는 재표본 방식: {agg}")
+    dt_ms = int(round(float(dt) * TS_PER_S))
+    if dt_ms <= 0:
+        raise ValueError("dt는 양수여야 합니다")
+
+    store = SeriesStore(asset_id, root)
+    if store.dt is not None and len(store) and abs(float(store.dt) - dt_ms / TS_PER_S) > 1e-9:
+        raise ValueError(f"저장소 dt({store.dt}s)와 수집 dt({dt}s)가 다릅니다")
+    ckpt = _checkpoint_path(store, path)
+    state = _load_checkpoint(ckpt, path) if resume else None
+
+    t_begin = time.perf_counter()
+    total_bytes = os.path.getsize(path)
+    with open(path, "rb") as f:
+        if state is None:
+            header = f.readline()
+            sep, names = _sniff(header)
+            state = {
+                "source": os.path.abspath(path),
+                "offset": f.tell(),
+                "sep": sep,
+                "ncols": len(names),
+                "cols": [_col_index(names, time_col, 0), _col_index(names, value_col, 1)],
+                "fmt": None,
+                "pending": None,            # [구간, 합, 개수, 최댓값]
+                "last_bin": None,
+                "report": {"rows": 0, "malformed": 0, "bad_time": 0, "late": 0, "outliers": 0,
+                           "written": 0, "nan_filled": 0, "gaps": []},
+            }
+        rep = state["report"]
+        f.seek(state["offset"])
+        max_fill_bins = int(max_fill_s * TS_PER_S // dt_ms)
+        jump_ms = int(float(max_jump_s) * TS_PER_S)
+        tail = b""
+
+        while True:
+            data = f.read(int(block_bytes))
+            eof = not data
+            block = tail + data
+            if eof:
+                if not block.strip():
+                    break
+                if not block.endswith(b"\n"):
+                    block += b"\n"
+                tail = b""
+            else:
+                cut = block.rfind(b"\n")
+                if cut < 0:
+                    tail = block
+                    continue
+                tail = block[cut + 1:]
+                block = block[:cut + 1]
+
+            buf = np.frombuffer(block, dtype=np.uint8)
+            (raw_t, raw_x), malformed = _fields(buf, state["sep"], state["ncols"], state["cols"])
+            rep["malformed"] += malformed
+            rep["rows"] += raw_t.shape[0]
+
+            if raw_t.shape[0]:
+                if state["fmt"] is None:
+                    state["fmt"] = _detect_time_format(raw_t)
+                t = parse_times(raw_t, state["fmt"], tz_offset_h)
+                x = _to_float(raw_x)
+
+                ok = t != np.iinfo(np.int64).min
+                t, x = t[ok], x[ok]
+
+                # 보류 구간 자체가 손상된 미래 시각이었으면(이번 블록이 한참 이전) 버림
+                pend = state["pending"]
+                if pend is not None and t.size and np.median(t) < pend[0] * dt_ms - jump_ms:
+                    rep["bad_time"] += pend[2]
+                    state["pending"] = pend = None
+                ref = pend[0] * dt_ms if pend is not None else (
+                    None if state["last_bin"] is None else state["last_bin"] * dt_ms)
+                jump = time_excursions(t, ref, jump_ms)
+                t, x = t[~jump], x[~jump]
+                rep["bad_time"] += int(np.count_nonzero(~ok) + np.count_nonzero(jump))
+                if t.size > 1 and np.any(np.diff(t) < 0):
+                    order = np.argsort(t, kind="stable")
+                    t, x = t[order], x[order]
+
+                out = flag_outliers(x, outlier_k, max_valid)
+                rep["outliers"] += int(np.count_nonzero(out))
+                x = np.where(out, np.nan, x)
+
+                bins = t // dt_ms
+                floor_bin = pend[0] if pend is not None else state["last_bin"]
+                if floor_bin is not None:
+                    late = bins < floor_bin
+                    rep["late"] += int(np.count_nonzero(late))
+                    bins, x = bins[~late], x[~late]
+
+                if bins.size:
+                    ub, s, c, m = _bin_stats(bins, x)
+                    if pend is not None:
+                        if ub[0] == pend[0]:
+                            s[0] += pend[1]
+                            c[0] += pend[2]
+                            m[0] = np.fmax(m[0], np.nan if pend[3] is None else pend[3])
+                        else:
+                            ub = np.concatenate(([pend[0]], ub))
+                            s = np.concatenate(([pend[1]], s))
+                            c = np.concatenate(([pend[2]], c))
+                            m = np.concatenate(([np.nan if pend[3] is None else pend[3]], m))
+                    # 마지막 구간은 다음 블록에서 이어질 수 있으므로 보류
+                    last_m = float(m[-1])
+                    state["pending"] = [int(ub[-1]), float(s[-1]), int(c[-1]), None if np.isnan(last_m) else last_m]
+                    ub, s, c, m = ub[:-1], s[:-1], c[:-1], m[:-1]
+                    if ub.size:
+                        _emit(store, ub, s, c, m, agg, dt_ms, max_fill_bins, state)
+
+            state["offset"] = f.tell() - len(tail)
+            _save_checkpoint(ckpt, state)
+            if progress is not None:
+                progress(state["offset"], total_bytes)
+            if eof:
+                break
+
+    # 파일 끝: 보류 구간 확정
+    pend = state["pending"]
+    if pend is not None:
+        m = np.nan if pend[3] is None else pend[3]
+        _emit(store, np.array([pend[0]]), np.array([pend[1]]), np.array([pend[2]]), np.array([m]),
+              agg, dt_ms, max_fill_bins, state)
+        state["pending"] = None
+        _save_checkpoint(ckpt, state)
+
+    out = dict(rep)
+    out["gaps"] = [(a * dt_ms, (b + 1) * dt_ms) for a, b in rep["gaps"]]
+    out["bytes"] = total_bytes
+    out["elapsed_s"] = time.perf_counter() - t_begin
+    return out
+
+
+def _emit(store, ub, s, c, m, agg, dt_ms, max_fill_bins, state):
+    rep = state["report"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        vals = m if agg == "max" else np.where(c > 0, s / c, np.nan)
+    bins, vals, gaps, filled = _fill_gaps(ub, vals, state["last_bin"], max_fill_bins)
+
+    # 추가 후 체크포인트 전에 중단된 경우: 이미 저장된 구간은 건너뜀
+    last = store.span()[1]
+    if last is not None:
+        keep = bins * dt_ms > last
+        bins, vals = bins[keep], vals[keep]
+    if bins.size:
+        store.append(bins * dt_ms, vals, dt=dt_ms / TS_PER_S)
+    rep["written"] += int(bins.size)
+    rep["nan_filled"] += filled
+    rep["gaps"].extend(gaps)
+    state["last_bin"] = int(ub[-1])
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="로거 CSV/TSV → 부하 시계열 저장소 수집")
+    ap.add_argument("path", help="로거 내보내기 파일(CSV/TSV, 첫 줄 헤더)")
+    ap.add_argument("--asset", required=True, help="설비 asset_id")
+    ap.add_argument("--dt", type=float, default=1.0, help="저장 격자 간격(s, 기본 1.0)")
+    ap.add_argument("--time-col", default=None, help="시각 열 이름/번호(기본 첫 열)")
+    ap.add_argument("--value-col", default=None, help="전류 열 이름/번호(기본 둘째 열)")
+    ap.add_argument("--agg", choices=AGGREGATIONS, default="max", help="구간 집계(기본 max)")
+    ap.add_argument("--tz", type=float, default=DEFAULT_TZ_H, help="ISO 시각의 UTC 오프셋(시간, 기본 9)")
+    ap.add_argument("--max-fill", type=float, default=MAX_FILL_S, help="NaN으로 채울 최대 공백(s)")
+    ap.add_argument("--outlier-k", type=float, default=OUTLIER_MAD_K, help="MAD 이상값 배수(0이면 끔)")
+    ap.add_argument("--max-valid", type=float, default=None, help="이 값을 넘는 전류는 이상값")
+    ap.add_argument("--max-jump", type=float, default=MAX_JUMP_S, help="되돌아오는 미래 시각 점프 허용(s)")
+    ap.add_argument("--restart", action="store_true", help="체크포인트 무시하고 처음부터")
+    args = ap.parse_args(argv)
+
+    def _progress(done, total):
+        print(f"\r{done / max(total, 1):6.1%}", end="", file=sys.stderr)
+
+    rep = ingest_csv(
+        args.path,
+        args.asset,
+        dt=args.dt,
+        time_col=args.time_col,
+        value_col=args.value_col,
+        agg=args.agg,
+        tz_offset_h=args.tz,
+        max_fill_s=args.max_fill,
+        outlier_k=args.outlier_k or None,
+        max_valid=args.max_valid,
+        max_jump_s=args.max_jump,
+        resume=not args.restart,
+        progress=_progress,
+    )
+    print(file=sys.stderr)
+    mb = rep["bytes"] / 1e6
+    print(
+        f"완료: {rep['rows']:,}행 → {rep['written']:,}점 (NaN 채움 {rep['nan_filled']:,}, "
+        f"공백 {len(rep['gaps'])}건, 이상값 {rep['outliers']:,}, 형식 오류 {rep['malformed']:,}, "
+        f"시각 오류 {rep['bad_time']:,}, 역순 {rep['late']:,}) "
+        f"{mb:.1f} MB / {rep['elapsed_s']:.1f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+# series_store.py
+"""
+설비별 부하 계측 시계열 저장소 (np.memmap 고정 크기 청크 파일)
+
+data/series/<asset_id>/
+  index.json      청크 목록 {file, n(채운 표본 수), t0, t1(첫/끝 타임스탬프)} + dt + chunk_samples
+  000000.ts       int64 epoch 밀리초, chunk_samples 크기로 미리 할당
+  000000.val      float32 전류 [A]
+
+- 열기는 index.json만 읽음(O(1)), 청크 파일은 처음 접근할 때 memmap으로 열고 저장소 객체에 보관
+- window(t0, t1): 청크 시간 범위 → 청크 선택, 청크 안은 타임스탬프 이진 탐색 → memmap 슬라이스(복사 없음)
+- open_store()는 프로세스 내 같은 객체를 돌려주므로 반복 분석이 같은 매핑/페이지 캐시를 공유
+- 추가(append)는 시간 오름차순만 허용, 마지막 청크를 채운 뒤 새 청크 파일 생성, 인덱스는 임시 파일 → os.replace
+"""
+import json
+import os
+
+import numpy as np
+
+
+SERIES_DIR = os.path.join(os.path.dirname(__file__), "data", "series")
+CHUNK_SAMPLES = 1 << 20
+TS_PER_S = 1000
+INDEX_NAME = "index.json"
+
+_STORES = {}
+
+
+class SeriesStore:
+    def __init__(self, asset_id, root=SERIES_DIR):
+        self.asset_id = str(asset_id)
+        self.path = os.path.join(root, self.asset_id)
+        self._maps = {}
+        self._load_index()
+
+    # ---------- 인덱스 ----------
+    def _load_index(self):
+        p = os.path.join(self.path, INDEX_NAME)
+        if os.path.exists(p):
+            with open(p, "r", encoding="utf-8") as f:
+                idx = json.load(f)
+        else:
+            idx = {"dt": None, "chunk_samples": CHUNK_SAMPLES, "chunks": []}
+        self.dt = idx.get("dt")
+        self.chunk_samples = int(idx.get("chunk_samples", CHUNK_SAMPLES))
+        self.chunks = idx.get("chunks", [])
+        self._mtime = os.path.getmtime(p) if os.path.exists(p) else None
+        self._bounds()
+
+    def _bounds(self):
+        self._t0 = np.array([c["t0"] for c in self.chunks], dtype=np.int64)
+        self._t1 = np.array([c["t1"] for c in self.chunks], dtype=np.int64)
+
+    def _save_index(self):
+        os.makedirs(self.path, exist_ok=True)
+        p = os.path.join(self.path, INDEX_NAME)
+        tmp = p + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"dt": self.dt, "chunk_samples": self.chunk_samples, "chunks": self.chunks}, f)
+        os.replace(tmp, p)
+        self._mtime = os.path.getmtime(p)
+        self._bounds()
+
+    def refresh(self):
+        """다른 프로세스(수집기)가 추가한 경우 인덱스 다시 읽기"""
+        p = os.path.join(self.path, INDEX_NAME)
+        mtime = os.path.getmtime(p) if os.path.exists(p) else None
+        if mtime != self._mtime:
+            self._maps.clear()
+            self._load_index()
+        return self
+
+    # ---------- 청크 파일 ----------
+    def _map(self, i, mode="r"):
+        key = (i, mode)
+        if key not in self._maps:
+            base = os.path.join(self.path, self.chunks[i]["file"])
+            ts = np.memmap(base + ".ts", dtype=np.int64, mode=mode, shape=(self.chunk_samples,))
+            val = np.memmap(base + ".val", dtype=np.float32, mode=mode, shape=(self.chunk_samples,))
+            self._maps[key] = (ts, val)
+        return self._maps[key]
+
+    def _new_chunk(self):
+        os.makedirs(self.path, exist_ok=True)
+        name = f"{len(self.chunks):06d}"
+        base = os.path.join(self.path, name)
+        np.memmap(base + ".ts", dtype=np.int64, mode="w+", shape=(self.chunk_samples,)).flush()
+        np.memmap(base + ".val", dtype=np.float32, mode="w+", shape=(self.chunk_samples,)).flush()
+        self.chunks.append({"file": name, "n": 0, "t0": None, "t1": None})
+
+    # ---------- 조회 ----------
+    def __len__(self):
+        return int(sum(c["n"] for c in self.chunks))
+
+    def span(self):
+        """(첫 타임스탬프, 끝 타임스탬프) [epoch ms], 비어 있으면 (None, None)"""
+        if not self.chunks or self.chunks[0]["n"] == 0:
+            return None, None
+        return int(self._t0[0]), int(self._t1[-1])
+
+    def window(self, t_start=None, t_end=None):
+        """
+        [t_start, t_end) [epoch ms] 구간의 청크별 (타임스탬프, 값) memmap 슬라이스 목록 — 복사 없음
+        """
+        if not self.chunks:
+            return []
+        lo = 0 if t_start is None else int(np.searchsorted(self._t1, t_start, side="left"))
+        hi = len(self.chunks) if t_end is None else int(np.searchsorted(self._t0, t_end, side="left"))
+        out = []
+        for i in range(lo, hi):
+            n = self.chunks[i]["n"]
+            if n == 0:
+                continue
+            ts, val = self._map(i)
+            a = 0 if t_start is None else int(np.searchsorted(ts[:n], t_start, side="left"))
+            b = n if t_end is None else int(np.searchsorted(ts[:n], t_end, side="left"))
+            if b > a:
+                out.append((ts[a:b], val[a:b]))
+        return out
+
+    def read(self, t_start=None, t_end=None):
+        """구간을 연속 배열 하나로 (청크가 하나면 memmap 뷰 그대로, 여러 개면 이어 붙인 복사본)"""
+        parts = self.window(t_start, t_end)
+        if not parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+
+    def iter_chunks(self, t_start=None, t_end=None):
+        """analysis.stream_pipeline 규약의 (epoch 초, 값) 청크 generator"""
+        for ts, val in self.window(t_start, t_end):
+            yield ts / TS_PER_S, val
+
+    # ---------- 추가 ----------
+    def append(self, ts_ms, values, dt=None):
+        """
+        ts_ms: int64 epoch 밀리초(오름차순, 저장된 마지막 시각 이후), values: 전류 [A]
+        반환: 추가한 표본 수
+        """
+        ts_ms = np.asarray(ts_ms, dtype=np.int64).reshape(-1)
+        values = np.asarray(values, dtype=np.float32).reshape(-1)
+        if ts_ms.size != values.size:
+            raise ValueError("타임스탬프와 값의 길이가 다릅니다")
+        if ts_ms.size == 0:
+            return 0
+        if np.any(np.diff(ts_ms) <= 0):
+            raise ValueError("타임스탬프는 오름차순이어야 합니다")
+        last = self.span()[1]
+        if last is not None and ts_ms[0] <= last:
+            raise ValueError("저장된 마지막 시각 이전 데이터는 추가할 수 없습니다")
+
+        if dt is not None:
+            self.dt = float(dt)
+        if not self.chunks:
+            self._new_chunk()
+
+        pos = 0
+        while pos < ts_ms.size:
+            i = len(self.chunks) - 1
+            c = self.chunks[i]
+            if c["n"] >= self.chunk_samples:
+                self._new_chunk()
+                continue
+            take = min(self.chunk_samples - c["n"], ts_ms.size - pos)
+            ts, val = self._map(i, "r+")
+            ts[c["n"]:c["n"] + take] = ts_ms[pos:pos + take]
+            val[c["n"]:c["n"] + take] = values[pos:pos + take]
+            ts.flush()
+            val.flush()
+            if c["n"] == 0:
+                c["t0"] = int(ts_ms[pos])
+            c["n"] += take
+            c["t1"] = int(ts_ms[pos + take - 1])
+            pos += take
+
+        self._save_index()
+        return int(ts_ms.size)
+
+
+def open_store(asset_id, root=SERIES_DIR):
+    """프로세스 내 공유 SeriesStore (인덱스가 바뀌었으면 다시 읽음)"""
+    key = (os.path.abspath(root), str(asset_id))
+    store = _STORES.get(key)
+    if store is None:
+        store = _STORES[key] = SeriesStore(asset_id, root)
+    return store.refresh()
+
+
+def has_series(asset_id, root=SERIES_DIR):
+    return os.path.exists(os.path.join(root, str(asset_id), INDEX_NAME))
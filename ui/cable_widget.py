@@ -62,6 +62,9 @@ class CableWidget(QWidget):
         self.section = QLineEdit()
         self.section.setPlaceholderText("수동입력일 때만 사용 (예: 95)")
 
+        self.length = QLineEdit()
+        self.length.setPlaceholderText("선택 입력 (예: 120) — 입력 시 말단 단락전류로 단락열 검토")
+
         for label, w in [
             ("모드", self.mode),
             ("테이블 프로파일", self.profile),
@@ -71,6 +74,7 @@ class CableWidget(QWidget):
             ("주위온도(°C)", self.ambient),
             ("병렬 케이블 수", self.parallel),
             ("케이블 단면적 S(mm²)", self.section),
+            ("케이블 길이(m)", self.length),
         ]:
             layout.addWidget(QLabel(label))
             layout.addWidget(w)
@@ -122,7 +126,8 @@ class CableWidget(QWidget):
                 f"- 모드: {cd.get('cable_mode')}\n"
                 f"- 재질/절연/설치: {cd.get('cable_material')} / {cd.get('cable_insulation')} / {cd.get('cable_install')}\n"
                 f"- 온도/병렬: {cd.get('cable_ambient')}℃ / {cd.get('cable_parallel')}\n"
-                f"- S(수동): {cd.get('cable_section_mm2_input')}"
+                f"- S(수동): {cd.get('cable_section_mm2_input')}\n"
+                f"- 길이: {cd.get('cable_length_m') or '-'} m"
             )
         else:
             self.status.setText("저장된 케이블 조건 없음")
@@ -158,6 +163,18 @@ class CableWidget(QWidget):
                 QMessageBox.warning(self, "입력 오류", "단면적(S)은 0보다 커야 합니다.")
                 return
 
+        length_m = None
+        length_txt = self.length.text().strip()
+        if length_txt:
+            try:
+                length_m = float(length_txt)
+            except Exception:
+                QMessageBox.warning(self, "입력 오류", "케이블 길이는 숫자로 입력하세요.")
+                return
+            if length_m <= 0:
+                QMessageBox.warning(self, "입력 오류", "케이블 길이는 0보다 커야 합니다.")
+                return
+
         # ✅ 핵심: ResultWidget이 읽는 키와 100% 일치시키기(cable_ 접두사 고정)
         data = {
             "cable_mode": mode,
@@ -168,6 +185,7 @@ class CableWidget(QWidget):
             "cable_ambient": ambient,
             "cable_parallel": parallel,
             "cable_section_mm2_input": section_mm2,  # MANUAL일 때만 값
+            "cable_length_m": length_m,  # 선택: 말단 Isc·단락열 동시 선정
         }
 
         self.parent.cable_data = data
@@ -177,6 +195,7 @@ class CableWidget(QWidget):
             f"- 모드: {mode} / 프로파일: {profile}\n"
             f"- {data['cable_material']} / {data['cable_insulation']} / {data['cable_install']}\n"
             f"- {data['cable_ambient']:.0f}℃ / 병렬 {data['cable_parallel']}\n"
-            f"- S(수동): {('미사용(AUTO)' if section_mm2 is None else f'{section_mm2:.0f}mm²')}"
+            f"- S(수동): {('미사용(AUTO)' if section_mm2 is None else f'{section_mm2:.0f}mm²')}\n"
+            f"- 길이: {('-' if length_m is None else f'{length_m:.0f} m')}"
         )
         QMessageBox.information(self, "저장", "케이블 조건 저장 완료")
@@ -1,12 +1,14 @@
 # ui/detail_result_widget.py
 import os
 import json
+import hashlib
+from datetime import datetime
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
     QScrollArea, QStackedWidget, QComboBox, QFrame
 )
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtCore import QThread, QTimer, Qt, Signal
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -15,14 +17,39 @@ import numpy as np
 from scipy.stats import genextreme
 
 from analysis.evt_analysis import fit_gev
+from analysis.evt_bootstrap import bootstrap_ci_from_params, bootstrap_gev_params
 from analysis.peak_duration import peak_duration_analysis
 from analysis.risk_score import calculate_operation_risk, operation_risk_level
-from analysis.protection_tcc import tcc_curve, tcc_protection_margin
+from analysis.trip_integrator import simulate_trip_integrator
+from calculations.tcc import DEFAULT_CURVE, CURVE_LABELS, trip_time
 
 from ui.components.result_card import ResultCard
 from utils.plot_config import set_korean_font
 
 from db_repo import update_assessment_risk, get_last_two_assessments
+from series_store import TS_PER_S, has_series, open_store
+
+
+BOOT_N = 2000
+LIMIT_TIME = 5.0
+SERIES_WINDOW_S = 7 * 86400
+
+
+class _StageWorker(QThread):
+    """기준선 무관 단계(GEV 적합·부트스트랩·계전기 적산)를 GUI 스레드 밖에서 계산"""
+    done = Signal(object, object)       # (요청 번호, stage dict 또는 예외)
+
+    def __init__(self, fn, token, parent=None):
+        super().__init__(parent)
+        self._fn = fn
+        self._token = token
+
+    def run(self):
+        try:
+            out = self._fn()
+        except Exception as e:
+            out = e
+        self.done.emit(self._token, out)
 
 
 class DetailResultWidget(QWidget):
@@ -195,6 +222,7 @@ class DetailResultWidget(QWidget):
         self.figure = Figure(figsize=(8, 10))
         self.figure.patch.set_facecolor("white")
         self.canvas = FigureCanvas(self.figure)
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
         self.canvas.setStyleSheet("background: #FFFFFF; border-radius: 14px;")
         chart.addWidget(self.canvas)
         chart.addStretch(1)
@@ -206,8 +234,17 @@ class DetailResultWidget(QWidget):
         self.results = None
         self.dt = 1.0
         self.load_series = None
+        self._series_id = None
         self._baseline_key = "I_design"
 
+        # 단계 캐시(시계열 기준) / 현재 그래프의 기준선 관련 artist / blit 배경
+        self._stage = None
+        self._artists = None
+        self._background = None
+        # 백그라운드 단계 계산: 요청 번호(늦게 끝난 이전 요청 결과는 버림) / 계산 중인 키
+        self._stage_token = 0
+        self._stage_pending = None
+
     def _prev_path(self) -> str:
         base = os.path.dirname(os.path.dirname(__file__))
         return os.path.join(base, "data", "prev_judgement.json")
@@ -230,26 +267,41 @@ class DetailResultWidget(QWidget):
         else:
             self._baseline_key = "I_allow_hard"
 
-        if self.results is not None and self.load_series is not None:
+        if self.results is None or self.load_series is None:
+            return
+        if self._stage is not None and self._artists is not None and self._stage["key"] == self._series_key():
+            self._refresh_baseline()
+        else:
             self.run_analysis()
 
     def load_data(self, input_data, results):
         self.input_data = input_data or {}
         self.results = results or {}
+        # 결과(계전기 설정 등)가 바뀌므로 시계열이 같아도 단계 캐시 폐기(계산 중인 요청도 무효)
+        self._stage = None
+        self._stage_pending = None
+        self._stage_token += 1
 
         dt = float(self.results.get("dt", 1.0))
         self.dt = dt if dt > 0 else 1.0
 
-        base = float(self.results.get("I_load", self.results.get("limit_current", 0.0)) or 0.0)
-        if base <= 0:
-            base = 100.0
+        self.load_series = None
+        self._series_id = None
+        asset_id = self.results.get("asset_id")
+        if asset_id is not None and has_series(asset_id):
+            self._load_store_series(asset_id)
 
-        seed = int(self.results.get("demo_seed", 2025))
-        rng = np.random.default_rng(seed)
-        self.load_series = (base + rng.normal(0.0, base * 0.05, size=300)).astype(float)
+        if self.load_series is None:
+            base = float(self.results.get("I_load", self.results.get("limit_current", 0.0)) or 0.0)
+            if base <= 0:
+                base = 100.0
 
-        self.results["data_source_note"] = f"데모 시계열(시뮬레이션, seed={seed})"
-        self.results["is_demo"] = True
+            seed = int(self.results.get("demo_seed", 2025))
+            rng = np.random.default_rng(seed)
+            self.load_series = (base + rng.normal(0.0, base * 0.05, size=300)).astype(float)
+
+            self.results["data_source_note"] = f"데모 시계열(시뮬레이션, seed={seed})"
+            self.results["is_demo"] = True
 
         if self.results.get("I_design") is not None:
             self.baseline_combo.setCurrentIndex(0)
@@ -260,6 +312,41 @@ class DetailResultWidget(QWidget):
 
         QTimer.singleShot(0, self.run_analysis)
 
+    def _load_store_series(self, asset_id):
+        """
+        계측 저장소(series_store)에서 시계열 구간을 memmap 그대로 사용
+        results["series_window"] = (시작, 끝) [epoch ms]가 없으면 최근 SERIES_WINDOW_S
+        """
+        try:
+            store = open_store(asset_id)
+            t_first, t_last = store.span()
+            if t_last is None:
+                return
+            window = self.results.get("series_window")
+            if window:
+                t0, t1 = int(window[0]), int(window[1])
+            else:
+                t0, t1 = max(t_first, t_last - SERIES_WINDOW_S * TS_PER_S), t_last + 1
+            ts, val = store.read(t0, t1)
+        except (OSError, ValueError):
+            return
+        if val.size == 0:
+            return
+
+        if store.dt:
+            self.dt = float(store.dt)
+        self.load_series = val
+        # 저장소 구간은 (설비, 시각 범위, 표본 수)로 식별 → 캐시 키에 시계열 해시 불필요
+        self._series_id = (str(asset_id), int(ts[0]), int(ts[-1]), int(val.size))
+
+        fmt = "%Y-%m-%d %H:%M"
+        span = (
+            f"{datetime.fromtimestamp(ts[0] / TS_PER_S).strftime(fmt)}"
+            f"~{datetime.fromtimestamp(ts[-1] / TS_PER_S).strftime(fmt)}"
+        )
+        self.results["data_source_note"] = f"계측 시계열(설비 {asset_id}, {val.size:,}점, {span})"
+        self.results["is_demo"] = False
+
     @staticmethod
     def _safe_hist_bins(x):
         n = len(x)
@@ -292,7 +379,9 @@ class DetailResultWidget(QWidget):
         except Exception:
             return np.zeros_like(xgrid, dtype=float)
 
-    def _get_baseline(self):
+    def _get_baseline(self, baseline_key=None):
+        baseline_key = baseline_key or self._baseline_key
+
         def _f(key):
             try:
                 v = self.results.get(key, None)
@@ -307,10 +396,10 @@ class DetailResultWidget(QWidget):
         baseline = None
         label = ""
 
-        if self._baseline_key == "I_allow_hard":
+        if baseline_key == "I_allow_hard":
             baseline = I_allow
             label = "I_allow(30℃ 허용)"
-        elif self._baseline_key == "I_load":
+        elif baseline_key == "I_load":
             baseline = I_load
             label = "I_load(부하)"
         else:
@@ -326,47 +415,33 @@ class DetailResultWidget(QWidget):
 
         return baseline, label, I_load, I_design, I_allow
 
-    @staticmethod
-    def _bootstrap_evt_ci(series_evt, baseline, n_boot=200, seed=2025):
-        rng = np.random.default_rng(int(seed))
-        x = np.array(series_evt, dtype=float)
-        if x.size < 8:
-            return None, None, None
-
-        probs = []
-        for _ in range(int(n_boot)):
-            sample = rng.choice(x, size=x.size, replace=True)
-            try:
-                gev = fit_gev(sample, baseline)
-                p = float(gev.get("exceed_prob", np.nan))
-                if np.isfinite(p):
-                    probs.append(min(max(p, 0.0), 1.0))
-            except Exception:
-                continue
-
-        if len(probs) < 20:
-            return None, None, None
-
-        probs = np.array(probs, dtype=float)
-        return float(np.quantile(probs, 0.025)), float(np.quantile(probs, 0.975)), float(np.mean(probs))
-
-    def run_analysis(self):
-        if self.results is None or self.load_series is None:
-            return
-
-        y = self.load_series
-        dt = self.dt
-        t = np.arange(len(y)) * dt
-
-        baseline, baseline_label, I_load, I_design, I_allow = self._get_baseline()
-
-        LIMIT_TIME = 5.0
-
-        hard_code = self.results.get("equipment_status", "")
-        self.equip_title.setText(self.results.get("equipment_final_line", ""))
-        self.equip_desc.setText(self.results.get("equipment_final_sub", ""))
+    def _series_key(self):
+        """단계 캐시 키: 시계열 식별(저장소 구간 또는 해시) + 블록 크기 + dt + 부트스트랩 seed"""
+        series_id = self._series_id
+        if series_id is None:
+            y = np.ascontiguousarray(self.load_series, dtype=float)
+            series_id = hashlib.sha1(y.tobytes()).hexdigest()
+        block_size = max(int(round(10.0 / self.dt)), 5)
+        seed = int(self.results.get("demo_seed", 2025))
+        return series_id, block_size, self.dt, seed
+
+    def _stage_job(self, baseline):
+        """현재 시계열/결과로 _compute_stage 호출을 묶음(결과 dict 값은 GUI 스레드에서 미리 읽음)"""
+        r = self.results
+        args = (
+            self._series_key(), self.load_series, self.dt, baseline,
+            r.get("breaker_pickup"), r.get("breaker_tms"), r.get("breaker_curve") or DEFAULT_CURVE,
+            r.get("Isc_A"), r.get("t_trip_est", None),
+        )
+        return lambda: self._compute_stage(*args)
 
-        block_size = max(int(round(10.0 / dt)), 5)
+    @staticmethod
+    def _compute_stage(key, y, dt, baseline, pickup, tms, curve, Isc_A, t_trip):
+        """
+        기준선과 무관한 단계: 블록 최대값 → GEV 적합 → 부트스트랩 재표본 모수 → 계전기 적산
+        위젯 상태를 건드리지 않음(작업 스레드에서 실행), 기준선별 결과는 stage["by_baseline"]에 누적
+        """
+        block_size, seed = key[1], key[3]
         n_blocks = len(y) // block_size
 
         if n_blocks >= 8:
@@ -381,38 +456,11 @@ class DetailResultWidget(QWidget):
             evt_def = "EVT(원시 시계열 기준) 초과확률  P(sample > 기준선)"
             evt_kind = "RAW"
 
-        observed_exceed_sample = float(np.mean(y > baseline))
-        observed_exceed_evt = float(np.mean(series_evt > baseline))
-
         gev = fit_gev(series_evt, baseline)
-        c = float(gev["shape"])
-        loc = float(gev["loc"])
-        scale = float(gev["scale"])
-
-        evt_prob = float(gev.get("exceed_prob", 0.0))
-        evt_prob = min(max(evt_prob, 0.0), 1.0)
-
-        ci_low, ci_high, ci_mean = self._bootstrap_evt_ci(
-            series_evt=series_evt,
-            baseline=baseline,
-            n_boot=200,
-            seed=int(self.results.get("demo_seed", 2025)),
-        )
-
-        durations = peak_duration_analysis(y, baseline)
-        durations = durations if isinstance(durations, np.ndarray) else np.array([])
-        durations_sec = durations.astype(float) * dt if durations.size > 0 else np.array([])
-        max_duration = float(durations_sec.max()) if durations_sec.size > 0 else 0.0
-
-        breaker_ok = (self.results.get("breaker_result") == "적합")
+        boot = bootstrap_gev_params(series_evt, n_boot=BOOT_N, seed=seed)
 
-        pickup = self.results.get("breaker_pickup")
-        tms = self.results.get("breaker_tms")
-        Isc_A = self.results.get("Isc_A")
-
-        tcc_margin = None
+        trip_sim = None
         tcc_available = True
-        t_trip = self.results.get("t_trip_est", None)
 
         try:
             pickup = float(pickup)
@@ -424,16 +472,192 @@ class DetailResultWidget(QWidget):
             tcc_available = False
 
         if tcc_available:
-            tcc_margin = tcc_protection_margin(Isc_A, max_duration, pickup, tms)
+            # 부하 시계열 전체에 계전기 적산(복귀 특성 포함) → 트립까지 남은 여유
+            trip_sim = simulate_trip_integrator(y, pickup, tms, dt, curve)
             if t_trip is None:
                 try:
-                    t_trip = float(tcc_curve(np.array([Isc_A]), pickup, tms)[0])
+                    t_trip = float(trip_time(Isc_A, pickup, tms, curve))
                 except Exception:
                     t_trip = None
+            if t_trip is not None and not np.isfinite(t_trip):
+                t_trip = None
         else:
-            tcc_margin = None
             t_trip = None
 
+        return {
+            "key": key,
+            "series_evt": series_evt,
+            "evt_method": evt_method,
+            "evt_def": evt_def,
+            "evt_kind": evt_kind,
+            "c": float(gev["shape"]),
+            "loc": float(gev["loc"]),
+            "scale": float(gev["scale"]),
+            "fit_method": gev.get("method", "mle"),
+            "boot": boot,
+            "tcc_available": tcc_available,
+            "pickup": pickup,
+            "tms": tms,
+            "curve": curve,
+            "Isc_A": Isc_A,
+            "trip_sim": trip_sim,
+            "tcc_margin": trip_sim["trip_margin"] if trip_sim is not None else None,
+            "t_trip": t_trip,
+            "by_baseline": {},
+        }
+
+    def _baseline_stage(self, stage, baseline):
+        """기준선 의존 단계: 캐시된 모수 위 CDF/CI 재평가 + 초과 지속시간"""
+        hit = stage["by_baseline"].get(baseline)
+        if hit is not None:
+            return hit
+
+        y = self.load_series
+        series_evt = stage["series_evt"]
+
+        evt_prob = float(1.0 - genextreme.cdf(baseline, stage["c"], stage["loc"], stage["scale"]))
+        evt_prob = min(max(evt_prob, 0.0), 1.0)
+
+        ci = bootstrap_ci_from_params(stage["boot"], baseline)
+
+        durations = peak_duration_analysis(y, baseline)
+        durations = durations if isinstance(durations, np.ndarray) else np.array([])
+        durations_sec = durations.astype(float) * self.dt if durations.size > 0 else np.array([])
+
+        out = {
+            "evt_prob": evt_prob,
+            "observed_exceed_sample": float(np.mean(y > baseline)),
+            "observed_exceed_evt": float(np.mean(series_evt > baseline)),
+            "ci_low": ci["low"],
+            "ci_high": ci["high"],
+            "ci_n": ci["n_used"],
+            "max_duration": float(durations_sec.max()) if durations_sec.size > 0 else 0.0,
+        }
+        stage["by_baseline"][baseline] = out
+        return out
+
+    def run_analysis(self):
+        if self.results is None or self.load_series is None:
+            return
+
+        baseline, baseline_label, I_load, I_design, I_allow = self._get_baseline()
+
+        self.equip_title.setText(self.results.get("equipment_final_line", ""))
+        self.equip_desc.setText(self.results.get("equipment_final_sub", ""))
+
+        key = self._series_key()
+        if self._stage is None or self._stage["key"] != key:
+            # GEV 적합(MLE)·부트스트랩은 긴 계측 시계열에서 수 초 → 작업 스레드, 끝나면 다시 호출
+            if self._stage_pending != key:
+                self._stage_pending = key
+                self._stage_token += 1
+                self.risk_note.setText("시계열 분석 중…")
+                worker = _StageWorker(self._stage_job(baseline), self._stage_token, self)
+                worker.done.connect(self._on_stage_ready)
+                worker.finished.connect(worker.deleteLater)
+                worker.start()
+            return
+
+        stage = self._stage
+        bs = self._baseline_stage(stage, baseline)
+
+        self._fill_text(stage, bs, baseline, baseline_label, I_load, I_design, I_allow)
+        self._draw_figure(stage, bs, baseline, baseline_label)
+
+    def _on_stage_ready(self, token, stage):
+        if token != self._stage_token:
+            return                      # 이후 요청(다른 시계열/결과)으로 대체됨
+        self._stage_pending = None
+        if isinstance(stage, Exception):
+            self.risk_note.setText(f"시계열 분석 실패: {stage}")
+            return
+        self._stage = stage
+        self._artists = None
+        self.run_analysis()
+
+    def _refresh_baseline(self):
+        """기준선만 바뀐 경우: 적합/부트스트랩/적산 재사용, 기준선 artist와 텍스트만 갱신"""
+        baseline, baseline_label, I_load, I_design, I_allow = self._get_baseline()
+        stage = self._stage
+        bs = self._baseline_stage(stage, baseline)
+
+        self._fill_text(stage, bs, baseline, baseline_label, I_load, I_design, I_allow)
+
+        a = self._artists
+        label = f"기준선({baseline_label})"
+        a["base1"].set_ydata([baseline, baseline])
+        a["base1"].set_label(label)
+        a["base2"].set_xdata([baseline, baseline])
+        a["base2"].set_label(label)
+        a["p_model"].set_text(f"P_model(exceed)={bs['evt_prob']:.2%}")
+        a["p_obs"].set_text(f"P_obs(sample)={bs['observed_exceed_sample']:.2%}")
+        a["ci"].set_text(self._ci_plot_text(bs))
+
+        for leg in a["legends"]:
+            for txt in leg.get_texts():
+                if txt.get_text().startswith("기준선("):
+                    txt.set_text(label)
+
+        # 축 범위는 그릴 때 모든 기준선 후보를 포함 → 보통 배경(축/눈금/히스토그램/TCC) 그대로 blit
+        y0, y1 = sorted(a["ax1"].get_ylim())
+        x0, x1 = sorted(a["ax2"].get_xlim())
+        if self._background is None or not (y0 <= baseline <= y1 and x0 <= baseline <= x1):
+            self._draw_figure(stage, bs, baseline, baseline_label)
+            return
+
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+    def _animated(self):
+        a = self._artists
+        if a is None:
+            return []
+        return [a["base1"], a["base2"], a["p_model"], a["p_obs"], a["ci"], *a["legends"]]
+
+    def _draw_animated(self):
+        for artist in self._animated():
+            self.figure.draw_artist(artist)
+
+    def _on_canvas_draw(self, event):
+        """전체 렌더 직후: 기준선 artist를 뺀 배경 저장 후 그 위에 다시 그림"""
+        if self._artists is None:
+            self._background = None
+            return
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+        # loc="best"는 그릴 때마다 모든 데이터 점을 훑음 → 정해진 위치로 고정(blit 시 재탐색 방지)
+        for leg in self._artists["legends"]:
+            bb = leg.get_window_extent()
+            ref = leg.get_bbox_to_anchor()
+            leg.set_loc(((bb.x0 - ref.x0) / ref.width, (bb.y0 - ref.y0) / ref.height))
+
+    @staticmethod
+    def _ci_plot_text(bs):
+        if bs["ci_low"] is None or bs["ci_high"] is None:
+            return ""
+        return f"CI95% [{bs['ci_low']:.2%},{bs['ci_high']:.2%}] (L-모멘트 boot n={bs['ci_n']:,})"
+
+    def _fill_text(self, stage, bs, baseline, baseline_label, I_load, I_design, I_allow):
+        hard_code = self.results.get("equipment_status", "")
+
+        series_evt = stage["series_evt"]
+        evt_method = stage["evt_method"]
+        evt_def = stage["evt_def"]
+        evt_kind = stage["evt_kind"]
+
+        evt_prob = bs["evt_prob"]
+        observed_exceed_sample = bs["observed_exceed_sample"]
+        observed_exceed_evt = bs["observed_exceed_evt"]
+        ci_low, ci_high, ci_n = bs["ci_low"], bs["ci_high"], bs["ci_n"]
+        max_duration = bs["max_duration"]
+
+        breaker_ok = (self.results.get("breaker_result") == "적합")
+        tcc_available = stage["tcc_available"]
+        trip_sim = stage["trip_sim"]
+        t_trip = stage["t_trip"]
+
         # t_clear_* 먼저 파싱(아래 note_lines에서 쓰임)
         t_clear_input = self.results.get("t_clear_input", None)
         t_clear_used = self.results.get("t_clear_used", None)
@@ -451,12 +675,11 @@ class DetailResultWidget(QWidget):
             evt_prob=evt_prob,
             max_duration=max_duration,
             duration_limit=LIMIT_TIME,
-            tcc_margin=tcc_margin,
+            tcc_margin=stage["tcc_margin"],
             breaker_ok=breaker_ok,
             hard_status=hard_code,
             is_demo=bool(self.results.get("is_demo", False)),
         )
-
         note = self.results.get("data_source_note", "")
         is_demo = bool(self.results.get("is_demo", False))
         demo_tag = " [DEMO]" if is_demo else ""
@@ -499,7 +722,10 @@ class DetailResultWidget(QWidget):
         note_lines.append(f"관측 초과율(샘플): {observed_exceed_sample:.2%}")
         note_lines.append(f"관측 초과율(EVT표본): {observed_exceed_evt:.2%}")
         if ci_low is not None and ci_high is not None:
-            note_lines.append(f"EVT 초과확률(모델): {evt_prob:.2%} | 95% CI [{ci_low:.2%}, {ci_high:.2%}] (n=200)")
+            note_lines.append(
+                f"EVT 초과확률(모델, {stage['fit_method']}): {evt_prob:.2%} | "
+                f"95% CI [{ci_low:.2%}, {ci_high:.2%}] (L-모멘트 부트스트랩, n={ci_n:,})"
+            )
         else:
             note_lines.append(f"EVT 초과확률(모델): {evt_prob:.2%} | CI 계산 불가(표본 부족/실패)")
 
@@ -509,6 +735,16 @@ class DetailResultWidget(QWidget):
         if t_clear_used is not None:
             note_lines.append(f"단락열 적용 차단시간(t_used): {t_clear_used:.3f}s ({t_clear_policy})")
 
+        if trip_sim is not None:
+            if trip_sim["nuisance_trip"]:
+                note_lines.append(
+                    f"계전기 적산: 부하만으로 트립 {trip_sim['n_trips']}회 "
+                    f"(최초 {trip_sim['first_trip_s']:.1f}s) → 불필요 트립 위험"
+                )
+            else:
+                near = " (트립 근접)" if trip_sim["near_trip"] else ""
+                note_lines.append(f"계전기 적산: 최대 진행률 {trip_sim['theta_peak']:.1%}{near}")
+
         if is_demo:
             note_lines.append("DEMO: 시뮬레이션 데이터이므로 정량 점수/DB 반영 비활성(그래프 UI 확인용)")
 
@@ -542,12 +778,100 @@ class DetailResultWidget(QWidget):
             f"- 적용 t_used: {('-' if t_clear_used is None else f'{t_clear_used:.3f}s')} ({t_clear_policy})"
         )
 
-        # ===== 그래프(기존 유지) =====
+
+        assessment_id = self.results.get("assessment_id")
+        asset_id = self.results.get("asset_id")
+
+        try:
+            if (not is_demo) and (assessment_id is not None):
+                update_assessment_risk(
+                    assessment_id=assessment_id,
+                    risk_internal=float(risk["total"]),
+                    risk_external=0.0
+                )
+        except Exception:
+            pass
+
+        compare_text = "이전 판정 데이터 없음"
+
+        try:
+            if asset_id is not None:
+                rows = get_last_two_assessments(asset_id)
+                if isinstance(rows, (list, tuple)) and len(rows) == 2:
+                    curr = rows[0]
+                    prev = rows[1]
+
+                    _, curr_hard, curr_risk, _ = curr
+                    _, prev_hard, prev_risk, _ = prev
+
+                    delta = None
+                    if curr_risk is not None and prev_risk is not None:
+                        delta = float(curr_risk) - float(prev_risk)
+
+                    arrow = "→"
+                    if delta is not None:
+                        arrow = "▲" if delta > 0 else "▼" if delta < 0 else "→"
+                    delta_txt = f"{delta:+.1f}" if delta is not None else "-"
+
+                    cr = f"{float(curr_risk):.1f}" if curr_risk is not None else "-"
+                    pr = f"{float(prev_risk):.1f}" if prev_risk is not None else "-"
+
+                    compare_text = (
+                        "이전 판정 대비 변화(DB)\n"
+                        f"- 설비 판정: {prev_hard} → {curr_hard}\n"
+                        f"- 위험도 점수: {pr} → {cr} ({arrow} {delta_txt})"
+                    )
+        except Exception:
+            compare_text = "이전 판정 데이터 없음"
+
+        if compare_text == "이전 판정 데이터 없음":
+            prev_local = self._load_prev()
+            if isinstance(prev_local, dict) and prev_local:
+                compare_text = (
+                    "이전 판정 대비 변화(로컬)\n"
+                    f"- 규정판정: {prev_local.get('equipment_status', '-')} → {hard_code}\n"
+                    f"- 차단기: {prev_local.get('breaker_result', '-')} → {self.results.get('breaker_result', '-')}\n"
+                )
+
+        self.compare_label.setText(compare_text)
+
+
+    def _draw_figure(self, stage, bs, baseline, baseline_label):
+        """전체 그래프 재작성 — 기준선 변경 시에는 _refresh_baseline이 artist만 갱신"""
+        y = self.load_series
+        t = np.arange(len(y)) * self.dt
+        note = self.results.get("data_source_note", "")
+
+        series_evt = stage["series_evt"]
+        evt_method = stage["evt_method"]
+        c, loc, scale = stage["c"], stage["loc"], stage["scale"]
+        tcc_available = stage["tcc_available"]
+        pickup, tms, curve, Isc_A = stage["pickup"], stage["tms"], stage["curve"], stage["Isc_A"]
+        t_trip = stage["t_trip"]
+        breaker_ok = (self.results.get("breaker_result") == "적합")
+
+        t_clear_input = self.results.get("t_clear_input", None)
+        t_clear_used = self.results.get("t_clear_used", None)
+        t_clear_policy = self.results.get("t_clear_policy", "NONE")
+        try:
+            t_clear_input = float(t_clear_input) if t_clear_input is not None else None
+        except Exception:
+            t_clear_input = None
+        try:
+            t_clear_used = float(t_clear_used) if t_clear_used is not None else None
+        except Exception:
+            t_clear_used = None
+
+        self._artists = None
         self.figure.clear()
 
         ax1 = self.figure.add_subplot(311)
         ax1.plot(t, y)
-        ax1.axhline(baseline, linestyle="--", label=f"기준선({baseline_label})")
+        base1 = ax1.axhline(baseline, linestyle="--", label=f"기준선({baseline_label})")
+        # 기준선 전환 시 축이 움직이지 않도록 선택 가능한 기준선 전부를 데이터 범위에 포함
+        candidates = [self._get_baseline(k)[0] for k in ("I_design", "I_load", "I_allow_hard")]
+        ax1.update_datalim([(t[0], b) for b in candidates])
+        ax1.autoscale_view()
         ax1.set_title("부하 전류 시계열")
         ax1.set_xlabel("Time (s)")
         ax1.set_ylabel("Current (A)")
@@ -570,15 +894,16 @@ class DetailResultWidget(QWidget):
             pdf_plot = pdf
 
         ax2.plot(xgrid, pdf_plot, linewidth=2, label="GEV PDF (clipped)")
-        ax2.axvline(baseline, linestyle="--", label=f"기준선({baseline_label})")
+        base2 = ax2.axvline(baseline, linestyle="--", label=f"기준선({baseline_label})")
+        ax2.update_datalim([(b, 0.0) for b in candidates])
+        ax2.autoscale_view()
         ax2.set_title(f"EVT (GEV) 분포 - {evt_method}")
         ax2.set_xlabel("Current (A)")
         ax2.set_ylabel("Density")
-        ax2.text(0.02, 0.90, f"fit: c={c:.3f}, loc={loc:.1f}, scale={scale:.3f}", transform=ax2.transAxes, fontsize=9)
-        ax2.text(0.02, 0.80, f"P_model(exceed)={evt_prob:.2%}", transform=ax2.transAxes, fontsize=9)
-        ax2.text(0.02, 0.70, f"P_obs(sample)={observed_exceed_sample:.2%}", transform=ax2.transAxes, fontsize=9)
-        if ci_low is not None and ci_high is not None:
-            ax2.text(0.02, 0.60, f"CI95% [{ci_low:.2%},{ci_high:.2%}] (boot n=200)", transform=ax2.transAxes, fontsize=9)
+        ax2.text(0.02, 0.90, f"fit({stage['fit_method']}): c={c:.3f}, loc={loc:.1f}, scale={scale:.3f}", transform=ax2.transAxes, fontsize=9)
+        p_model = ax2.text(0.02, 0.80, f"P_model(exceed)={bs['evt_prob']:.2%}", transform=ax2.transAxes, fontsize=9)
+        p_obs = ax2.text(0.02, 0.70, f"P_obs(sample)={bs['observed_exceed_sample']:.2%}", transform=ax2.transAxes, fontsize=9)
+        ci_text = ax2.text(0.02, 0.60, self._ci_plot_text(bs), transform=ax2.transAxes, fontsize=9)
         ax2.legend()
 
         ax3 = self.figure.add_subplot(313)
@@ -590,8 +915,8 @@ class DetailResultWidget(QWidget):
         if tcc_available:
             Imax = max(float(np.max(y)), Isc_A, pickup * 2.0)
             I = np.logspace(np.log10(pickup * 1.05), np.log10(Imax * 2.0), 300)
-            T = tcc_curve(I, pickup, tms)
-            ax3.loglog(I, T, label="차단기 TCC")
+            T = trip_time(I, pickup, tms, curve)
+            ax3.loglog(I, T, label=f"차단기 TCC ({CURVE_LABELS.get(curve, curve)})")
 
             if Isc_A > 0 and t_trip is not None:
                 ax3.scatter([Isc_A], [t_trip], zorder=5, label="● 단락전류 Isc")
@@ -612,64 +937,16 @@ class DetailResultWidget(QWidget):
 
         self.figure.tight_layout()
         self.figure.subplots_adjust(hspace=0.65)
+        self._artists = {
+            "ax1": ax1, "ax2": ax2, "base1": base1, "base2": base2,
+            "p_model": p_model, "p_obs": p_obs, "ci": ci_text,
+            "legends": [ax1.get_legend(), ax2.get_legend()],
+        }
+        # 기준선 의존 artist는 blit 대상(배경에서 제외)
+        for artist in self._animated():
+            artist.set_animated(True)
         self.canvas.draw()
 
-        assessment_id = self.results.get("assessment_id")
-        asset_id = self.results.get("asset_id")
-
-        try:
-            if (not is_demo) and (assessment_id is not None):
-                update_assessment_risk(
-                    assessment_id=assessment_id,
-                    risk_internal=float(risk["total"]),
-                    risk_external=0.0
-                )
-        except Exception:
-            pass
-
-        compare_text = "이전 판정 데이터 없음"
-
-        try:
-            if asset_id is not None:
-                rows = get_last_two_assessments(asset_id)
-                if isinstance(rows, (list, tuple)) and len(rows) == 2:
-                    curr = rows[0]
-                    prev = rows[1]
-
-                    _, curr_hard, curr_risk, _ = curr
-                    _, prev_hard, prev_risk, _ = prev
-
-                    delta = None
-                    if curr_risk is not None and prev_risk is not None:
-                        delta = float(curr_risk) - float(prev_risk)
-
-                    arrow = "→"
-                    if delta is not None:
-                        arrow = "▲" if delta > 0 else "▼" if delta < 0 else "→"
-                    delta_txt = f"{delta:+.1f}" if delta is not None else "-"
-
-                    cr = f"{float(curr_risk):.1f}" if curr_risk is not None else "-"
-                    pr = f"{float(prev_risk):.1f}" if prev_risk is not None else "-"
-
-                    compare_text = (
-                        "이전 판정 대비 변화(DB)\n"
-                        f"- 설비 판정: {prev_hard} → {curr_hard}\n"
-                        f"- 위험도 점수: {pr} → {cr} ({arrow} {delta_txt})"
-                    )
-        except Exception:
-            compare_text = "이전 판정 데이터 없음"
-
-        if compare_text == "이전 판정 데이터 없음":
-            prev_local = self._load_prev()
-            if isinstance(prev_local, dict) and prev_local:
-                compare_text = (
-                    "이전 판정 대비 변화(로컬)\n"
-                    f"- 규정판정: {prev_local.get('equipment_status', '-')} → {hard_code}\n"
-                    f"- 차단기: {prev_local.get('breaker_result', '-')} → {self.results.get('breaker_result', '-')}\n"
-                )
-
-        self.compare_label.setText(compare_text)
-
     def go_result(self):
         p = self.parent()
         if p is None:
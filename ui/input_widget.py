@@ -56,6 +56,9 @@ class InputWidget(QWidget):
         self.t_clear = QLineEdit()
         self.t_clear.setPlaceholderText("선택 입력 (예: 0.2)")
 
+        self.asset_id = QLineEdit()
+        self.asset_id.setPlaceholderText("선택 입력 — 계측 저장소 설비 번호(없으면 데모 시계열)")
+
         for label, widget in [
             ("전압(kV)", self.voltage),
             ("변압기 용량(kVA)", self.capacity),
@@ -65,6 +68,7 @@ class InputWidget(QWidget):
             ("기준", self.standard),
             ("샘플 간격 dt(s)", self.dt),
             ("고장 제거시간 t_clear(s)", self.t_clear),
+            ("설비 ID(계측 시계열)", self.asset_id),
         ]:
             lb = QLabel(label)
             lb.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
@@ -146,6 +150,9 @@ class InputWidget(QWidget):
             t_txt = self.t_clear.text().strip()
             data["t_clear"] = float(t_txt) if t_txt else None
 
+            a_txt = self.asset_id.text().strip()
+            data["asset_id"] = (int(a_txt) if a_txt.isdigit() else a_txt) if a_txt else None
+
         except ValueError:
             QMessageBox.warning(self, "입력 오류", "숫자 형식이 올바르지 않습니다.")
             return
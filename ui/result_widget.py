@@ -1,6 +1,8 @@
 # ui/result_widget.py
 import json
+import math
 import os
+from collections.abc import Mapping
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
@@ -10,15 +12,8 @@ from PySide6.QtCore import Qt
 
 from ui.components.result_card import ResultCard
 
-from calculations.engineering import (
-    rated_current,
-    short_circuit_current,
-    breaker_judgement,
-    cable_allowable_hard_op,
-    thermal_adiabatic_check,
-)
-
-from analysis.protection_tcc import tcc_curve
+from calculations.assessment import run_assessment
+from calculations.headroom import assessment_headroom
 
 
 class ResultWidget(QWidget):
@@ -48,20 +43,24 @@ class ResultWidget(QWidget):
 
         self.btn_home = QPushButton("← 홈으로")
         self.btn_input = QPushButton("← 입력으로")
+        self.btn_sweep = QPushButton("설계공간 스윕 →")
         self.btn_detail = QPushButton("상세 분석 →")
         self.btn_detail.setObjectName("PrimaryButton")
 
         self.btn_home.setMinimumHeight(40)
         self.btn_input.setMinimumHeight(40)
+        self.btn_sweep.setMinimumHeight(40)
         self.btn_detail.setMinimumHeight(40)
 
         self.btn_home.clicked.connect(self.go_home)
         self.btn_input.clicked.connect(self.go_input)
+        self.btn_sweep.clicked.connect(self.go_sweep)
         self.btn_detail.clicked.connect(self.go_detail)
 
         nav_l.addWidget(self.btn_home)
         nav_l.addWidget(self.btn_input)
         nav_l.addStretch(1)
+        nav_l.addWidget(self.btn_sweep)
         nav_l.addWidget(self.btn_detail)
         outer.addWidget(nav)
 
@@ -166,6 +165,12 @@ class ResultWidget(QWidget):
         self.card_thermal.add_widget(self.lb_thermal)
         self.layout.addWidget(self.card_thermal)
 
+        self.card_headroom = ResultCard("여유 한계(역산)")
+        self.lb_headroom = QLabel("")
+        _plain(self.lb_headroom, "CardBody")
+        self.card_headroom.add_widget(self.lb_headroom)
+        self.layout.addWidget(self.card_headroom)
+
         self.card_compare = ResultCard("이전과 비교")
         self.lb_compare = QLabel("")
         _plain(self.lb_compare, "CardBody")
@@ -233,56 +238,6 @@ class ResultWidget(QWidget):
         except Exception:
             return "-"
 
-    @staticmethod
-    def _auto_tcc_params(In_A, I_load, Isc_A):
-        base = None
-        if In_A is not None and In_A > 0:
-            base = float(In_A)
-        elif I_load is not None and I_load > 0:
-            base = float(I_load)
-        else:
-            return None, None
-
-        pickup = base * 1.25
-        tms = 0.10
-
-        try:
-            if I_load is not None and I_load > 0 and pickup < (0.8 * float(I_load)):
-                pickup = float(I_load) * 1.10
-        except Exception:
-            pass
-
-        try:
-            if Isc_A is not None and Isc_A > 0 and pickup >= Isc_A:
-                pickup = Isc_A * 0.3
-        except Exception:
-            pass
-
-        if pickup <= 0 or tms <= 0:
-            return None, None
-        return float(pickup), float(tms)
-
-    @staticmethod
-    def _breaker_margin_grade(protection_ratio):
-        if protection_ratio is None:
-            return None, None
-        try:
-            r = float(protection_ratio)
-        except Exception:
-            return None, None
-
-        spare = r - 1.0
-        spare_pct = spare * 100.0
-        if spare < 0:
-            return "FAIL", spare_pct
-        if spare < 0.05:
-            return "위험(<5%)", spare_pct
-        if spare < 0.10:
-            return "경고(<10%)", spare_pct
-        if spare < 0.20:
-            return "주의(<20%)", spare_pct
-        return "충분", spare_pct
-
     def _set_badge(self, equipment_status: str):
         s = str(equipment_status or "").upper()
         if s == "PASS":
@@ -308,6 +263,55 @@ class ResultWidget(QWidget):
                 k.setText("")
                 v.setText("")
 
+    def _headroom_text(self, res, merged):
+        try:
+            h = assessment_headroom(res, merged)
+        except Exception as e:
+            return f"여유 한계 계산 불가: {e}"
+
+        def _a(key):
+            v = h.get(key)
+            return "-" if v is None else f"{v:,.0f} A"
+
+        def _signed(v, unit, fmt=",.0f"):
+            return "" if v is None else f" (여유 {v:+{fmt}} {unit})"
+
+        lines = []
+        if h.get("I_load_max") is not None:
+            amb = h.get("ambient_op")
+            amb_txt = f"{amb:.1f}℃" if amb is not None else "운영온도"
+            lines.append(f"- 최대 부하전류({amb_txt}): {_a('I_load_max')}{_signed(h.get('I_load_headroom'), 'A')}")
+        if h.get("I_load_max_30") is not None:
+            lines.append(f"- 최대 부하전류(30℃ Hard): {_a('I_load_max_30')}{_signed(h.get('I_load_headroom_30'), 'A')}")
+
+        amb_max = h.get("ambient_max")
+        if amb_max is not None:
+            if h.get("ambient_max_at_end"):
+                lines.append(f"- 한계 주위온도: 표 범위 끝(≥{amb_max:.0f}℃)까지 적합(그 이상은 표 밖)")
+            elif amb_max == float("-inf"):
+                lines.append("- 한계 주위온도: 30℃ 이하에서도 허용전류 부족")
+            else:
+                lines.append(f"- 한계 주위온도: {amb_max:.1f}℃ 이하에서 적합")
+
+        if h.get("Icu_min_kA") is not None:
+            lines.append(
+                f"- 필요 최소 Icu: {h['Icu_min_kA']:,.1f} kA"
+                f"{_signed(h.get('Icu_headroom_kA'), 'kA', ',.1f')}"
+            )
+        if h.get("t_clear_max_s") is not None:
+            t_used = h.get("t_clear_used")
+            t_txt = f" (적용 {t_used:.3f}s)" if t_used is not None else ""
+            lines.append(f"- 단락열 최대 허용 차단시간: {h['t_clear_max_s']:,.3f}s{t_txt}")
+        if h.get("S_min_thermal_mm2") is not None:
+            s_used = h.get("section_mm2")
+            s_txt = f" (현재 {s_used:.0f}mm²)" if s_used is not None else ""
+            if math.isinf(h["S_min_thermal_mm2"]):
+                lines.append(f"- 단락열 최소 단면적: 말단 고장 미동작(차단기 픽업 이하){s_txt}")
+            else:
+                lines.append(f"- 단락열 최소 단면적: {h['S_min_thermal_mm2']:,.1f}mm²{s_txt}")
+
+        return "\n".join(lines) if lines else "입력 부족으로 여유 한계 계산 불가"
+
     def go_home(self):
         if hasattr(self.parent, "home_page"):
             self.parent.setCurrentWidget(self.parent.home_page)
@@ -324,6 +328,14 @@ class ResultWidget(QWidget):
             self.parent.detail_page.load_data(self._last_input, self._last_results)
             self.parent.setCurrentWidget(self.parent.detail_page)
 
+    def go_sweep(self):
+        if self._last_input is None:
+            QMessageBox.information(self, "안내", "먼저 계산을 실행해 주세요.")
+            return
+        if hasattr(self.parent, "sweep_page"):
+            self.parent.sweep_page.load_data(self._last_input)
+            self.parent.setCurrentWidget(self.parent.sweep_page)
+
     def run_calculation(self, data: dict):
         merged = dict(data)
         cd = getattr(self.parent, "cable_data", None)
@@ -333,109 +345,36 @@ class ResultWidget(QWidget):
         prev = self._load_prev()
         self._last_input = merged
 
+        res = run_assessment(data, cd)
+
         V = self._safe_float(merged.get("V"))
         S_kVA = self._safe_float(merged.get("S"))
-        Zpct = self._safe_float(merged.get("Z"))
-        I_load = self._safe_float(merged.get("I_load"))
-        breaker_kA = self._safe_float(merged.get("breaker"))
-        standard = str(merged.get("standard") or "KESC").upper()
-
-        t_clear_input = merged.get("t_clear", None)
-        t_clear_input = self._safe_float(t_clear_input) if t_clear_input is not None else None
-
-        dt = self._safe_float(merged.get("dt", 1.0))
-        if dt is None or dt <= 0:
-            dt = 1.0
-
-        In_A = rated_current(V, S_kVA) if (V is not None and S_kVA is not None and V > 0) else None
-        Isc_A = (
-            short_circuit_current(V, S_kVA, Zpct)
-            if (V is not None and S_kVA is not None and Zpct is not None and V > 0 and Zpct > 0)
-            else None
-        )
-
-        breaker_result = "판정 불가"
-        breaker_reason = "입력 누락으로 계산 불가"
-        protection_ratio = None
-        breaker_margin = None
-        breaker_margin_pct = None
-
-        if Isc_A is not None and breaker_kA is not None:
-            breaker_result = breaker_judgement(Isc_A, breaker_kA, standard)
-            Icu_A = breaker_kA * 1000.0
-            protection_ratio = (Icu_A / Isc_A) if Isc_A > 0 else None
-
-            margin = 1.1 if standard == "IEC" else 1.0
-            required_A = Isc_A * margin
-
-            if Icu_A >= required_A:
-                spare = (Icu_A / required_A) - 1.0
-                breaker_reason = (
-                    f"Icu {breaker_kA:,.1f} kA ≥ Isc {Isc_A/1000.0:,.1f} kA "
-                    f"(계수 {margin:.2f}, 여유 {spare*100.0:,.1f}%)"
-                )
-            else:
-                lack = 1.0 - (Icu_A / required_A)
-                breaker_reason = (
-                    f"Icu {breaker_kA:,.1f} kA < Isc {Isc_A/1000.0:,.1f} kA "
-                    f"(계수 {margin:.2f}, 부족 {lack*100.0:,.1f}%)"
-                )
-
-            breaker_margin, breaker_margin_pct = self._breaker_margin_grade(protection_ratio)
-
-        design_margin = 1.25
-        I_design_calc = None
-        if I_load is not None and I_load > 0:
-            I_design_calc = float(I_load) * float(design_margin)
-
-        cable_mode = merged.get("cable_mode") or merged.get("mode")
-        table_profile = merged.get("cable_table_profile") or merged.get("table_profile")
-
-        if str(standard).upper() == "KESC":
-            table_profile = "KESC_DEFAULT"
-
-        cable_material = merged.get("cable_material") or merged.get("material")
-        cable_insulation = merged.get("cable_insulation") or merged.get("insulation")
-        cable_install = merged.get("cable_install") or merged.get("install")
-        cable_parallel = merged.get("cable_parallel") or merged.get("parallel")
-        cable_section_in = merged.get("cable_section_mm2_input") or merged.get("section_mm2_input")
-        cable_ambient = merged.get("cable_ambient") or merged.get("ambient")
-
-        ambient_op = self._safe_float(merged.get("ambient_op")) if merged.get("ambient_op") is not None else None
-        if ambient_op is None and cable_ambient is not None:
-            ambient_op = self._safe_float(cable_ambient)
-
-        has_cable_input = isinstance(cd, dict) and bool(cd)
-
-        if not has_cable_input:
-            cable_hard = {"status": "계산 불가", "reason": "입력 누락으로 계산 불가: 케이블 조건 미입력"}
-            cable_op = {"status": "평가 불가", "reason": "운영 조건 평가 불가: 케이블 조건 미입력"}
-        else:
-            cable_hard, cable_op = cable_allowable_hard_op(
-                I_load=I_load if I_load is not None else 0.0,
-                material=cable_material,
-                insulation=cable_insulation,
-                install=cable_install,
-                parallel=cable_parallel,
-                mode=cable_mode or "AUTO",
-                section_mm2_input=cable_section_in,
-                ambient_op=ambient_op,
-                standard=standard,
-                table_profile=table_profile,
-                design_margin=design_margin,
-            )
+        I_load = res["I_load"]
+        standard = res["standard"]
+        In_A = res["In_A"]
+        Isc_A = res["Isc_A"]
+        design_margin = res["design_margin"]
+        I_design = res["I_design"]
+        hard_I_allow = res["I_allow_hard"]
+        t_clear_input = res["t_clear_input"]
+        t_trip_est = res["t_trip_est"]
+        t_clear_used = res["t_clear_used"]
+        t_clear_policy = res["t_clear_policy"]
+        breaker_result = res["breaker_result"]
+        breaker_reason = res["breaker_reason"]
+        protection_ratio = res["protection_ratio"]
+        breaker_margin = res["breaker_margin_grade"]
+        breaker_margin_pct = res["breaker_margin_pct"]
+        equipment_status = res["equipment_status"]
+        cable_hard = res["cable_hard"]
+        cable_op = res["cable_op"]
+        thermal = res["thermal"]
 
         hard_status = cable_hard.get("status", "계산 불가")
         hard_reason = cable_hard.get("reason", "")
-
-        hard_I_allow = cable_hard.get("I_allow_total", None)
         hard_S_used = cable_hard.get("section_mm2_used", None)
         hard_profile_used = cable_hard.get("table_profile_used", None)
 
-        I_design = cable_hard.get("I_design", None)
-        if I_design is None:
-            I_design = I_design_calc
-
         cable_lines = []
         cable_lines.append(f"판정(Hard, 30℃ 고정): {hard_status}")
         if I_design is not None:
@@ -446,8 +385,12 @@ class ResultWidget(QWidget):
             cable_lines.append(f"- 허용전류(30℃): {float(hard_I_allow):,.0f} A")
         if hard_profile_used:
             cable_lines.append(f"- 테이블: {hard_profile_used}")
+        if res.get("Isc_end_A") is not None:
+            cable_lines.append(
+                f"- 말단 Isc: {self._fmt_ka_from_a(res['Isc_end_A'])} (길이 {float(res['cable_length_m']):.0f} m)"
+            )
 
-        if isinstance(cable_op, dict):
+        if isinstance(cable_op, Mapping):
             op_status = cable_op.get("status", "평가 불가")
             op_amb = cable_op.get("ambient", None)
             op_k_temp = cable_op.get("k_temp", None)
@@ -473,55 +416,6 @@ class ResultWidget(QWidget):
 
         self.lb_cable.setText("\n".join(cable_lines))
 
-        breaker_pickup, breaker_tms = self._auto_tcc_params(In_A, I_load, Isc_A)
-
-        t_trip_est = None
-        tcc_available = True
-        try:
-            if breaker_pickup is None or breaker_tms is None or Isc_A is None:
-                tcc_available = False
-            else:
-                p = float(breaker_pickup)
-                tms = float(breaker_tms)
-                isc = float(Isc_A)
-                if p <= 0 or tms <= 0 or isc <= 0:
-                    tcc_available = False
-        except Exception:
-            tcc_available = False
-
-        if tcc_available:
-            try:
-                t_trip_est = float(tcc_curve([float(Isc_A)], float(breaker_pickup), float(breaker_tms))[0])
-            except Exception:
-                t_trip_est = None
-
-        t_clear_used = None
-        t_clear_policy = "NONE"
-        if t_trip_est is not None and t_clear_input is not None:
-            t_clear_used = max(float(t_clear_input), float(t_trip_est))
-            t_clear_policy = "MAX(TCC,INPUT)"
-        elif t_trip_est is not None:
-            t_clear_used = float(t_trip_est)
-            t_clear_policy = "TCC_DEFAULT"
-        elif t_clear_input is not None:
-            t_clear_used = float(t_clear_input)
-            t_clear_policy = "INPUT_ONLY"
-        else:
-            t_clear_used = None
-            t_clear_policy = "NONE"
-
-        section_used = cable_hard.get("section_mm2_used", None) if isinstance(cable_hard, dict) else None
-        thermal = thermal_adiabatic_check(
-            I_sc_A=Isc_A,
-            t_clear_s=t_clear_used,
-            section_mm2_used=section_used,
-            material=cable_material,
-            insulation=cable_insulation,
-            standard=standard,
-            t_clear_input=t_clear_input,
-            t_trip_est=t_trip_est,
-            t_clear_policy=t_clear_policy,
-        )
         thermal_status = thermal.get("status", "계산 불가")
         thermal_reason = thermal.get("reason", "")
 
@@ -532,7 +426,7 @@ class ResultWidget(QWidget):
         thermal_lines = [
             f"판정: {thermal_status}",
             f"- t_clear 입력: {('-' if t_clear_input is None else f'{t_clear_input:.3f}s')}",
-            f"- TCC 추정: {('-' if t_trip_est is None else f'{t_trip_est:.3f}s')}",
+            f"- TCC 추정: {('-' if t_trip_est is None else f'{t_trip_est:.3f}s')} ({res.get('breaker_curve') or '-'})",
             f"- 적용 t_clear: {('-' if t_clear_used is None else f'{t_clear_used:.3f}s')} ({t_clear_policy})",
         ]
         if tr:
@@ -540,46 +434,9 @@ class ResultWidget(QWidget):
 
         self.lb_thermal.setText("\n".join(thermal_lines))
 
-        breaker_ok = (breaker_result == "적합")
-        breaker_na = (breaker_result == "판정 불가")
-        cable_fail = (hard_status == "부적합")
-        thermal_fail = (thermal_status == "부적합")
-        cable_na = (hard_status == "계산 불가")
-        thermal_na = (thermal_status == "계산 불가")
-
-        if (not breaker_ok) and (not breaker_na):
-            equipment_status = "FAIL"
-            equipment_final_line = "규정 판정(Hard Engineering): FAIL"
-            equipment_final_sub = "차단기 차단용량(Icu) 기준 미달"
-        elif cable_fail or thermal_fail:
-            equipment_status = "FAIL"
-            equipment_final_line = "규정 판정(Hard Engineering): FAIL"
-            reasons = []
-            if cable_fail:
-                reasons.append("케이블 허용전류 기준 미달")
-            if thermal_fail:
-                reasons.append("단락열(단열식) 기준 미달")
-            equipment_final_sub = " / ".join(reasons) if reasons else "규정 기준 미달 항목 존재"
-        else:
-            if breaker_na or cable_na or thermal_na:
-                equipment_status = "NEED_MORE"
-                equipment_final_line = "규정 판정(Hard Engineering): NEED_MORE"
-                need = []
-                if breaker_na:
-                    need.append("차단기/단락 입력")
-                if cable_na:
-                    need.append("케이블 조건")
-                if thermal_na:
-                    need.append("차단시간(t_clear) 또는 TCC 추정치")
-                equipment_final_sub = "추가 입력 후 재평가 필요: " + (", ".join(need) if need else "-")
-            else:
-                equipment_status = "PASS"
-                equipment_final_line = "규정 판정(Hard Engineering): PASS"
-                equipment_final_sub = "차단기/케이블/열상승 항목이 기준을 충족"
-
         self._set_badge(equipment_status)
-        self.final_line.setText(equipment_final_line)
-        self.final_sub.setText(equipment_final_sub)
+        self.final_line.setText(res["equipment_final_line"])
+        self.final_sub.setText(res["equipment_final_sub"])
 
         In_txt = self._fmt_a(In_A)
         Isc_txt = self._fmt_ka_from_a(Isc_A)
@@ -634,6 +491,8 @@ class ResultWidget(QWidget):
         breaker_lines.append("- 참고: 여유율 3~5% 수준이면 현업 리뷰에서 위험 영역으로 보는 경우가 많습니다.")
         self.lb_breaker.setText("\n".join(breaker_lines))
 
+        self.lb_headroom.setText(self._headroom_text(res, merged))
+
         compare_text = "이전 판정 데이터 없음"
         if isinstance(prev, dict) and prev:
             def _chg(label, old, new):
@@ -651,34 +510,7 @@ class ResultWidget(QWidget):
 
         self.lb_compare.setText(compare_text)
 
-        self._last_results = {
-            "dt": dt,
-            "limit_current": I_load,
-            "I_load": I_load,
-            "design_margin": design_margin,
-            "I_design": I_design,
-            "I_allow_hard": hard_I_allow,
-            "t_clear_input": t_clear_input,
-            "t_trip_est": t_trip_est,
-            "t_clear_used": t_clear_used,
-            "t_clear_policy": t_clear_policy,
-            "Isc_A": Isc_A,
-            "In_A": In_A,
-            "breaker_result": breaker_result,
-            "protection_ratio": protection_ratio,
-            "breaker_margin_grade": breaker_margin,
-            "breaker_margin_pct": breaker_margin_pct,
-            "equipment_status": equipment_status,
-            "equipment_final_line": equipment_final_line,
-            "equipment_final_sub": equipment_final_sub,
-            "cable_hard": cable_hard,
-            "cable_op": cable_op,
-            "thermal": thermal,
-            "standard": standard,
-            "breaker_pickup": breaker_pickup,
-            "breaker_tms": breaker_tms,
-            "demo_seed": 2025,
-        }
+        self._last_results = res
 
         save_payload = {
             "equipment_status": equipment_status,
@@ -0,0 +1,278 @@
+# ui/sweep_widget.py
+import time
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
+    QScrollArea, QComboBox, QFrame, QLineEdit, QGridLayout, QMessageBox
+)
+from PySide6.QtCore import Qt
+
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.colors import ListedColormap, TwoSlopeNorm
+from matplotlib.figure import Figure
+
+import numpy as np
+
+from calculations.sweep import SWEEP_AXES, AXIS_LABELS, SWEEP_LABELS, sweep_grid, linspace_axis
+
+from ui.components.result_card import ResultCard
+from utils.plot_config import set_korean_font
+
+
+# 표시 지표: (라벨, 결과 키)
+SWEEP_METRICS = [
+    ("종합 판정 (PASS/FAIL)", "status"),
+    ("차단기 여유율 (Icu/Isc)", "breaker_margin"),
+    ("케이블 여유율 (Hard 30℃)", "cable_margin"),
+    ("케이블 여유율 (운영온도)", "cable_op_margin"),
+    ("단락열 여유율 (k·S/I√t)", "thermal_margin"),
+]
+
+STATUS_CMAP = ListedColormap(["#16A34A", "#DC2626", "#9CA3AF"])
+SWEEP_DEFAULT_STEPS = 200
+
+
+class SweepWidget(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parent = parent
+        set_korean_font()
+
+        self.setStyleSheet("QLabel { background: transparent; }")
+
+        outer = QVBoxLayout(self)
+        outer.setContentsMargins(20, 20, 20, 20)
+        outer.setSpacing(10)
+
+        # =========================
+        # Navigation
+        # =========================
+        nav = QWidget()
+        nav_l = QHBoxLayout(nav)
+        nav_l.setContentsMargins(0, 0, 0, 0)
+        nav_l.setSpacing(10)
+
+        self.btn_to_result = QPushButton("← 결과로")
+        self.btn_to_result.setMinimumHeight(40)
+        self.btn_to_result.clicked.connect(self.go_result)
+
+        self.btn_run = QPushButton("스윕 실행")
+        self.btn_run.setObjectName("PrimaryButton")
+        self.btn_run.setMinimumHeight(40)
+        self.btn_run.clicked.connect(self.run_sweep)
+
+        nav_l.addWidget(self.btn_to_result)
+        nav_l.addStretch(1)
+        nav_l.addWidget(self.btn_run)
+        outer.addWidget(nav)
+
+        self.scroll = QScrollArea()
+        self.scroll.setWidgetResizable(True)
+        self.scroll.setFrameShape(QFrame.NoFrame)
+        self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        outer.addWidget(self.scroll)
+
+        body = QWidget()
+        self.scroll.setWidget(body)
+        layout = QVBoxLayout(body)
+        layout.setContentsMargins(30, 20, 30, 30)
+        layout.setSpacing(12)
+
+        title = QLabel("설계공간 스윕")
+        title.setObjectName("H1")
+        layout.addWidget(title)
+
+        # =========================
+        # 축 설정
+        # =========================
+        self.axis_card = ResultCard("스윕 축 설정")
+        grid_w = QWidget()
+        grid = QGridLayout(grid_w)
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setHorizontalSpacing(10)
+        grid.setVerticalSpacing(6)
+
+        for c, h in enumerate(["", "파라미터", "최소", "최대", "분할 수"]):
+            lb = QLabel(h)
+            lb.setObjectName("Key")
+            grid.addWidget(lb, 0, c)
+
+        self._axis_rows = []
+        for r, (name, default) in enumerate((("X축", "S"), ("Y축", "breaker")), start=1):
+            combo = QComboBox()
+            for key in SWEEP_AXES:
+                combo.addItem(AXIS_LABELS[key], key)
+            combo.setCurrentIndex(SWEEP_AXES.index(default))
+            lo, hi, steps = QLineEdit(), QLineEdit(), QLineEdit(str(SWEEP_DEFAULT_STEPS))
+            combo.currentIndexChanged.connect(lambda _i, row=r - 1: self._fill_default_range(row))
+
+            grid.addWidget(QLabel(name), r, 0)
+            grid.addWidget(combo, r, 1)
+            grid.addWidget(lo, r, 2)
+            grid.addWidget(hi, r, 3)
+            grid.addWidget(steps, r, 4)
+            self._axis_rows.append((combo, lo, hi, steps))
+
+        self.metric_combo = QComboBox()
+        for label, _key in SWEEP_METRICS:
+            self.metric_combo.addItem(label)
+        self.metric_combo.currentIndexChanged.connect(self._redraw)
+        grid.addWidget(QLabel("표시"), 3, 0)
+        grid.addWidget(self.metric_combo, 3, 1, 1, 4)
+
+        self.axis_card.add_widget(grid_w)
+
+        self.info = QLabel("결과 페이지에서 계산을 먼저 실행한 뒤, 축을 선택하고 스윕을 실행하세요.")
+        self.info.setObjectName("Muted")
+        self.info.setWordWrap(True)
+        self.axis_card.add_widget(self.info)
+        layout.addWidget(self.axis_card)
+
+        # =========================
+        # Heatmap
+        # =========================
+        self.figure = Figure(figsize=(8, 6.5))
+        self.figure.patch.set_facecolor("white")
+        self.canvas = FigureCanvas(self.figure)
+        self.canvas.setMinimumHeight(560)
+        self.canvas.setStyleSheet("background: #FFFFFF; border-radius: 14px;")
+        layout.addWidget(self.canvas)
+        layout.addStretch(1)
+
+        # =========================
+        # State
+        # =========================
+        self.base = None
+        self.result = None
+
+    def go_result(self):
+        if hasattr(self.parent, "result_page"):
+            self.parent.setCurrentWidget(self.parent.result_page)
+
+    def load_data(self, input_data):
+        """
+        input_data: ResultWidget._last_input (InputWidget 값 + cable_data 병합 dict)
+        """
+        self.base = dict(input_data or {})
+        self.result = None
+        for row in range(len(self._axis_rows)):
+            self._fill_default_range(row)
+        self.figure.clear()
+        self.canvas.draw_idle()
+
+    def _fill_default_range(self, row):
+        combo, lo, hi, _steps = self._axis_rows[row]
+        key = combo.currentData()
+        try:
+            v = float((self.base or {}).get(key))
+        except Exception:
+            v = None
+
+        if key == "cable_ambient":
+            a, b = 10.0, 60.0
+        elif key == "cable_parallel":
+            a, b = 1.0, 8.0
+        elif key == "t_clear":
+            a, b = 0.02, 2.0
+        elif v is not None and v > 0:
+            a, b = v * 0.5, v * 2.0
+        else:
+            a, b = 1.0, 100.0
+
+        lo.setText(f"{a:g}")
+        hi.setText(f"{b:g}")
+
+    def _read_axes(self):
+        axes = {}
+        for combo, lo, hi, steps in self._axis_rows:
+            key = combo.currentData()
+            if key in axes:
+                raise ValueError("X축과 Y축은 서로 다른 파라미터여야 합니다.")
+            a, b, n = float(lo.text()), float(hi.text()), int(float(steps.text()))
+            if n < 2 or a == b:
+                raise ValueError("범위(최소≠최대)와 분할 수(2 이상)를 확인하세요.")
+            if key == "cable_parallel":
+                axes[key] = np.unique(np.round(linspace_axis(a, b, n)))
+            else:
+                axes[key] = linspace_axis(a, b, n)
+        return axes
+
+    def run_sweep(self):
+        if not self.base:
+            QMessageBox.information(self, "안내", "먼저 계산을 실행해 주세요.")
+            return
+        try:
+            axes = self._read_axes()
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+            return
+
+        # 격자 축 순서: (Y, X) → imshow 행/열과 일치
+        names = list(axes.keys())
+        ordered = {names[1]: axes[names[1]], names[0]: axes[names[0]]}
+
+        t0 = time.perf_counter()
+        self.result = sweep_grid(self.base, ordered)
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+
+        counts = np.bincount(self.result["status"].ravel(), minlength=len(SWEEP_LABELS))
+        total = int(counts.sum())
+        summary = " / ".join(
+            f"{lab} {int(c):,} ({c / total * 100.0:.1f}%)" for lab, c in zip(SWEEP_LABELS, counts)
+        )
+        self.info.setText(
+            f"격자 {self.result['shape'][1]}×{self.result['shape'][0]} = {total:,}점, "
+            f"계산 {elapsed_ms:,.0f} ms\n{summary}"
+        )
+        self._redraw()
+
+    def _redraw(self, *_):
+        if self.result is None:
+            return
+        res = self.result
+        y_key, x_key = res["names"]
+        x, y = res["axes"][x_key], res["axes"][y_key]
+        label, key = SWEEP_METRICS[self.metric_combo.currentIndex()]
+
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        extent = (x[0], x[-1], y[0], y[-1])
+
+        if key == "status":
+            im = ax.imshow(
+                res["status"], origin="lower", aspect="auto", extent=extent,
+                cmap=STATUS_CMAP, vmin=-0.5, vmax=2.5, interpolation="nearest",
+            )
+            cb = self.figure.colorbar(im, ax=ax, ticks=[0, 1, 2])
+            cb.ax.set_yticklabels(SWEEP_LABELS)
+        else:
+            z = np.asarray(res[key], dtype=float) * 100.0
+            finite = z[np.isfinite(z)]
+            if finite.size:
+                lim = max(float(np.nanpercentile(np.abs(finite), 98)), 1.0)
+                norm = TwoSlopeNorm(vmin=-lim, vcenter=0.0, vmax=lim)
+            else:
+                norm = None
+            im = ax.imshow(
+                np.ma.masked_invalid(z), origin="lower", aspect="auto", extent=extent,
+                cmap="RdYlGn", norm=norm, interpolation="nearest",
+            )
+            self.figure.colorbar(im, ax=ax, label="여유율 (%)")
+
+        # PASS/FAIL 경계(종합 판정 기준)
+        pass_mask = res["pass_mask"].astype(float)
+        if x.size > 1 and y.size > 1 and 0.0 < pass_mask.mean() < 1.0:
+            ax.contour(x, y, pass_mask, levels=[0.5], colors="black", linewidths=1.6)
+
+        # 현재 설계점
+        try:
+            px, py = float(self.base.get(x_key)), float(self.base.get(y_key))
+            ax.plot([px], [py], marker="o", color="white", markeredgecolor="black", markersize=8)
+        except Exception:
+            pass
+
+        ax.set_xlabel(AXIS_LABELS[x_key])
+        ax.set_ylabel(AXIS_LABELS[y_key])
+        ax.set_title(f"{label} — 실선: PASS/FAIL 경계")
+        self.figure.tight_layout()
+        self.canvas.draw_idle()